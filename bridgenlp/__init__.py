@@ -6,30 +6,62 @@ This package provides a clean interface for integrating advanced NLP and multimo
 text and multimodal (image, audio) inputs.
 """
 
+import importlib
+
 __version__ = "0.4.0"
 
 # Import commonly used classes for easier access
 from .base import BridgeBase
 from .result import BridgeResult
-from .aligner import TokenAligner
 from .config import BridgeConfig
-from .pipeline import Pipeline
-from .pipeline_async import AsyncPipeline
-from .multimodal_base import MultimodalBridgeBase
-
-# Import multimodal adapters
-# These imports are optional and will fail gracefully if dependencies are missing
-try:
-    from .adapters.image_captioning import ImageCaptioningBridge
-except ImportError:
-    pass
-
-try:
-    from .adapters.object_detection import ObjectDetectionBridge
-except ImportError:
-    pass
-
-try:
-    from .adapters.multimodal_embeddings import MultimodalEmbeddingsBridge
-except ImportError:
-    pass
+
+# Heavier components are imported on first access (PEP 562) so that
+# `from bridgenlp import BridgeConfig` does not pull in every adapter
+# and its model dependencies
+_LAZY_ATTRS = {
+    "TokenAligner": ".aligner",
+    "Pipeline": ".pipeline",
+    "AsyncPipeline": ".pipeline_async",
+    "MultimodalBridgeBase": ".multimodal_base",
+}
+
+# Multimodal adapters are optional and are missing if their dependencies are
+_OPTIONAL_ATTRS = {
+    "ImageCaptioningBridge": ".adapters.image_captioning",
+    "ObjectDetectionBridge": ".adapters.object_detection",
+    "MultimodalEmbeddingsBridge": ".adapters.multimodal_embeddings",
+    "MultiTaskImageBridge": ".adapters.multitask_image",
+}
+
+_SUBMODULES = ("adapters", "pipes")
+
+__all__ = [
+    "adapters",
+    "pipes",
+    "BridgeBase",
+    "BridgeResult",
+    "BridgeConfig",
+    *_LAZY_ATTRS,
+    *_OPTIONAL_ATTRS,
+]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    elif name in _OPTIONAL_ATTRS:
+        try:
+            module = importlib.import_module(_OPTIONAL_ATTRS[name], __name__)
+        except ImportError as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({e})") from e
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
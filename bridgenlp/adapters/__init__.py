@@ -2,60 +2,43 @@
 Model-specific adapters for BridgeNLP.
 
 This module provides adapters for various NLP models, allowing them to be
-used with the BridgeNLP framework. Each adapter is imported conditionally
-to avoid hard dependencies.
+used with the BridgeNLP framework. Each adapter is imported on first
+access to avoid hard dependencies and to keep `import bridgenlp.adapters`
+from loading every model framework up front.
 """
 
-# Import adapters conditionally to avoid hard dependencies
-try:
-    from .allen_coref import AllenNLPCorefBridge
-except ImportError:
-    pass
-
-try:
-    from .hf_srl import HuggingFaceSRLBridge
-except ImportError:
-    pass
-
-try:
-    from .spacy_ner import SpacyNERBridge
-except ImportError:
-    pass
-
-# New adapters
-try:
-    from .hf_sentiment import HuggingFaceSentimentBridge
-except ImportError:
-    pass
-
-try:
-    from .hf_classification import HuggingFaceClassificationBridge
-except ImportError:
-    pass
-
-try:
-    from .hf_qa import HuggingFaceQABridge
-except ImportError:
-    pass
-
-# Text generation adapters
-try:
-    from .hf_summarization import HuggingFaceSummarizationBridge
-except ImportError:
-    pass
-
-try:
-    from .hf_paraphrase import HuggingFaceParaphraseBridge
-except ImportError:
-    pass
-
-try:
-    from .hf_translation import HuggingFaceTranslationBridge
-except ImportError:
-    pass
-
-# Other frameworks
-try:
-    from .nltk_adapter import NLTKBridge
-except ImportError:
-    pass
+import importlib
+
+# Adapter class name -> submodule that defines it
+_ADAPTERS = {
+    "AllenNLPCorefBridge": ".allen_coref",
+    "HuggingFaceSRLBridge": ".hf_srl",
+    "SpacyNERBridge": ".spacy_ner",
+    # New adapters
+    "HuggingFaceSentimentBridge": ".hf_sentiment",
+    "HuggingFaceClassificationBridge": ".hf_classification",
+    "HuggingFaceQABridge": ".hf_qa",
+    # Text generation adapters
+    "HuggingFaceSummarizationBridge": ".hf_summarization",
+    "HuggingFaceParaphraseBridge": ".hf_paraphrase",
+    "HuggingFaceTranslationBridge": ".hf_translation",
+    # Other frameworks
+    "NLTKBridge": ".nltk_adapter",
+}
+
+
+def __getattr__(name):
+    if name not in _ADAPTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(_ADAPTERS[name], __name__)
+    except ImportError as e:
+        # Adapters whose dependencies are missing are simply unavailable
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({e})") from e
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ADAPTERS))
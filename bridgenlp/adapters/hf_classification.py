@@ -4,7 +4,7 @@ Hugging Face text classification adapter for BridgeNLP.
 
 import functools
 import warnings
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import spacy
 from spacy.tokens import Doc
@@ -23,15 +23,16 @@ class HuggingFaceClassificationBridge(BridgeBase):
     """
     
     def __init__(self, model_name: str = "facebook/bart-large-mnli", 
-                 device: int = -1, labels: Optional[List[str]] = None):
+                 device: int = -1, labels: Optional[Sequence[str]] = None):
         """
         Initialize the text classification bridge.
         
         Args:
             model_name: Name or path of the Hugging Face model to use
             device: Device to run the model on (-1 for CPU, 0+ for GPU)
-            labels: Optional list of labels for zero-shot classification
-                   (default: ["positive", "negative", "neutral"])
+            labels: Optional sequence of labels for zero-shot classification
+                   (default: ("positive", "negative", "neutral")). The labels
+                   are stored as a tuple and reused for every call.
         
         Raises:
             ImportError: If Hugging Face dependencies are not installed
@@ -48,7 +49,7 @@ class HuggingFaceClassificationBridge(BridgeBase):
         
         self.model_name = model_name
         self.device = device
-        self.labels = labels or ["positive", "negative", "neutral"]
+        self.labels = tuple(labels or ("positive", "negative", "neutral"))
         self.aligner = TokenAligner()
         self._pipeline = None
     
@@ -89,12 +90,49 @@ class HuggingFaceClassificationBridge(BridgeBase):
         # Run the model
         results = self.pipeline(text, self.labels, multi_label=True)
         
+        return self._build_result(text, results)
+    
+    def from_batch(self, texts: List[str]) -> List[BridgeResult]:
+        """
+        Process a batch of texts with a single model call.
+        
+        Args:
+            texts: List of texts to process
+            
+        Returns:
+            List of BridgeResult objects, one per input text
+        """
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        results = [BridgeResult(tokens=[]) for _ in texts]
+        if not indices:
+            return results
+        
+        outputs = self.pipeline([texts[i] for i in indices], self.labels, multi_label=True)
+        # The pipeline unwraps single-item batches
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        
+        for i, output in zip(indices, outputs):
+            results[i] = self._build_result(texts[i], output)
+        return results
+    
+    def _build_result(self, text: str, output: Dict) -> BridgeResult:
+        """
+        Convert one zero-shot pipeline output into a BridgeResult.
+        
+        Args:
+            text: Text that was classified
+            output: Pipeline output with "labels" and "scores"
+            
+        Returns:
+            BridgeResult with one CLASS role per label
+        """
         # Extract tokens (we'll use a simple whitespace tokenizer for now)
         tokens = text.split()
         
         # Process the classification results
         roles = []
-        for label, score in zip(results["labels"], results["scores"]):
+        for label, score in zip(output["labels"], output["scores"]):
             role = {
                 "role": "CLASS",
                 "label": label,
@@ -5,7 +5,9 @@ This adapter integrates transformer-based embedding models from Hugging Face
 with token-based pipelines like spaCy.
 """
 
+import collections
 import functools
+import threading
 from typing import Dict, List, Optional, Union
 
 import numpy as np
@@ -15,6 +17,7 @@ from spacy.tokens import Doc
 from ..base import BridgeBase
 from ..config import BridgeConfig
 from ..result import BridgeResult
+from ..utils import hash_text
 
 
 class HuggingFaceEmbeddingsBridge(BridgeBase):
@@ -46,14 +49,23 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
         self.device = config.device if config else device
         self.max_length = config.max_length if config and config.max_length else 512
         self.cache_size = config.cache_size if config and config.cache_size else 1
+        # from_batch always batches, so a batch_size of 1 means "use the default"
+        self.batch_size = config.batch_size if config and config.batch_size > 1 else 32
         
         # Additional parameters from config
         if config and config.params:
             self.pooling = config.params.get("pooling", "mean")
             self.normalize = config.params.get("normalize", True)
+            self.embedding_cache_size = config.params.get("embedding_cache_size", 10000)
         else:
             self.pooling = "mean"
             self.normalize = True
+            self.embedding_cache_size = 10000
+        
+        # LRU cache of embeddings keyed by text hash; identical texts always
+        # embed to the same vector, so the model call can be skipped entirely
+        self._embedding_cache = collections.OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
         
         # Initialize model lazily
         self._model = None
@@ -103,15 +115,15 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
         
         return self._model
     
-    def _get_embeddings(self, text: str) -> np.ndarray:
+    def _get_embeddings(self, text: Union[str, List[str]]) -> np.ndarray:
         """
-        Get embeddings for a text.
+        Get embeddings for a text or a batch of texts.
         
         Args:
-            text: Text to embed
+            text: Text to embed, or a list of texts to embed in one forward pass
             
         Returns:
-            Numpy array of embeddings
+            Numpy array of embeddings, one row per text
         """
         import torch
         
@@ -143,8 +155,8 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
         elif isinstance(self.device, int) and self.device >= 0 and torch.cuda.is_available():
             inputs = {k: v.cuda(self.device) for k, v in inputs.items()}
         
-        # Get embeddings
-        with torch.no_grad():
+        # Get embeddings; inference mode also skips version counter tracking
+        with torch.inference_mode():
             outputs = model(**inputs)
         
         # Get embeddings from the model output
@@ -178,6 +190,45 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
         # Convert to numpy
         return pooled.cpu().numpy()
     
+    def _embed(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Get embeddings for texts, running the model only on cache misses.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding vector per text, in input order
+        """
+        if self.embedding_cache_size <= 0:
+            return list(self._get_embeddings(texts))
+        
+        keys = [hash_text(text) for text in texts]
+        embeddings = [None] * len(texts)
+        missing = {}
+        with self._embedding_cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+                    embeddings[i] = cached
+                else:
+                    # Duplicates within the batch are embedded once
+                    missing.setdefault(key, []).append(i)
+        
+        if missing:
+            indices = [positions[0] for positions in missing.values()]
+            computed = self._get_embeddings([texts[i] for i in indices])
+            with self._embedding_cache_lock:
+                for (key, positions), embedding in zip(missing.items(), computed):
+                    for i in positions:
+                        embeddings[i] = embedding
+                    self._embedding_cache[key] = embedding
+                while len(self._embedding_cache) > self.embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+        
+        return embeddings
+    
     def from_text(self, text: str) -> BridgeResult:
         """
         Process raw text and return embedding results.
@@ -190,7 +241,7 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
         """
         with self._measure_performance():
             # Get embeddings
-            embeddings = self._get_embeddings(text)
+            embeddings = self._embed([text])
             
             # Create tokens (simple whitespace tokenization for now)
             tokens = text.split()
@@ -207,6 +258,32 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
                 roles=roles
             )
     
+    def from_batch(self, texts: List[str]) -> List[BridgeResult]:
+        """
+        Process a batch of texts, embedding up to ``batch_size`` texts per forward pass.
+        
+        Args:
+            texts: List of texts to process
+            
+        Returns:
+            List of BridgeResult objects containing embeddings
+        """
+        with self._measure_performance():
+            results = []
+            for i in range(0, len(texts), self.batch_size):
+                batch = texts[i:i + self.batch_size]
+                embeddings = self._embed(batch)
+                
+                for text, embedding in zip(batch, embeddings):
+                    tokens = text.split()
+                    self._metrics["total_tokens"] += len(tokens)
+                    results.append(BridgeResult(
+                        tokens=tokens,
+                        roles=[{"embedding": embedding.tolist()}]
+                    ))
+            
+            return results
+    
     def from_tokens(self, tokens: List[str]) -> BridgeResult:
         """
         Process pre-tokenized text and return embedding results.
@@ -222,7 +299,7 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
             text = " ".join(tokens)
             
             # Get embeddings
-            embeddings = self._get_embeddings(text)
+            embeddings = self._embed([text])
             
             # Update token count for metrics
             self._metrics["total_tokens"] += len(tokens)
@@ -269,4 +346,6 @@ class HuggingFaceEmbeddingsBridge(BridgeBase):
             import gc
             self._model = None
             self._tokenizer = None
+            with self._embedding_cache_lock:
+                self._embedding_cache.clear()
             gc.collect()
@@ -2,6 +2,7 @@
 Hugging Face text paraphrasing adapter for BridgeNLP.
 """
 
+import collections
 import threading
 import time
 from typing import Dict, List, Optional, Tuple, Union, Any, Set
@@ -20,12 +21,20 @@ from ..config import BridgeConfig
 from ..result import BridgeResult
 from ..utils import (
     configure_device,
+    configure_threads,
     get_param_with_fallback,
     get_or_create_model,
     unload_model,
     validate_text_input,
     get_model_memory_usage,
-    create_model_key
+    create_model_key,
+    configure_precision,
+    configure_attention,
+    load_pretrained,
+    inference_context,
+    hash_text,
+    pretrained_load_kwargs,
+    sorted_batches
 )
 
 
@@ -130,9 +139,28 @@ class HuggingFaceParaphraseBridge(BridgeBase):
         self.device = configure_device(
             get_param_with_fallback(None, config, "device", default_value=-1)
         )
+        configure_threads(get_param_with_fallback(None, config, "torch_threads"))
+        
+        # Reduced precision on GPU is opt-in: seq2seq models such as T5 and
+        # Pegasus can overflow in fp16, so bf16 is not swapped for fp16 either
+        self.dtype = get_param_with_fallback(None, config, "dtype", default_value="fp32")
+        self.torch_dtype = configure_precision(
+            self.dtype, self.device,
+            allow_tf32=get_param_with_fallback(None, config, "allow_tf32", default_value=False),
+            fp16_fallback=False
+        )
+        
+        # Attention kernels to load the model with (None keeps the model default)
+        self.attn_implementation = configure_attention(
+            get_param_with_fallback(None, config, "attn_implementation"), self.device
+        )
         
         # Create a unique key for this model in the registry
         self.model_key = create_model_key(self.model_name, "paraphrase", self.device)
+        if self.torch_dtype is not None:
+            self.model_key += f"_{self.dtype}"
+        if self.attn_implementation is not None:
+            self.model_key += f"_{self.attn_implementation}"
         
         # Initialize model and tokenizer if not using lazy loading
         self.tokenizer = None
@@ -152,23 +180,40 @@ class HuggingFaceParaphraseBridge(BridgeBase):
             "batch_calls": 0,
             "model_load_time": 0.0,
             "total_variants": 0,
+            "encoder_cache_hits": 0,
         })
+        
+        # Encoder outputs of recently paraphrased texts, so paraphrasing the
+        # same text again only runs the decoder. Enabled by cache_results and
+        # sized by cache_size
+        if config and config.cache_results:
+            self.encoder_cache_size = config.cache_size
+        else:
+            self.encoder_cache_size = 0
+        self._encoder_outputs = collections.OrderedDict()
     
     def _init_model(self):
         """Initialize the model and tokenizer."""
         if self.tokenizer is not None and self.model is not None:
             return
             
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # Use global model registry to share models between adapters
             def create_models():
                 tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-                model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
                 
-                # Move model to the appropriate device
-                if self.device >= 0 and torch.cuda.is_available():
+                # Read the weights straight onto the target device when accelerate is available
+                load_kwargs = pretrained_load_kwargs(self.device)
+                model = load_pretrained(
+                    AutoModelForSeq2SeqLM, self.model_name, self.attn_implementation,
+                    torch_dtype=self.torch_dtype, **load_kwargs
+                )
+                
+                # Move model to the appropriate device, unless it was loaded there
+                if (self.device >= 0 and torch.cuda.is_available()
+                        and "device_map" not in load_kwargs):
                     model = model.to(f"cuda:{self.device}")
                 
                 return {"tokenizer": tokenizer, "model": model}
@@ -190,7 +235,7 @@ class HuggingFaceParaphraseBridge(BridgeBase):
         finally:
             # Record model loading time
             with self._metrics_lock:
-                self._metrics["model_load_time"] += time.time() - start_time
+                self._metrics["model_load_time"] += (time.perf_counter_ns() - start_time) * 1e-9
     
     def _tokenize_text(self, text: str) -> List[str]:
         """
@@ -252,31 +297,12 @@ class HuggingFaceParaphraseBridge(BridgeBase):
                     if self.device >= 0 and torch.cuda.is_available():
                         encoding = {k: v.to(f"cuda:{self.device}") for k, v in encoding.items()}
                     
-                    # Create generation parameters
-                    generation_params = {
-                        "input_ids": encoding["input_ids"],
-                        "attention_mask": encoding["attention_mask"],
-                        "max_length": self.max_length,
-                        "num_beams": self.num_beams,
-                        "num_return_sequences": self.num_return_sequences,
-                        "early_stopping": True
-                    }
-                    
-                    # Only include sampling parameters if sampling is enabled
-                    if self.do_sample:
-                        generation_params.update({
-                            "do_sample": True,
-                            "temperature": self.temperature,
-                        })
-                        
-                        # Add top_p and top_k if they're set
-                        if self.top_p < 1.0:
-                            generation_params["top_p"] = self.top_p
-                        if self.top_k > 0:
-                            generation_params["top_k"] = self.top_k
-                    
                     # Generate paraphrases
-                    with torch.no_grad():
+                    generation_params = self._generation_params(encoding)
+                    with inference_context(self.torch_dtype):
+                        encoder_outputs = self._get_encoder_outputs(text, encoding)
+                        if encoder_outputs is not None:
+                            generation_params["encoder_outputs"] = encoder_outputs
                         outputs = self.model.generate(**generation_params)
                     
                     # Decode outputs
@@ -318,10 +344,85 @@ class HuggingFaceParaphraseBridge(BridgeBase):
                 roles=roles
             )
     
+    def _get_encoder_outputs(self, text: str, encoding: Dict[str, Any]) -> Optional[Any]:
+        """
+        Look up or compute the encoder outputs for a text.
+        
+        Must be called with the model lock held, inside inference_context.
+        
+        Args:
+            text: Validated input text
+            encoding: Tokenizer output for the text, on the model device
+            
+        Returns:
+            Encoder outputs to pass to ``generate``, or None when the cache
+            is disabled
+        """
+        if self.encoder_cache_size <= 0:
+            return None
+        
+        key = hash_text(text)
+        encoder_outputs = self._encoder_outputs.get(key)
+        if encoder_outputs is not None:
+            self._encoder_outputs.move_to_end(key)
+            with self._metrics_lock:
+                self._metrics["encoder_cache_hits"] += 1
+        else:
+            encoder_outputs = self.model.get_encoder()(
+                input_ids=encoding["input_ids"],
+                attention_mask=encoding["attention_mask"],
+                return_dict=True
+            )
+            self._encoder_outputs[key] = encoder_outputs
+            while len(self._encoder_outputs) > self.encoder_cache_size:
+                self._encoder_outputs.popitem(last=False)
+        
+        # generate expands the outputs for beam search in place, so it gets a copy
+        return type(encoder_outputs)(**encoder_outputs)
+    
+    def _generation_params(self, encoding: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the ``generate`` arguments for tokenized inputs.
+        
+        Args:
+            encoding: Tokenizer output with input_ids and attention_mask
+            
+        Returns:
+            Keyword arguments for ``model.generate``
+        """
+        generation_params = {
+            "input_ids": encoding["input_ids"],
+            "attention_mask": encoding["attention_mask"],
+            "max_length": self.max_length,
+            "num_beams": self.num_beams,
+            "num_return_sequences": self.num_return_sequences,
+            "early_stopping": True,
+            "use_cache": True
+        }
+        
+        # Only include sampling parameters if sampling is enabled
+        if self.do_sample:
+            generation_params.update({
+                "do_sample": True,
+                "temperature": self.temperature,
+            })
+            
+            # Add top_p and top_k if they're set
+            if self.top_p < 1.0:
+                generation_params["top_p"] = self.top_p
+            if self.top_k > 0:
+                generation_params["top_k"] = self.top_k
+        
+        return generation_params
+    
     def from_batch(self, texts: List[str]) -> List[BridgeResult]:
         """
         Process a batch of texts for efficient parallel processing.
         
+        Texts are paraphrased ``batch_size`` at a time, each chunk padded into
+        a single generate call, with texts of similar token length grouped
+        together.
+        
         Args:
             texts: List of texts to process
             
@@ -350,61 +451,35 @@ class HuggingFaceParaphraseBridge(BridgeBase):
             if self.tokenizer is None or self.model is None:
                 self._init_model()
                 
-            # Process in batches
-            all_paraphrases = []
+            # Tokenize every text once and generate for chunks of similar
+            # length, so little of each padded batch is padding
+            indices = [i for i, text in enumerate(valid_texts) if text]
+            all_paraphrases = [[] for _ in valid_texts]
             
             with self._model_lock:
                 try:
-                    for i in range(0, len(valid_texts), self.batch_size):
-                        batch = valid_texts[i:i+self.batch_size]
+                    input_ids = self.tokenizer(
+                        [valid_texts[i] for i in indices], truncation=self.truncation
+                    )["input_ids"]
+                    
+                    for chunk in sorted_batches([len(ids) for ids in input_ids], self.batch_size):
+                        encoding = self.tokenizer.pad(
+                            {"input_ids": [input_ids[j] for j in chunk]}, return_tensors="pt"
+                        )
+                        
+                        # Move inputs to the appropriate device
+                        if self.device >= 0 and torch.cuda.is_available():
+                            encoding = {k: v.to(f"cuda:{self.device}") for k, v in encoding.items()}
                         
-                        # Handle each text in the batch separately
-                        # (we need separate results for each text)
-                        batch_results = []
-                        for text in batch:
-                            if not text:
-                                batch_results.append([])
-                                continue
-                            
-                            # Tokenize input
-                            encoding = self.tokenizer(text, padding="longest", truncation=self.truncation, return_tensors="pt")
-                            
-                            # Move inputs to the appropriate device
-                            if self.device >= 0 and torch.cuda.is_available():
-                                encoding = {k: v.to(f"cuda:{self.device}") for k, v in encoding.items()}
-                            
-                            # Create generation parameters
-                            generation_params = {
-                                "input_ids": encoding["input_ids"],
-                                "attention_mask": encoding["attention_mask"],
-                                "max_length": self.max_length,
-                                "num_beams": self.num_beams,
-                                "num_return_sequences": self.num_return_sequences,
-                                "early_stopping": True
-                            }
-                            
-                            # Only include sampling parameters if sampling is enabled
-                            if self.do_sample:
-                                generation_params.update({
-                                    "do_sample": True,
-                                    "temperature": self.temperature,
-                                })
-                                
-                                # Add top_p and top_k if they're set
-                                if self.top_p < 1.0:
-                                    generation_params["top_p"] = self.top_p
-                                if self.top_k > 0:
-                                    generation_params["top_k"] = self.top_k
-                            
-                            # Generate paraphrases
-                            with torch.no_grad():
-                                outputs = self.model.generate(**generation_params)
-                            
-                            # Decode outputs
-                            text_paraphrases = [self.tokenizer.decode(out, skip_special_tokens=True) for out in outputs]
-                            batch_results.append(text_paraphrases)
-                            
-                        all_paraphrases.extend(batch_results)
+                        # One generate call for the whole chunk
+                        with inference_context(self.torch_dtype):
+                            outputs = self.model.generate(**self._generation_params(encoding))
+                        decoded = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+                        
+                        # generate returns num_return_sequences consecutive rows per input
+                        per_text = len(decoded) // len(chunk)
+                        for k, j in enumerate(chunk):
+                            all_paraphrases[indices[j]] = decoded[k * per_text:(k + 1) * per_text]
                         
                 except Exception as e:
                     # Handle batch processing errors
@@ -534,6 +609,10 @@ class HuggingFaceParaphraseBridge(BridgeBase):
                 unload_model(self.model_key)
                 self.model = None
                 self.tokenizer = None
+        
+        # Cached encoder outputs can hold GPU memory
+        with self._model_lock:
+            self._encoder_outputs.clear()
     
     def __repr__(self) -> str:
         """
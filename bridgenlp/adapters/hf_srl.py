@@ -12,6 +12,7 @@ from spacy.tokens import Doc
 from ..aligner import TokenAligner
 from ..base import BridgeBase
 from ..result import BridgeResult
+from ..utils import pretrained_load_kwargs
 
 
 class HuggingFaceSRLBridge(BridgeBase):
@@ -23,13 +24,14 @@ class HuggingFaceSRLBridge(BridgeBase):
     """
     
     def __init__(self, model_name: str = "Davlan/bert-base-multilingual-cased-srl-nli", 
-                 device: int = -1):
+                 device: int = -1, batch_size: int = 32):
         """
         Initialize the semantic role labeling bridge.
         
         Args:
             model_name: Name or path of the Hugging Face model to use
             device: Device to run the model on (-1 for CPU, 0+ for GPU)
+            batch_size: Number of texts per forward pass in from_batch
         
         Raises:
             ImportError: If Hugging Face dependencies are not installed
@@ -46,6 +48,7 @@ class HuggingFaceSRLBridge(BridgeBase):
         
         self.model_name = model_name
         self.device = device
+        self.batch_size = batch_size
         self.aligner = TokenAligner()
         self._pipeline = None
     
@@ -67,7 +70,8 @@ class HuggingFaceSRLBridge(BridgeBase):
                 "token-classification", 
                 model=self.model_name,
                 device=device,
-                aggregation_strategy="simple"
+                aggregation_strategy="simple",
+                model_kwargs=pretrained_load_kwargs()
             )
         return self._pipeline
     
@@ -86,7 +90,39 @@ class HuggingFaceSRLBridge(BridgeBase):
         
         # Run the model
         results = self.pipeline(text)
+        return self._build_result(text, results)
+    
+    def from_batch(self, texts: List[str]) -> List[BridgeResult]:
+        """
+        Process a batch of texts, running the model on ``batch_size`` texts at a time.
+        
+        Args:
+            texts: List of texts to process
+            
+        Returns:
+            List of BridgeResult objects, one per input text
+        """
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        results = [BridgeResult(tokens=[]) for _ in texts]
+        if not indices:
+            return results
+        
+        outputs = self.pipeline([texts[i] for i in indices], batch_size=self.batch_size)
+        for i, entities in zip(indices, outputs):
+            results[i] = self._build_result(texts[i], entities)
+        return results
+    
+    def _build_result(self, text: str, results: List[Dict]) -> BridgeResult:
+        """
+        Convert the pipeline output for one text into a BridgeResult.
         
+        Args:
+            text: Text that was labeled
+            results: Entity groups predicted for the text
+            
+        Returns:
+            BridgeResult containing semantic roles
+        """
         # Extract tokens (we'll use a simple whitespace tokenizer for now)
         tokens = text.split()
         
@@ -135,7 +171,32 @@ class HuggingFaceSRLBridge(BridgeBase):
         
         # Process with the model
         result = self.from_text(text)
+        return self._attach_roles(doc, result)
+    
+    def from_spacy_batch(self, docs: List[Doc]) -> List[Doc]:
+        """
+        Process a batch of spaCy Docs, running the model on ``batch_size`` texts at a time.
+        
+        Args:
+            docs: List of spaCy Docs to process
+            
+        Returns:
+            The same Docs with semantic roles attached
+        """
+        results = self.from_batch([doc.text for doc in docs])
+        return [self._attach_roles(doc, result) for doc, result in zip(docs, results)]
+    
+    def _attach_roles(self, doc: Doc, result: BridgeResult) -> Doc:
+        """
+        Align the roles of a result to the tokens of a Doc and attach them.
         
+        Args:
+            doc: spaCy Doc the result was computed for
+            result: Result of from_text or from_batch for the Doc's text
+            
+        Returns:
+            The same Doc with semantic roles attached
+        """
         # Align roles to spaCy token boundaries
         aligned_roles = []
         for role in result.roles:
@@ -20,12 +20,19 @@ from ..config import BridgeConfig
 from ..result import BridgeResult
 from ..utils import (
     configure_device,
+    configure_threads,
     get_param_with_fallback,
     get_or_create_model,
     unload_model,
     validate_text_input,
     get_model_memory_usage,
-    create_model_key
+    create_model_key,
+    configure_precision,
+    configure_attention,
+    load_pretrained,
+    inference_context,
+    pretrained_load_kwargs,
+    sorted_batches
 )
 
 
@@ -105,9 +112,28 @@ class HuggingFaceSummarizationBridge(BridgeBase):
         self.device = configure_device(
             get_param_with_fallback(None, config, "device", default_value=-1)
         )
+        configure_threads(get_param_with_fallback(None, config, "torch_threads"))
+        
+        # Reduced precision on GPU is opt-in: seq2seq models such as T5 and
+        # Pegasus can overflow in fp16, so bf16 is not swapped for fp16 either
+        self.dtype = get_param_with_fallback(None, config, "dtype", default_value="fp32")
+        self.torch_dtype = configure_precision(
+            self.dtype, self.device,
+            allow_tf32=get_param_with_fallback(None, config, "allow_tf32", default_value=False),
+            fp16_fallback=False
+        )
+        
+        # Attention kernels to load the model with (None keeps the model default)
+        self.attn_implementation = configure_attention(
+            get_param_with_fallback(None, config, "attn_implementation"), self.device
+        )
         
         # Create a unique key for this model in the registry
         self.model_key = create_model_key(self.model_name, "summarization", self.device)
+        if self.torch_dtype is not None:
+            self.model_key += f"_{self.dtype}"
+        if self.attn_implementation is not None:
+            self.model_key += f"_{self.attn_implementation}"
         
         # Initialize model and tokenizer if not using lazy loading
         self.summarizer = None
@@ -132,14 +158,19 @@ class HuggingFaceSummarizationBridge(BridgeBase):
         if self.summarizer is not None:
             return
             
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # Use global model registry to share models between adapters
             def create_summarizer():
+                # The pipeline moves the model to its device, so load on CPU here
+                model = load_pretrained(
+                    AutoModelForSeq2SeqLM, self.model_name, self.attn_implementation,
+                    torch_dtype=self.torch_dtype, **pretrained_load_kwargs()
+                )
                 return pipeline(
                     "summarization", 
-                    model=self.model_name, 
+                    model=model, 
                     tokenizer=self.model_name,
                     device=self.device,
                     framework="pt"  # Use PyTorch
@@ -160,7 +191,7 @@ class HuggingFaceSummarizationBridge(BridgeBase):
         finally:
             # Record model loading time
             with self._metrics_lock:
-                self._metrics["model_load_time"] += time.time() - start_time
+                self._metrics["model_load_time"] += (time.perf_counter_ns() - start_time) * 1e-9
     
     def from_text(self, text: str) -> BridgeResult:
         """
@@ -192,13 +223,14 @@ class HuggingFaceSummarizationBridge(BridgeBase):
             # Generate summary with the model
             with self._model_lock:
                 try:
-                    summary = self.summarizer(
-                        text,
-                        max_length=self.max_length,
-                        min_length=self.min_length,
-                        do_sample=self.do_sample,
-                        truncation=self.truncation
-                    )
+                    with inference_context(self.torch_dtype):
+                        summary = self.summarizer(
+                            text,
+                            max_length=self.max_length,
+                            min_length=self.min_length,
+                            do_sample=self.do_sample,
+                            truncation=self.truncation
+                        )
                 except Exception as e:
                     # Handle inference errors gracefully
                     raise RuntimeError(f"Summarization failed: {str(e)}")
@@ -266,6 +298,9 @@ class HuggingFaceSummarizationBridge(BridgeBase):
         """
         Process a batch of texts for efficient processing.
         
+        Texts are summarized ``batch_size`` at a time, each chunk padded into
+        a single generate call, with texts of similar length grouped together.
+        
         Args:
             texts: List of texts to process
             
@@ -294,43 +329,37 @@ class HuggingFaceSummarizationBridge(BridgeBase):
             if self.summarizer is None:
                 self._init_model()
                 
-            # Process texts in batches
-            all_summaries = []
+            # Summarize texts of similar token length together, so little of
+            # each padded batch is padding
+            indices = [i for i, text in enumerate(valid_texts) if text]
+            all_summaries = [{"summary_text": ""} for _ in valid_texts]
             
             with self._model_lock:
                 try:
-                    # Use batched processing if available in the pipeline
-                    if hasattr(self.summarizer, "model") and self.batch_size > 1:
-                        # Process in chunks of batch_size
-                        for i in range(0, len(valid_texts), self.batch_size):
-                            batch = valid_texts[i:i+self.batch_size]
-                            batch_summaries = self.summarizer(
-                                batch,
-                                max_length=self.max_length,
-                                min_length=self.min_length,
-                                do_sample=self.do_sample,
-                                truncation=self.truncation
-                            )
-                            all_summaries.extend(batch_summaries)
+                    # The pipeline tokenizes again, so only measure lengths when
+                    # the texts span several batches
+                    if len(indices) > self.batch_size:
+                        lengths = [len(ids) for ids in self.summarizer.tokenizer(
+                            [valid_texts[i] for i in indices], truncation=self.truncation
+                        )["input_ids"]]
                     else:
-                        # Fall back to individual processing
-                        for text in valid_texts:
-                            if not text:
-                                all_summaries.append({"summary_text": ""})
-                                continue
-                                
-                            summary = self.summarizer(
-                                text,
+                        lengths = [0] * len(indices)
+                    
+                    for chunk in sorted_batches(lengths, self.batch_size):
+                        chunk = [indices[j] for j in chunk]
+                        
+                        # batch_size makes the pipeline pad the chunk into one generate call
+                        with inference_context(self.torch_dtype):
+                            summaries = self.summarizer(
+                                [valid_texts[i] for i in chunk],
                                 max_length=self.max_length,
                                 min_length=self.min_length,
                                 do_sample=self.do_sample,
-                                truncation=self.truncation
+                                truncation=self.truncation,
+                                batch_size=len(chunk)
                             )
-                            
-                            if isinstance(summary, list) and len(summary) > 0:
-                                all_summaries.append(summary[0])
-                            else:
-                                all_summaries.append({"summary_text": ""})
+                        for i, summary in zip(chunk, summaries):
+                            all_summaries[i] = summary
                 except Exception as e:
                     # Handle batch processing errors
                     raise RuntimeError(f"Batch summarization failed: {str(e)}")
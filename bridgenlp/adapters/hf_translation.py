@@ -5,12 +5,15 @@ This adapter integrates text translation models from the Hugging Face Transforme
 library with enhanced language detection capabilities.
 """
 
+import collections
+import multiprocessing
 import threading
 import time
 import logging
 import re
 import string
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Union, Any, Set, NamedTuple
 
 try:
@@ -27,18 +30,109 @@ from ..config import BridgeConfig
 from ..result import BridgeResult
 from ..utils import (
     configure_device,
+    configure_threads,
     get_param_with_fallback,
     get_or_create_model,
     unload_model,
     validate_text_input,
     get_model_memory_usage,
     create_model_key,
-    detect_language
+    detect_language,
+    hash_text,
+    pretrained_load_kwargs,
+    configure_precision,
+    configure_attention,
+    load_pretrained,
+    inference_context,
+    sorted_batches
 )
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Registry key of the FastText language identification model
+_FASTTEXT_MODEL_KEY = "fasttext_language_detection"
+
+
+def _load_fasttext_model():
+    """
+    Load the FastText language identification model, downloading it if needed.
+    
+    Returns:
+        The loaded FastText model
+    """
+    import fasttext
+    
+    # FastText language identification model
+    try:
+        # Try to load from the standard location
+        return fasttext.load_model('lid.176.bin')
+    except Exception:
+        # Try to download the model if not available
+        try:
+            import os
+            import urllib.request
+            
+            model_path = os.path.join(os.path.expanduser("~"), ".cache", "fasttext", "lid.176.bin")
+            os.makedirs(os.path.dirname(model_path), exist_ok=True)
+            
+            if not os.path.exists(model_path):
+                url = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin"
+                urllib.request.urlretrieve(url, model_path)
+                
+            return fasttext.load_model(model_path)
+        except Exception as e:
+            logger.warning(f"Failed to download FastText model: {e}")
+            raise
+
+
+def _init_detection_worker():
+    """Load the FastText model once when a detection worker process starts."""
+    try:
+        get_or_create_model(_FASTTEXT_MODEL_KEY, _load_fasttext_model)
+    except Exception:
+        # The worker falls back to the other detectors
+        pass
+
+
+def _detect_languages_chunk(texts: List[str]) -> List[Tuple[str, float]]:
+    """
+    Detect the languages of a chunk of texts in a detection worker process.
+    
+    Args:
+        texts: Validated, non-empty texts
+        
+    Returns:
+        List of (language code, confidence) pairs, one per text
+    """
+    try:
+        model = get_or_create_model(_FASTTEXT_MODEL_KEY, _load_fasttext_model)
+        batch_labels, batch_scores = model.predict([text.replace("\n", " ") for text in texts], k=1)
+        return [
+            (labels[0].replace('__label__', ''), float(scores[0]))
+            for labels, scores in zip(batch_labels, batch_scores)
+        ]
+    except Exception:
+        pass
+    
+    try:
+        import langdetect
+        from langdetect import DetectorFactory
+    except ImportError:
+        return [(detect_language(text), 0.7) for text in texts]
+    
+    # Set seed for deterministic results
+    DetectorFactory.seed = 0
+    
+    predictions = []
+    for text in texts:
+        try:
+            top_match = langdetect.detect_langs(text)[0]
+            predictions.append((top_match.lang, top_match.prob))
+        except Exception:
+            predictions.append((detect_language(text), 0.7))
+    return predictions
+
 # Named tuple for language detection results
 class LanguageDetection(NamedTuple):
     """
@@ -177,9 +271,35 @@ class HuggingFaceTranslationBridge(BridgeBase):
         self.device = configure_device(
             get_param_with_fallback(None, config, "device", default_value=-1)
         )
+        configure_threads(get_param_with_fallback(None, config, "torch_threads"))
+        
+        # Reduced precision on GPU is opt-in: seq2seq models such as T5 and
+        # Pegasus can overflow in fp16, so bf16 is not swapped for fp16 either
+        self.dtype = get_param_with_fallback(None, config, "dtype", default_value="fp32")
+        self.torch_dtype = configure_precision(
+            self.dtype, self.device,
+            allow_tf32=get_param_with_fallback(None, config, "allow_tf32", default_value=False),
+            fp16_fallback=False
+        )
+        
+        # Attention kernels to load the model with (None keeps the model default)
+        self.attn_implementation = configure_attention(
+            get_param_with_fallback(None, config, "attn_implementation"), self.device
+        )
+        
+        # Compile the model with torch.compile on GPU (params["compile"]).
+        # Compilation changes the shared model, so it gets its own registry key
+        params = config.params if config else {}
+        self.compile_model = bool(params.get("compile", False)) and self.device >= 0
         
         # Create a unique key for this model in the registry
         self.model_key = create_model_key(self.model_name, "translation", self.device)
+        if self.torch_dtype is not None:
+            self.model_key += f"_{self.dtype}"
+        if self.attn_implementation is not None:
+            self.model_key += f"_{self.attn_implementation}"
+        if self.compile_model:
+            self.model_key += "_compiled"
         
         # Initialize model and tokenizer if not using lazy loading
         self.translator = None
@@ -200,22 +320,96 @@ class HuggingFaceTranslationBridge(BridgeBase):
             "language_detections": 0,
         })
         
-        # Cache detected languages for efficiency
-        self._detected_langs = {}
+        # LRU cache of detected languages keyed by text hash, sized by the
+        # detection_cache_size param (0 disables)
+        if config and config.params:
+            self.detection_cache_size = config.params.get("detection_cache_size", 4096)
+        else:
+            self.detection_cache_size = 4096
+        self._detected_langs = collections.OrderedDict()
+        self._detected_langs_lock = threading.Lock()
+        
+        # Large detect_language_batch calls run on a pool of worker processes
+        # when detection_workers is set (0, the default, keeps detection in
+        # process)
+        if config and config.params:
+            self.detection_workers = config.params.get("detection_workers", 0)
+            self.parallel_detection_threshold = config.params.get("parallel_detection_threshold", 256)
+        else:
+            self.detection_workers = 0
+            self.parallel_detection_threshold = 256
+        self._detection_pool = None
+        
+        # Supported languages only depend on the model name and the configured
+        # languages, so they are computed once (see get_supported_languages)
+        self._supported_languages = None
+        self._supported_source_languages = None
+    
+    def _get_cached_detection(self, text: str) -> Optional[LanguageDetection]:
+        """
+        Look up a previous detection result for a text.
+        
+        Args:
+            text: Validated input text
+            
+        Returns:
+            The cached LanguageDetection, or None if the text was not seen
+        """
+        key = hash_text(text)
+        with self._detected_langs_lock:
+            detection = self._detected_langs.get(key)
+            if detection is not None:
+                self._detected_langs.move_to_end(key)
+            return detection
+    
+    def _cache_detection(self, text: str, detection: LanguageDetection) -> None:
+        """
+        Store a detection result, evicting the least recently used entries.
+        
+        Args:
+            text: Validated input text
+            detection: Detection result for the text
+        """
+        if self.detection_cache_size <= 0:
+            return
+        
+        key = hash_text(text)
+        with self._detected_langs_lock:
+            self._detected_langs[key] = detection
+            self._detected_langs.move_to_end(key)
+            while len(self._detected_langs) > self.detection_cache_size:
+                self._detected_langs.popitem(last=False)
+    
+    def _clear_detection_cache(self) -> None:
+        """Drop all cached detection results."""
+        with self._detected_langs_lock:
+            self._detected_langs.clear()
     
     def _init_model(self):
         """Initialize the model and tokenizer."""
         if self.translator is not None:
             return
             
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # Use global model registry to share models between adapters
             def create_translator():
+                # The pipeline moves the model to its device, so load on CPU here
+                load_kwargs = pretrained_load_kwargs()
+                if load_kwargs:
+                    logger.info(f"Loading {self.model_name} weights without random initialization")
+                else:
+                    logger.info(f"Loading {self.model_name} weights with the default loader "
+                                "(install accelerate for faster cold starts)")
+                
+                model = load_pretrained(
+                    AutoModelForSeq2SeqLM, self.model_name, self.attn_implementation,
+                    torch_dtype=self.torch_dtype, **load_kwargs
+                )
                 return pipeline(
                     "translation", 
-                    model=self.model_name, 
+                    model=model, 
                     tokenizer=self.model_name,
                     device=self.device,
                     framework="pt"  # Use PyTorch
@@ -227,6 +421,9 @@ class HuggingFaceTranslationBridge(BridgeBase):
                 create_translator
             )
             
+            if self.compile_model:
+                self._compile_model()
+            
             # Track memory usage if we can
             if hasattr(self.translator, "model"):
                 self.memory_usage = get_model_memory_usage(self.translator.model)
@@ -235,7 +432,46 @@ class HuggingFaceTranslationBridge(BridgeBase):
         finally:
             # Record model loading time
             with self._metrics_lock:
-                self._metrics["model_load_time"] += time.time() - start_time
+                self._metrics["model_load_time"] += (time.perf_counter_ns() - start_time) * 1e-9
+    
+    def _compile_model(self):
+        """
+        Compile the translation model for repeated short generations.
+        
+        The forward pass is compiled in "reduce-overhead" mode, which
+        replays it from CUDA graphs, and models that support it decode
+        with a static KV cache so the shapes stay stable between steps.
+        A warm-up translation triggers compilation here instead of on the
+        first user call. If anything fails the model stays eager.
+        """
+        model = getattr(self.translator, "model", None)
+        if model is None or not hasattr(torch, "compile") or getattr(model, "_bridgenlp_compiled", False):
+            return
+        
+        eager_forward = model.forward
+        cache_implementation = model.generation_config.cache_implementation
+        try:
+            if getattr(model, "_supports_static_cache", False):
+                model.generation_config.cache_implementation = "static"
+            model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=False)
+            
+            warmup_args = {
+                "text": "Warm up.",
+                "max_length": self.max_length,
+                "truncation": self.truncation,
+                "num_beams": self.num_beams
+            }
+            if self.source_lang:
+                warmup_args["src_lang"] = self.source_lang
+            if self.target_lang:
+                warmup_args["tgt_lang"] = self.target_lang
+            with inference_context(self.torch_dtype):
+                self.translator(**warmup_args)
+            model._bridgenlp_compiled = True
+        except Exception as e:
+            logger.warning(f"Could not compile {self.model_name}, running eagerly: {e}")
+            model.forward = eager_forward
+            model.generation_config.cache_implementation = cache_implementation
     
     def _tokenize_text(self, text: str, lang: str = None) -> List[str]:
         """
@@ -431,10 +667,10 @@ class HuggingFaceTranslationBridge(BridgeBase):
         except ValueError as e:
             raise ValueError(f"Invalid input text: {str(e)}")
             
-        # Check cache first using a consistent hash
-        cache_key = hash(text[:min(100, len(text))])  # Use first 100 chars for efficiency
-        if cache_key in self._detected_langs:
-            return self._detected_langs[cache_key]
+        # Check cache first
+        cached = self._get_cached_detection(text)
+        if cached is not None:
+            return cached
         
         # Track detection metrics
         with self._metrics_lock:
@@ -454,35 +690,8 @@ class HuggingFaceTranslationBridge(BridgeBase):
             try:
                 import fasttext
                 
-                # Check if we already have the model loaded
-                model_key = "fasttext_language_detection"
-                
-                # Define model loading function
-                def load_fasttext_model():
-                    # FastText language identification model
-                    try:
-                        # Try to load from the standard location
-                        return fasttext.load_model('lid.176.bin')
-                    except Exception:
-                        # Try to download the model if not available
-                        try:
-                            import os
-                            import urllib.request
-                            
-                            model_path = os.path.join(os.path.expanduser("~"), ".cache", "fasttext", "lid.176.bin")
-                            os.makedirs(os.path.dirname(model_path), exist_ok=True)
-                            
-                            if not os.path.exists(model_path):
-                                url = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin"
-                                urllib.request.urlretrieve(url, model_path)
-                                
-                            return fasttext.load_model(model_path)
-                        except Exception as e:
-                            logger.warning(f"Failed to download FastText model: {e}")
-                            raise
-                
                 # Get or load the model
-                model = get_or_create_model(model_key, load_fasttext_model)
+                model = get_or_create_model(_FASTTEXT_MODEL_KEY, _load_fasttext_model)
                 
                 # Predict with FastText
                 labels, scores = model.predict(text, k=3)  # Get top 3 predictions
@@ -503,7 +712,7 @@ class HuggingFaceTranslationBridge(BridgeBase):
                 )
                 
                 # Cache the result
-                self._detected_langs[cache_key] = result
+                self._cache_detection(text, result)
                 return result
                 
             except (ImportError, Exception) as e:
@@ -535,7 +744,7 @@ class HuggingFaceTranslationBridge(BridgeBase):
                     )
                     
                     # Cache the result
-                    self._detected_langs[cache_key] = result
+                    self._cache_detection(text, result)
                     return result
                     
                 except (ImportError, Exception):
@@ -562,7 +771,7 @@ class HuggingFaceTranslationBridge(BridgeBase):
                         )
                         
                         # Cache the result
-                        self._detected_langs[cache_key] = result
+                        self._cache_detection(text, result)
                         return result
                         
                     except (ImportError, Exception):
@@ -581,14 +790,14 @@ class HuggingFaceTranslationBridge(BridgeBase):
                         )
                         
                         # Cache the result
-                        self._detected_langs[cache_key] = result
+                        self._cache_detection(text, result)
                         return result
                         
         except Exception as e:
             logger.warning(f"All language detection methods failed: {e}")
             
             # Cache the fallback result
-            self._detected_langs[cache_key] = fallback_result
+            self._cache_detection(text, fallback_result)
             return fallback_result
             
     def _is_language_supported(self, lang_code: str) -> bool:
@@ -601,11 +810,12 @@ class HuggingFaceTranslationBridge(BridgeBase):
         Returns:
             True if the language is supported, False otherwise
         """
-        # Get supported languages
-        supported_langs = self.get_supported_languages()
-        
         # Check if the language code is in supported source languages
-        return lang_code in supported_langs.get("source_languages", [])
+        if self._supported_source_languages is None:
+            self._supported_source_languages = frozenset(
+                self.get_supported_languages()["source_languages"]
+            )
+        return lang_code in self._supported_source_languages
         
     def _get_language_name(self, lang_code: str) -> Optional[str]:
         """
@@ -642,6 +852,19 @@ class HuggingFaceTranslationBridge(BridgeBase):
         For Helsinki-NLP models, it extracts language codes from the model name.
         For other models, it returns a more general list based on model inspection.
         
+        Returns:
+            Dictionary with source_languages and target_languages lists
+        """
+        if self._supported_languages is None:
+            self._supported_languages = self._list_supported_languages()
+        
+        # Hand out copies so callers cannot modify the cached lists
+        return {key: list(langs) for key, langs in self._supported_languages.items()}
+    
+    def _list_supported_languages(self) -> Dict[str, List[str]]:
+        """
+        Work out the languages supported by the current translation model.
+        
         Returns:
             Dictionary with source_languages and target_languages lists
         """
@@ -828,7 +1051,8 @@ class HuggingFaceTranslationBridge(BridgeBase):
                     if self.target_lang:
                         translation_args["tgt_lang"] = self.target_lang
                     
-                    translation = self.translator(**translation_args)
+                    with inference_context(self.torch_dtype):
+                        translation = self.translator(**translation_args)
                 except Exception as e:
                     # Handle inference errors gracefully
                     raise RuntimeError(f"Translation failed: {str(e)}")
@@ -911,110 +1135,135 @@ class HuggingFaceTranslationBridge(BridgeBase):
         with self._metrics_lock:
             self._metrics["language_detections"] += len([t for t in valid_texts if t])
         
-        # Create results list
-        results = []
+        # Empty and previously detected texts are answered without a model
+        results = [None] * len(valid_texts)
+        pending = []
+        for i, text in enumerate(valid_texts):
+            if not text:
+                # For empty texts, add a placeholder result
+                results[i] = LanguageDetection(
+                    code=self.source_lang or "en",
+                    name=self._get_language_name(self.source_lang or "en"),
+                    confidence=0.0,
+                    supported=self._is_language_supported(self.source_lang or "en")
+                )
+                continue
+            
+            # Check cache first
+            cached = self._get_cached_detection(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+        
+        if not pending:
+            return results
+        
+        pending_texts = [valid_texts[i] for i in pending]
+        if self.detection_workers > 0 and len(pending_texts) >= self.parallel_detection_threshold:
+            detections = self._detect_languages_parallel(pending_texts)
+        else:
+            detections = self._detect_languages(pending_texts)
+        
+        for i, detection in zip(pending, detections):
+            results[i] = detection
+        
+        return results
+    
+    def _detect_languages(self, texts: List[str]) -> List[LanguageDetection]:
+        """
+        Detect the languages of uncached texts in this process.
         
+        Args:
+            texts: Validated, non-empty texts
+            
+        Returns:
+            List of LanguageDetection objects, one per text
+        """
         # Try to use the fastest batch-capable detector first
         try:
             # Try FastText with batch processing
             import fasttext
             
-            # Check if we already have the model loaded
-            model_key = "fasttext_language_detection"
-            
-            # Define model loading function if needed
-            def load_fasttext_model():
-                # FastText language identification model
-                try:
-                    # Try to load from the standard location
-                    return fasttext.load_model('lid.176.bin')
-                except Exception:
-                    # Try to download the model if not available
-                    try:
-                        import os
-                        import urllib.request
-                        
-                        model_path = os.path.join(os.path.expanduser("~"), ".cache", "fasttext", "lid.176.bin")
-                        os.makedirs(os.path.dirname(model_path), exist_ok=True)
-                        
-                        if not os.path.exists(model_path):
-                            url = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin"
-                            urllib.request.urlretrieve(url, model_path)
-                            
-                        return fasttext.load_model(model_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to download FastText model: {e}")
-                        raise
-            
             # Get or load the model
-            model = get_or_create_model(model_key, load_fasttext_model)
+            model = get_or_create_model(_FASTTEXT_MODEL_KEY, _load_fasttext_model)
             
-            # Process texts in batches of 32 for efficiency
-            batch_size = 32
-            for i in range(0, len(valid_texts), batch_size):
-                batch = valid_texts[i:i+batch_size]
-                batch = [t if t else " " for t in batch]  # Replace empty strings with space
-                
-                # Predict all at once
-                batch_labels, batch_scores = model.predict(batch, k=1)
-                
-                for j, (labels, scores) in enumerate(zip(batch_labels, batch_scores)):
-                    if not valid_texts[i+j]:
-                        # For empty texts, add a placeholder result
-                        results.append(LanguageDetection(
-                            code=self.source_lang or "en",
-                            name=self._get_language_name(self.source_lang or "en"),
-                            confidence=0.0,
-                            supported=self._is_language_supported(self.source_lang or "en")
-                        ))
-                        continue
-                    
-                    # Extract the language code and score
-                    lang_code = labels[0].replace('__label__', '')
-                    confidence = float(scores[0])
-                    
-                    # Check cache first
-                    cache_key = hash(valid_texts[i+j][:min(100, len(valid_texts[i+j]))])
-                    if cache_key in self._detected_langs:
-                        results.append(self._detected_langs[cache_key])
-                        continue
-                    
-                    # Create the detection result
-                    detection = LanguageDetection(
-                        code=lang_code,
-                        name=self._get_language_name(lang_code),
-                        confidence=confidence,
-                        supported=self._is_language_supported(lang_code)
-                    )
-                    
-                    # Cache the result
-                    self._detected_langs[cache_key] = detection
-                    results.append(detection)
+            # Predict all texts in a single call. FastText reads one line per
+            # text, so newlines inside a text are flattened.
+            batch_labels, batch_scores = model.predict(
+                [text.replace("\n", " ") for text in texts], k=1
+            )
             
-            return results
+            predictions = [
+                (labels[0].replace('__label__', ''), float(scores[0]))
+                for labels, scores in zip(batch_labels, batch_scores)
+            ]
             
         except (ImportError, Exception):
             # FastText failed, fall back to individual detection
-            for text in valid_texts:
-                if not text:
-                    # For empty texts, add a placeholder result
-                    results.append(LanguageDetection(
-                        code=self.source_lang or "en",
-                        name=self._get_language_name(self.source_lang or "en"),
-                        confidence=0.0,
-                        supported=self._is_language_supported(self.source_lang or "en")
-                    ))
-                else:
-                    # Check cache first
-                    cache_key = hash(text[:min(100, len(text))])
-                    if cache_key in self._detected_langs:
-                        results.append(self._detected_langs[cache_key])
-                    else:
-                        # Detect using the single-text method
-                        detection = self.detect_language(text)
-                        results.append(detection)
+            return [self.detect_language(text) for text in texts]
+        
+        return self._cache_predictions(texts, predictions)
+    
+    def _detect_languages_parallel(self, texts: List[str]) -> List[LanguageDetection]:
+        """
+        Detect the languages of uncached texts on the detection worker processes.
+        
+        Language identification is CPU-bound and the pure Python detectors
+        hold the GIL, so large batches are split into one chunk per worker.
+        Each worker keeps its own copy of the detection model loaded.
+        
+        Args:
+            texts: Validated, non-empty texts
             
-            return results
+        Returns:
+            List of LanguageDetection objects, one per text
+        """
+        with self._model_lock:
+            if self._detection_pool is None:
+                self._detection_pool = ProcessPoolExecutor(
+                    max_workers=self.detection_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_detection_worker
+                )
+            pool = self._detection_pool
+        
+        chunk_size = -(-len(texts) // self.detection_workers)
+        chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+        
+        predictions = []
+        for chunk_predictions in pool.map(_detect_languages_chunk, chunks):
+            predictions.extend(chunk_predictions)
+        
+        return self._cache_predictions(texts, predictions)
+    
+    def _cache_predictions(self, texts: List[str],
+                           predictions: List[Tuple[str, float]]) -> List[LanguageDetection]:
+        """
+        Turn raw (language code, confidence) predictions into cached results.
+        
+        Args:
+            texts: Texts the predictions were made for
+            predictions: (language code, confidence) pair per text
+            
+        Returns:
+            List of LanguageDetection objects, one per text
+        """
+        detections = []
+        for text, (lang_code, confidence) in zip(texts, predictions):
+            # Create the detection result
+            detection = LanguageDetection(
+                code=lang_code,
+                name=self._get_language_name(lang_code),
+                confidence=confidence,
+                supported=self._is_language_supported(lang_code)
+            )
+            
+            # Cache the result
+            self._cache_detection(text, detection)
+            detections.append(detection)
+        
+        return detections
     
     def _generate_alignment_info(self, source_text: str, target_text: str, 
                                source_script_type: str, target_script_type: str) -> Dict:
@@ -1248,28 +1497,40 @@ class HuggingFaceTranslationBridge(BridgeBase):
             # Also detect script types for all texts
             script_types = [self._detect_script_type(text) if text else 'latin' for text in valid_texts]
                 
-            # Process texts in batches
-            all_translations = []
+            # Process texts in batches; empty texts keep an empty translation
+            all_translations = [{"translation_text": ""} for _ in valid_texts]
             
             with self._model_lock:
                 try:
-                    for i in range(0, len(valid_texts), self.batch_size):
-                        batch_texts = valid_texts[i:i+self.batch_size]
-                        batch_src_langs = source_langs[i:i+self.batch_size]
+                    # Visit the texts by source language and token length, so
+                    # each padded call holds texts of similar length
+                    positions = [j for j, text in enumerate(valid_texts) if text]
+                    # The pipeline tokenizes again, so only measure lengths when
+                    # the texts span several batches
+                    if len(positions) > self.batch_size:
+                        lengths = [len(ids) for ids in self.translator.tokenizer(
+                            [valid_texts[j] for j in positions], truncation=self.truncation
+                        )["input_ids"]]
+                    else:
+                        lengths = [0] * len(positions)
+                    keys = [(source_langs[j] or "", length) for j, length in zip(positions, lengths)]
+                    
+                    for batch in sorted_batches(keys, self.batch_size):
+                        # Group the batch by source language, since the pipeline
+                        # takes a single src_lang per call
+                        groups = {}
+                        for k in batch:
+                            j = positions[k]
+                            groups.setdefault(source_langs[j], []).append(j)
                         
-                        # Process each text individually since they might have different source languages
-                        batch_results = []
-                        for text, src_lang in zip(batch_texts, batch_src_langs):
-                            if not text:
-                                batch_results.append({"translation_text": ""})
-                                continue
-                                
-                            # Create translation arguments
+                        for src_lang, indices in groups.items():
+                            # Translate the whole group in one padded call
                             translation_args = {
-                                "text": text,
+                                "text": [valid_texts[j] for j in indices],
                                 "max_length": self.max_length,
                                 "truncation": self.truncation,
-                                "num_beams": self.num_beams
+                                "num_beams": self.num_beams,
+                                "batch_size": len(indices)
                             }
                             
                             # Only add language parameters if they're set
@@ -1278,16 +1539,15 @@ class HuggingFaceTranslationBridge(BridgeBase):
                             if self.target_lang:
                                 translation_args["tgt_lang"] = self.target_lang
                             
-                            # Translate
-                            translation = self.translator(**translation_args)
+                            with inference_context(self.torch_dtype):
+                                translations = self.translator(**translation_args)
                             
-                            # Extract result
-                            if isinstance(translation, list) and len(translation) > 0:
-                                batch_results.append(translation[0])
-                            else:
-                                batch_results.append({"translation_text": ""})
-                                
-                        all_translations.extend(batch_results)
+                            # Scatter results back to their original positions
+                            for j, translation in zip(indices, translations or []):
+                                if isinstance(translation, list):
+                                    translation = translation[0] if translation else None
+                                if isinstance(translation, dict):
+                                    all_translations[j] = translation
                         
                 except Exception as e:
                     # Handle batch processing errors
@@ -1443,9 +1703,13 @@ class HuggingFaceTranslationBridge(BridgeBase):
         self.source_lang = source_lang
         self.target_lang = target_lang
         
+        # Supported languages of unknown models follow the configured languages
+        self._supported_languages = None
+        self._supported_source_languages = None
+        
         # Reset language detection cache when changing source language
         if not self.auto_detect_language:
-            self._detected_langs = {}
+            self._clear_detection_cache()
     
     def set_auto_detect(self, auto_detect: bool):
         """
@@ -1458,7 +1722,7 @@ class HuggingFaceTranslationBridge(BridgeBase):
         
         # Clear cache if disabling auto-detection
         if not auto_detect:
-            self._detected_langs = {}
+            self._clear_detection_cache()
     
     def get_metrics(self) -> Dict[str, Union[int, float, str]]:
         """
@@ -1555,6 +1819,12 @@ class HuggingFaceTranslationBridge(BridgeBase):
         This method is called when the adapter is used as a context manager
         or when it's garbage collected.
         """
+        # Stop the detection worker processes
+        with self._model_lock:
+            if self._detection_pool is not None:
+                self._detection_pool.shutdown()
+                self._detection_pool = None
+        
         # Unload the model if requested in config
         unload = (hasattr(self, "config") and self.config and 
                   hasattr(self.config, "unload_on_del") and self.config.unload_on_del)
@@ -1566,7 +1836,7 @@ class HuggingFaceTranslationBridge(BridgeBase):
                 self.translator = None
                 
                 # Clear caches
-                self._detected_langs = {}
+                self._clear_detection_cache()
     
     def __repr__(self) -> str:
         """
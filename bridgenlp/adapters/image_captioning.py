@@ -6,8 +6,11 @@ from images and attaching them to token-based pipelines. It supports
 prompt conditioning to guide caption generation.
 """
 
+import logging
 import os
-from typing import List, Optional, Union, Any, Dict, Literal
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Union, Any, Dict, Literal, Tuple
 
 try:
     import numpy as np
@@ -28,9 +31,15 @@ from ..utils import (
     configure_device, 
     get_param_with_fallback, 
     get_or_create_model,
-    create_model_key
+    create_model_key,
+    configure_precision,
+    configure_attention,
+    load_pretrained,
+    pretrained_load_kwargs
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ImageCaptioningBridge(MultimodalBridgeBase):
     """
@@ -71,10 +80,36 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
         self.device = get_param_with_fallback(device, config, "device", default_value=-1)
         self.device_idx = configure_device(self.device)
         
+        # Reduced precision on GPU (None keeps the model in float32)
+        self.dtype = get_param_with_fallback(None, config, "dtype", default_value="fp16")
+        self.torch_dtype = configure_precision(
+            self.dtype, self.device_idx,
+            allow_tf32=get_param_with_fallback(None, config, "allow_tf32", default_value=False)
+        )
+        
+        # Attention kernels to load the model with (None keeps the model default)
+        self.attn_implementation = configure_attention(
+            get_param_with_fallback(None, config, "attn_implementation"), self.device_idx
+        )
+        
         # Additional parameters from config
         self.max_length = get_param_with_fallback(None, config, "max_length", default_value=32)
         self.num_captions = get_param_with_fallback(1, config, "params", "num_captions", 1)
         
+        # Replay the image encoder from CUDA graphs on GPU (params["cuda_graphs"])
+        params = config.params if config else {}
+        self.use_cuda_graphs = bool(params.get("cuda_graphs", True)) and self.device_idx >= 0
+        # Each graph keeps its own memory pool, so only the most recent shapes are kept
+        self.max_cuda_graphs = max(1, int(params.get("max_cuda_graphs", 4)))
+        self._graphs = OrderedDict()
+        self._graph_lock = threading.Lock()
+        
+        # Decode JPEG files with nvJPEG straight into GPU memory (params["gpu_jpeg_decode"])
+        self.gpu_jpeg_decode = bool(params.get("gpu_jpeg_decode", True)) and self.device_idx >= 0
+        
+        # from_image_batch always batches, so a batch_size of 1 means "use the default"
+        self.batch_size = config.batch_size if config and config.batch_size > 1 else 8
+        
         # For image size, handle both tuple and dict formats
         default_size = (224, 224)  # (height, width)
         if config and config.image_size:
@@ -135,6 +170,10 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
         
         # Create a unique key for this model in the registry
         self.model_key = create_model_key(self.model_name, "image_captioning", self.device_idx)
+        if self.torch_dtype is not None:
+            self.model_key += f"_{self.dtype}"
+        if self.attn_implementation is not None:
+            self.model_key += f"_{self.attn_implementation}"
     
     def _load_model_and_processor(self):
         """
@@ -157,11 +196,28 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
             def create_model_components():
                 components = {}
                 
+                # Read the weights straight onto the target device when accelerate is available
+                load_kwargs = pretrained_load_kwargs(self.device_idx)
+                if "device_map" in load_kwargs:
+                    logger.info(f"Loading {self.model_name} weights directly onto cuda:{self.device_idx}")
+                elif load_kwargs:
+                    logger.info(f"Loading {self.model_name} weights without random initialization")
+                else:
+                    logger.info(f"Loading {self.model_name} weights with the default loader "
+                                "(install accelerate for faster cold starts)")
+                
                 # There are different model types with different interfaces
                 if "vit-gpt" in self.model_name:
                     # For VisionEncoderDecoder models like vit-gpt2
-                    model = VisionEncoderDecoderModel.from_pretrained(self.model_name)
-                    processor = AutoImageProcessor.from_pretrained(self.model_name)
+                    model = load_pretrained(
+                        VisionEncoderDecoderModel, self.model_name, self.attn_implementation,
+                        torch_dtype=self.torch_dtype, **load_kwargs
+                    )
+                    # The fast (torchvision) processor keeps GPU-decoded images on the device
+                    if self.gpu_jpeg_decode:
+                        processor = AutoImageProcessor.from_pretrained(self.model_name, use_fast=True)
+                    else:
+                        processor = AutoImageProcessor.from_pretrained(self.model_name)
                     tokenizer = AutoTokenizer.from_pretrained(self.model_name)
                     components["model"] = model
                     components["processor"] = processor
@@ -170,13 +226,17 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
                 else:
                     # For models with a unified processor
                     processor = AutoProcessor.from_pretrained(self.model_name)
-                    model = AutoModelForCausalLM.from_pretrained(self.model_name)
+                    model = load_pretrained(
+                        AutoModelForCausalLM, self.model_name, self.attn_implementation,
+                        torch_dtype=self.torch_dtype, **load_kwargs
+                    )
                     components["model"] = model
                     components["processor"] = processor
                     components["model_type"] = "processor-based"
                 
-                # Move to device
-                if (self.device_idx >= 0 and torch.cuda.is_available()):
+                # Move to device, unless the weights were already loaded there
+                if (self.device_idx >= 0 and torch.cuda.is_available()
+                        and "device_map" not in load_kwargs):
                     components["model"] = components["model"].to(f"cuda:{self.device_idx}")
                 
                 # Set to evaluation mode
@@ -197,6 +257,13 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
                 self._tokenizer = components["tokenizer"]
             self._model_type = components["model_type"]
             
+            # Only the fast image processor of VisionEncoderDecoder models takes
+            # GPU tensors; slow processors convert their inputs to numpy
+            if self.gpu_jpeg_decode and not (
+                    self._model_type == "vit-gpt" and getattr(self._processor, "is_fast", False)):
+                logger.info(f"{self.model_name} has no fast image processor, decoding JPEGs with PIL")
+                self.gpu_jpeg_decode = False
+            
             self._model_loaded = True
             
         except ImportError:
@@ -206,6 +273,95 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
                 "manually install: transformers>=4.25.0 torch>=1.10.0 pillow>=9.0.0"
             )
     
+    def _maybe_capture_graph(self, pixel_values: Any) -> Optional[Tuple[Any, Any, Any]]:
+        """
+        Get the CUDA graph of the image encoder for an input shape.
+        
+        The graph is captured on the first call with a given (shape, dtype)
+        and reused afterwards, so repeated calls skip the launch overhead of
+        the encoder's many small kernels. Only the ``max_cuda_graphs`` most
+        recently used graphs are kept.
+        
+        Args:
+            pixel_values: Encoder input on the adapter's device
+            
+        Returns:
+            Tuple of (graph, static input, static output), or None if the
+            encoder has to run eagerly
+        """
+        if not self.use_cuda_graphs or self._model_type != "vit-gpt" or not pixel_values.is_cuda:
+            return None
+        
+        # A graph holds the addresses of the weights, which change when the model is offloaded
+        if self._offload_hook is not None:
+            return None
+        
+        import torch
+        
+        key = (tuple(pixel_values.shape), pixel_values.dtype)
+        graph = self._graphs.get(key)
+        if graph is not None:
+            self._graphs.move_to_end(key)
+            return graph
+        
+        encoder = self._model.encoder
+        try:
+            static_in = pixel_values.clone()
+            
+            # Warm up on a side stream so one-time initialization is not captured
+            stream = torch.cuda.Stream(device=pixel_values.device)
+            stream.wait_stream(torch.cuda.current_stream(pixel_values.device))
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    encoder(pixel_values=static_in)
+            torch.cuda.current_stream(pixel_values.device).wait_stream(stream)
+            
+            # Thread-local capture only rejects unsafe calls from this thread,
+            # so other threads (such as MultiTaskImageBridge's detection
+            # worker) can keep using the GPU during the capture
+            cuda_graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(cuda_graph, capture_error_mode="thread_local"):
+                static_out = encoder(pixel_values=static_in).last_hidden_state
+        except TypeError:
+            # PyTorch before 2.1 can only capture in global mode, which other
+            # threads' CUDA work would break
+            self.use_cuda_graphs = False
+            return None
+        except RuntimeError:
+            # Some models or drivers cannot be captured, stay eager for good
+            self.use_cuda_graphs = False
+            return None
+        
+        graph = (cuda_graph, static_in, static_out)
+        self._graphs[key] = graph
+        while len(self._graphs) > self.max_cuda_graphs:
+            self._graphs.popitem(last=False)
+        return graph
+    
+    def _replay_encoder(self, pixel_values: Any) -> Optional[Any]:
+        """
+        Run the image encoder by replaying its CUDA graph.
+        
+        Args:
+            pixel_values: Encoder input on the adapter's device
+            
+        Returns:
+            Encoder outputs for ``generate``, or None if no graph is available
+        """
+        with self._graph_lock:
+            graph = self._maybe_capture_graph(pixel_values)
+            if graph is None:
+                return None
+            
+            cuda_graph, static_in, static_out = graph
+            static_in.copy_(pixel_values)
+            cuda_graph.replay()
+            # The static output is overwritten by the next replay
+            last_hidden_state = static_out.clone()
+        
+        from transformers.modeling_outputs import BaseModelOutput
+        return BaseModelOutput(last_hidden_state=last_hidden_state)
+    
     def _preprocess_image(self, image_path: str):
         """
         Preprocess an image for the model.
@@ -221,35 +377,14 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
             ValueError: If the image cannot be processed
         """
         try:
-            from PIL import Image
-            import torch
-            
             # Ensure model is loaded
             if not self._model_loaded:
                 self._load_model_and_processor()
             
-            # Open and convert image
-            image = Image.open(image_path).convert("RGB")
+            # Open and decode image
+            image = self._load_image(image_path)
             
-            # Process image based on model type
-            if self._model_type == "vit-gpt":
-                # For VisionEncoderDecoder models
-                pixel_values = self._processor(image, return_tensors="pt").pixel_values
-                
-                # Move to device if needed
-                if self.device_idx >= 0 and torch.cuda.is_available():
-                    pixel_values = pixel_values.to(f"cuda:{self.device_idx}")
-                
-                return pixel_values
-            else:
-                # For processor-based models
-                inputs = self._processor(images=image, return_tensors="pt")
-                
-                # Move to device if needed
-                if self.device_idx >= 0 and torch.cuda.is_available():
-                    inputs = {k: v.to(f"cuda:{self.device_idx}") for k, v in inputs.items()}
-                
-                return inputs
+            return self._encode_images([image])
                 
         except ImportError:
             raise ImportError("PIL not installed. Install with: pip install 'bridgenlp[multimodal]' or manually install: pillow>=9.0.0")
@@ -278,18 +413,7 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
             if prompt is not None:
                 self.set_prompt(prompt)
                 
-            # For instruction-based prompting, we need to modify generation parameters
-            # based on the prompt before model generation
-            generation_kwargs = {}
-            if self.enable_prompt_conditioning and self.prompt_strategy == "instruction":
-                # Some models support direct prompt conditioning
-                prompt_text = self.current_prompt
-                if "gpt" in self.model_name.lower() or "opt" in self.model_name.lower():
-                    # For GPT/OPT style models, add prompt as a prefix to the generation
-                    generation_kwargs["prefix"] = prompt_text
-                elif "t5" in self.model_name.lower() or "bart" in self.model_name.lower():
-                    # For T5/BART style models, condition with encoder prefix
-                    generation_kwargs["encoder_prompt"] = prompt_text
+            generation_kwargs = self._generation_kwargs()
             
             # Ensure model is loaded
             if not self._model_loaded:
@@ -299,90 +423,362 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
             inputs = self._preprocess_image(validated_path)
             
             # Generate captions
+            captions = self._generate_captions(inputs, generation_kwargs)
+            
+            return self._build_result(validated_path, captions)
+    
+    def from_image_prompts(self, image_path: str, prompts: List[str]) -> List[BridgeResult]:
+        """
+        Caption one image under several prompts.
+        
+        The image is loaded, preprocessed and (for VisionEncoderDecoder
+        models) encoded once. Prompts that lead to the same ``generate``
+        arguments, which is every prompt unless the "instruction" strategy
+        is active, share a single generate call; only the post-generation
+        conditioning differs between them. The current prompt is not changed.
+        
+        Args:
+            image_path: Path to the image file
+            prompts: Prompts to condition the captions with
+            
+        Returns:
+            List of BridgeResult objects, one per prompt
+            
+        Raises:
+            ValueError: If the image path is invalid
+        """
+        with self._measure_performance():
+            # Validate image path
+            validated_path = self.validate_image_path(image_path)
+            
+            # Ensure model is loaded
+            if not self._model_loaded:
+                self._load_model_and_processor()
+            
+            # Preprocess image
+            inputs = self._preprocess_image(validated_path)
+            
+            # The encoder output does not depend on the prompt, so run it once
+            encoder_outputs = None
             if self._model_type == "vit-gpt":
-                import torch
-                
-                with torch.no_grad():
-                    # For VisionEncoderDecoder models
-                    outputs = self._model.generate(
-                        inputs,
-                        max_length=self.max_length,
-                        num_return_sequences=self.num_captions,
-                        do_sample=self.num_captions > 1,  # Use sampling for multiple captions
-                        temperature=0.7 if self.num_captions > 1 else 1.0,
-                        top_p=0.9 if self.num_captions > 1 else 1.0,
-                        **generation_kwargs
+                with self._inference_context():
+                    encoder_outputs = self._replay_encoder(inputs)
+                    if encoder_outputs is None:
+                        encoder_outputs = self._model.encoder(pixel_values=inputs)
+            
+            captions_by_kwargs = {}
+            results = []
+            for prompt in prompts:
+                generation_kwargs = self._generation_kwargs(prompt)
+                key = tuple(sorted(generation_kwargs.items()))
+                if key not in captions_by_kwargs:
+                    captions_by_kwargs[key] = self._generate_captions(
+                        inputs, generation_kwargs, encoder_outputs
                     )
-                    
-                    # Decode captions
-                    captions = []
-                    for output in outputs:
-                        caption = self._tokenizer.decode(output, skip_special_tokens=True)
-                        # Apply post-generation prompt conditioning for non-instruction strategies
-                        if self.enable_prompt_conditioning and self.prompt_strategy != "instruction":
-                            caption = self._apply_prompt_conditioning(caption)
-                        captions.append(caption)
-            else:
+                results.append(self._build_result(validated_path, captions_by_kwargs[key], prompt))
+            
+            return results
+    
+    def from_image_batch(self, image_paths: List[str],
+                         batch_size: Optional[int] = None) -> List[BridgeResult]:
+        """
+        Caption several images, generating captions for a whole chunk at once.
+        
+        Images are loaded on a thread pool while the previous chunk is being
+        captioned, and each chunk goes through ``generate`` as one batch.
+        All images use the current prompt.
+        
+        Args:
+            image_paths: List of paths to image files
+            batch_size: Images per generate call (defaults to self.batch_size)
+            
+        Returns:
+            List of BridgeResult objects, one per path. Paths that could not
+            be processed get an error result.
+        """
+        with self._measure_performance():
+            results = self._map_image_batches(
+                image_paths, batch_size or self.batch_size, self._process_images,
+                prepare=self._prepare_inputs
+            )
+            
+            with self._metrics_lock:
+                self._metrics["total_tokens"] += sum(len(result.tokens) for result in results)
+            
+            return results
+    
+    def _process_images(self, items: List[Tuple[str, Any]],
+                        inputs: Optional[Any] = None) -> List[BridgeResult]:
+        """
+        Caption already loaded images with a single generate call.
+        
+        Args:
+            items: List of (path, image) pairs from _load_image
+            inputs: Inputs for the images from _prepare_inputs, if already built
+            
+        Returns:
+            List of BridgeResult objects, one per pair
+        """
+        generation_kwargs = self._generation_kwargs()
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        if inputs is None:
+            inputs = self._prepare_inputs([image for _, image in items])
+        captions = self._generate_captions(self._to_device(inputs), generation_kwargs)
+        
+        # generate returns num_captions sequences per image, in order
+        n = self.num_captions
+        return [
+            self._build_result(path, captions[row * n:(row + 1) * n])
+            for row, (path, _) in enumerate(items)
+        ]
+    
+    def _load_image(self, image_path: str) -> Any:
+        """
+        Open an image file for the model.
+        
+        On GPU, JPEG files are decoded by nvJPEG directly into device memory,
+        which skips the CPU decode and the host-to-device copy of the pixels.
+        This needs a VisionEncoderDecoder model with a fast image processor.
+        Other models and formats, and JPEGs nvJPEG cannot decode, go through
+        PIL.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            A uint8 RGB tensor of shape (3, H, W) on the GPU, or an RGB PIL image
+        """
+        is_jpeg = image_path.lower().endswith((".jpg", ".jpeg"))
+        
+        # Loading the model settles whether its processor accepts GPU tensors
+        if self.gpu_jpeg_decode and is_jpeg and not self._model_loaded:
+            self._load_model_and_processor()
+        
+        if self.gpu_jpeg_decode and is_jpeg:
+            try:
                 import torch
+                from torchvision.io import ImageReadMode, decode_jpeg, read_file
                 
-                # For processor-based models
-                # Combine inputs with generation kwargs
-                generation_inputs = {**inputs}
-                
-                with torch.no_grad():
-                    outputs = self._model.generate(
-                        **generation_inputs,
-                        max_length=self.max_length,
-                        num_return_sequences=self.num_captions,
-                        do_sample=self.num_captions > 1,
-                        **generation_kwargs
-                    )
-                    
-                    # Decode captions (model-specific)
-                    captions = []
-                    for output in outputs:
-                        if hasattr(self._processor, "decode"):
-                            caption = self._processor.decode(output, skip_special_tokens=True)
-                        elif hasattr(self._processor, "tokenizer") and hasattr(self._processor.tokenizer, "decode"):
-                            caption = self._processor.tokenizer.decode(output, skip_special_tokens=True)
-                        else:
-                            caption = output.cpu().numpy().tolist()
-                            
-                        # Apply post-generation prompt conditioning for non-instruction strategies
-                        if self.enable_prompt_conditioning and self.prompt_strategy != "instruction":
-                            caption = self._apply_prompt_conditioning(caption)
-                        captions.append(caption)
-            
-            # Store prompt in the result
-            prompt_used = None
-            if self.enable_prompt_conditioning:
-                prompt_used = self.current_prompt
-                
-            # Tokenize the first caption for token representation
-            tokens = captions[0].split() if captions else []
+                if torch.cuda.is_available():
+                    data = read_file(image_path)
+                    return decode_jpeg(data, mode=ImageReadMode.RGB,
+                                       device=f"cuda:{self.device_idx}")
+            except Exception:
+                # torchvision missing or built without nvJPEG, or an unsupported JPEG
+                pass
+        
+        return super()._load_image(image_path)
+    
+    def _encode_images(self, images: List[Any]) -> Any:
+        """
+        Turn loaded images into model inputs on the adapter's device.
+        
+        Args:
+            images: Images from _load_image
             
-            # Create detected_objects placeholder (for compatibility with object detection)
-            detected_objects = []
+        Returns:
+            Pixel values tensor for VisionEncoderDecoder models, or a
+            dictionary of input tensors for processor-based models
+        """
+        return self._to_device(self._prepare_inputs(images))
+    
+    def _prepare_inputs(self, images: List[Any]) -> Any:
+        """
+        Turn loaded images into model inputs on the CPU.
+        
+        This only touches the processor, so batch processing runs it on the
+        image loading threads. When the model is on GPU the tensors are
+        pinned, which lets _to_device copy them without blocking.
+        
+        Args:
+            images: Images from _load_image
             
-            # Create image features dictionary with basic image info
-            import os
-            image_features = {
-                "image_path": os.path.abspath(validated_path),
-                "caption": captions[0] if captions else "",
-            }
+        Returns:
+            Pixel values tensor for VisionEncoderDecoder models, or a
+            dictionary of input tensors for processor-based models
+        """
+        import torch
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        pin = self.device_idx >= 0 and torch.cuda.is_available()
+        
+        if self._model_type == "vit-gpt":
+            # For VisionEncoderDecoder models
+            pixel_values = self._processor(images, return_tensors="pt").pixel_values
+            return pixel_values.pin_memory() if pin and not pixel_values.is_cuda else pixel_values
+        
+        # For processor-based models
+        inputs = self._processor(images=images, return_tensors="pt")
+        if pin:
+            inputs = {k: v if v.is_cuda else v.pin_memory() for k, v in inputs.items()}
+        return inputs
+    
+    def _to_device(self, inputs: Any) -> Any:
+        """
+        Move prepared inputs to the adapter's device.
+        
+        Args:
+            inputs: Model inputs from _prepare_inputs
             
-            # Add prompt information to image features if used
-            if prompt_used:
-                image_features["prompt"] = prompt_used
-                image_features["prompt_strategy"] = self.prompt_strategy
+        Returns:
+            The same inputs on the adapter's device
+        """
+        import torch
+        
+        # Move to device if needed; copies from pinned memory are asynchronous
+        if self.device_idx < 0 or not torch.cuda.is_available():
+            return inputs
+        
+        device = f"cuda:{self.device_idx}"
+        if self._model_type == "vit-gpt":
+            return inputs.to(device, non_blocking=True)
+        return {k: v.to(device, non_blocking=True) for k, v in inputs.items()}
+    
+    def _generation_kwargs(self, prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the extra generate arguments for instruction-based prompting.
+        
+        Args:
+            prompt: Optional prompt to use (uses self.current_prompt if None)
             
-            # Return structured result
-            return BridgeResult(
-                tokens=tokens,
-                captions=captions,
-                detected_objects=detected_objects,
-                image_features=image_features
-            )
+        Returns:
+            Dictionary of keyword arguments for ``generate``
+        """
+        # For instruction-based prompting, we need to modify generation parameters
+        # based on the prompt before model generation
+        generation_kwargs = {}
+        if self.enable_prompt_conditioning and self.prompt_strategy == "instruction":
+            # Some models support direct prompt conditioning
+            prompt_text = prompt if prompt is not None else self.current_prompt
+            if "gpt" in self.model_name.lower() or "opt" in self.model_name.lower():
+                # For GPT/OPT style models, add prompt as a prefix to the generation
+                generation_kwargs["prefix"] = prompt_text
+            elif "t5" in self.model_name.lower() or "bart" in self.model_name.lower():
+                # For T5/BART style models, condition with encoder prefix
+                generation_kwargs["encoder_prompt"] = prompt_text
+        return generation_kwargs
+    
+    def _generate_captions(self, inputs: Any, generation_kwargs: Dict[str, Any],
+                           encoder_outputs: Optional[Any] = None) -> List[str]:
+        """
+        Run caption generation and decode the output sequences.
+        
+        Prompt conditioning is applied later, by _build_result.
+        
+        Args:
+            inputs: Model inputs from _encode_images or _preprocess_image
+            generation_kwargs: Extra arguments for ``generate``
+            encoder_outputs: Encoder outputs for ``inputs`` computed earlier
+                (VisionEncoderDecoder models only)
+            
+        Returns:
+            Decoded captions, num_captions per input image in input order
+        """
+        if self._model_type == "vit-gpt":
+            with self._inference_context():
+                # For VisionEncoderDecoder models. The encoder runs from a
+                # captured CUDA graph when possible, generate then only runs
+                # the decoder.
+                if encoder_outputs is None:
+                    encoder_outputs = self._replay_encoder(inputs)
+                if encoder_outputs is not None:
+                    model_inputs = {"encoder_outputs": encoder_outputs}
+                else:
+                    model_inputs = {"pixel_values": inputs}
+                
+                outputs = self._model.generate(
+                    **model_inputs,
+                    max_length=self.max_length,
+                    num_return_sequences=self.num_captions,
+                    do_sample=self.num_captions > 1,  # Use sampling for multiple captions
+                    temperature=0.7 if self.num_captions > 1 else 1.0,
+                    top_p=0.9 if self.num_captions > 1 else 1.0,
+                    **generation_kwargs
+                )
+                
+            # Decode captions. The sequences are copied to the host once for
+            # the whole batch instead of once per sequence inside decode
+            captions = self._tokenizer.batch_decode(outputs.cpu(), skip_special_tokens=True)
+        else:
+            # For processor-based models
+            # Combine inputs with generation kwargs
+            generation_inputs = {**inputs}
+            
+            with self._inference_context():
+                outputs = self._model.generate(
+                    **generation_inputs,
+                    max_length=self.max_length,
+                    num_return_sequences=self.num_captions,
+                    do_sample=self.num_captions > 1,
+                    **generation_kwargs
+                )
+                
+            # Decode captions (model-specific), copying the sequences to the
+            # host once for the whole batch
+            outputs = outputs.cpu()
+            if hasattr(self._processor, "batch_decode"):
+                captions = self._processor.batch_decode(outputs, skip_special_tokens=True)
+            elif hasattr(self._processor, "tokenizer") and hasattr(self._processor.tokenizer, "batch_decode"):
+                captions = self._processor.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            else:
+                captions = outputs.numpy().tolist()
+        
+        return captions
+    
+    def _build_result(self, image_path: str, captions: List[str],
+                      prompt: Optional[str] = None) -> BridgeResult:
+        """
+        Build the result for one captioned image.
+        
+        Args:
+            image_path: Path of the image
+            captions: Captions generated for the image
+            prompt: Optional prompt to use (uses self.current_prompt if None)
+            
+        Returns:
+            BridgeResult containing captions
+        """
+        # Store prompt in the result
+        prompt_used = None
+        if self.enable_prompt_conditioning:
+            prompt_used = prompt if prompt is not None else self.current_prompt
+            
+            # Apply post-generation prompt conditioning for non-instruction strategies
+            if self.prompt_strategy != "instruction":
+                captions = [self._apply_prompt_conditioning(caption, prompt_used) for caption in captions]
+            
+        # Tokenize the first caption for token representation
+        tokens = captions[0].split() if captions else []
+        
+        # Create detected_objects placeholder (for compatibility with object detection)
+        detected_objects = []
+        
+        # Create image features dictionary with basic image info
+        import os
+        image_features = {
+            "image_path": os.path.abspath(image_path),
+            "caption": captions[0] if captions else "",
+        }
+        
+        # Add prompt information to image features if used
+        if prompt_used:
+            image_features["prompt"] = prompt_used
+            image_features["prompt_strategy"] = self.prompt_strategy
+        
+        # Return structured result
+        return BridgeResult(
+            tokens=tokens,
+            captions=captions,
+            detected_objects=detected_objects,
+            image_features=image_features
+        )
     
     def from_text(self, text: str) -> BridgeResult:
         """
@@ -515,6 +911,27 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
         Reset the prompt to the default value.
         """
         self.current_prompt = self.default_prompt
+    
+    def set_prompt_strategy(self, strategy: Literal["prefix", "template", "instruction"],
+                            template: Optional[str] = None) -> None:
+        """
+        Switch the prompt conditioning strategy without reloading the model.
+        
+        Args:
+            strategy: Strategy for applying prompts ("prefix", "template", or "instruction")
+            template: Optional new template for the "template" strategy
+                (use {prompt} and {caption})
+            
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in ("prefix", "template", "instruction"):
+            raise ValueError(
+                f"Invalid prompt strategy: {strategy}. Must be 'prefix', 'template' or 'instruction'"
+            )
+        self.prompt_strategy = strategy
+        if template is not None:
+            self.prompt_template = template
         
     def _apply_prompt_conditioning(self, caption: str, prompt: Optional[str] = None) -> str:
         """
@@ -572,5 +989,6 @@ class ImageCaptioningBridge(MultimodalBridgeBase):
             self._model = None
             self._processor = None
             self._tokenizer = None
+            self._graphs = OrderedDict()
             self._model_loaded = False
             free_memory()
\ No newline at end of file
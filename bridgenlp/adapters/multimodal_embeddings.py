@@ -5,7 +5,10 @@ This adapter generates embeddings for text, images, or text-image pairs
 for similarity, retrieval, and classification tasks.
 """
 
+import collections
+import logging
 import os
+import threading
 from typing import List, Optional, Union, Any, Dict, Tuple
 
 try:
@@ -28,9 +31,18 @@ from ..utils import (
     get_param_with_fallback, 
     get_or_create_model,
     create_model_key,
+    hash_text,
+    configure_precision,
+    configure_attention,
+    load_pretrained,
     validate_text_input
 )
 
+logger = logging.getLogger(__name__)
+
+# Exported ONNX towers are kept here, one directory per model
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bridgenlp", "onnx")
+
 
 class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
     """
@@ -62,9 +74,36 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
         self.device = get_param_with_fallback(device, config, "device", default_value=-1)
         self.device_idx = configure_device(self.device)
         
+        # Reduced precision on GPU (None keeps the model in float32)
+        self.dtype = get_param_with_fallback(None, config, "dtype", default_value="fp16")
+        self.torch_dtype = configure_precision(
+            self.dtype, self.device_idx,
+            allow_tf32=get_param_with_fallback(None, config, "allow_tf32", default_value=False)
+        )
+        
+        # Attention kernels to load the model with (None keeps the model default)
+        self.attn_implementation = configure_attention(
+            get_param_with_fallback(None, config, "attn_implementation"), self.device_idx
+        )
+        
         # Additional parameters from config
         self.normalize = get_param_with_fallback(True, config, "params", "normalize", True)
         
+        # from_image_batch always batches, so a batch_size of 1 means "use the default"
+        self.batch_size = config.batch_size if config and config.batch_size > 1 else 32
+        
+        # Run the text and vision towers with ONNX Runtime on CPU (params["onnx"])
+        params = config.params if config else {}
+        self.use_onnx = bool(params.get("onnx", False)) and self.device_idx < 0
+        self.onnx_cache_dir = params.get("onnx_cache_dir", ONNX_CACHE_DIR)
+        self._onnx_sessions = {}
+        self._onnx_lock = threading.Lock()
+        
+        # LRU cache of text embeddings keyed by text hash (params["embedding_cache_size"], 0 disables)
+        self.embedding_cache_size = params.get("embedding_cache_size", 1024)
+        self._embedding_cache = collections.OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        
         # Initialize model components lazily
         self._model = None
         self._processor = None
@@ -72,6 +111,10 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
         
         # Create a unique key for this model in the registry
         self.model_key = create_model_key(self.model_name, "multimodal_embeddings", self.device_idx)
+        if self.torch_dtype is not None:
+            self.model_key += f"_{self.dtype}"
+        if self.attn_implementation is not None:
+            self.model_key += f"_{self.attn_implementation}"
     
     def _load_model_and_processor(self):
         """
@@ -88,7 +131,10 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
             def create_model_components():
                 # CLIP is the main model type supported currently
                 processor = CLIPProcessor.from_pretrained(self.model_name)
-                model = CLIPModel.from_pretrained(self.model_name)
+                model = load_pretrained(
+                    CLIPModel, self.model_name, self.attn_implementation,
+                    torch_dtype=self.torch_dtype
+                )
                 
                 # Move to device
                 if (self.device_idx >= 0 and torch.cuda.is_available()):
@@ -197,7 +243,7 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
             # Get embeddings
             import torch
             
-            with torch.no_grad():
+            with self._inference_context():
                 outputs = self._model(**inputs)
                 
                 # Extract text and image embeddings
@@ -212,8 +258,8 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
                 similarity = torch.matmul(text_embeds, image_embeds.T)[0][0].item()
                 
                 # Convert to numpy arrays
-                text_embeds = text_embeds.cpu().numpy()[0]
-                image_embeds = image_embeds.cpu().numpy()[0]
+                text_embeds = text_embeds.float().cpu().numpy()[0]
+                image_embeds = image_embeds.float().cpu().numpy()[0]
             
             # Tokenize text
             tokens = text.split()
@@ -261,96 +307,150 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
                 self._load_model_and_processor()
             
             try:
-                from PIL import Image
-                import torch
-                
                 # Open image
-                image = Image.open(validated_path).convert("RGB")
-                
-                # Process image
-                inputs = self._processor(
-                    images=[image],
-                    return_tensors="pt"
-                )
-                
-                # Move to device if needed
-                if self.device_idx >= 0 and torch.cuda.is_available():
-                    inputs = {k: v.to(f"cuda:{self.device_idx}") for k, v in inputs.items()}
-                
-                # Get embeddings
-                with torch.no_grad():
-                    outputs = self._model.get_image_features(**inputs)
-                    
-                    # Normalize if requested
-                    if self.normalize:
-                        outputs = outputs / outputs.norm(dim=-1, keepdim=True)
-                    
-                    # Convert to numpy array
-                    image_embeds = outputs.cpu().numpy()[0]
+                image = self._load_image(validated_path)
                 
-                # Create image features dictionary
-                import os
-                image_features = {
-                    "image_path": os.path.abspath(validated_path),
-                    "embedding": image_embeds.tolist()
-                }
-                
-                # Generate a simple token for compatibility
-                tokens = ["image_embedding"]
-                
-                # Return structured result
-                return BridgeResult(
-                    tokens=tokens,
-                    image_features=image_features,
-                    multimodal_embeddings=image_embeds.tolist()
-                )
+                # Embed the image as a batch of one
+                return self._process_images([(validated_path, image)])[0]
                 
             except ImportError:
                 raise ImportError("PIL not installed. Install with: pip install 'bridgenlp[multimodal]' or manually install: pillow>=9.0.0")
             except Exception as e:
                 raise ValueError(f"Error processing image: {str(e)}")
     
-    def from_text(self, text: str) -> BridgeResult:
+    def from_image_batch(self, image_paths: List[str],
+                         batch_size: Optional[int] = None) -> List[BridgeResult]:
         """
-        Process text and return embedding results.
+        Embed several images, running the vision model once per chunk.
+        
+        Images are loaded and preprocessed on a thread pool while the
+        previous chunk is being embedded.
         
         Args:
-            text: Text to process
+            image_paths: List of paths to image files
+            batch_size: Images per forward pass (defaults to self.batch_size)
             
         Returns:
-            BridgeResult containing the processed information
+            List of BridgeResult objects, one per path. Paths that could not
+            be processed get an error result.
         """
         with self._measure_performance():
-            # Validate text input
-            text = validate_text_input(text)
-            
-            # Ensure model is loaded
-            if not self._model_loaded:
-                self._load_model_and_processor()
-            
-            import torch
-            
-            # Process text
-            inputs = self._processor(
-                text=[text],
-                return_tensors="pt",
-                padding=True
+            return self._map_image_batches(
+                image_paths, batch_size or self.batch_size, self._process_images,
+                prepare=self._prepare_inputs
             )
+    
+    def _process_images(self, items: List[Tuple[str, Any]],
+                        inputs: Optional[Any] = None) -> List[BridgeResult]:
+        """
+        Embed already loaded images with a single forward pass.
+        
+        Args:
+            items: List of (path, image) pairs from _load_image
+            inputs: Inputs for the images from _prepare_inputs, if already built
             
-            # Move to device if needed
-            if self.device_idx >= 0 and torch.cuda.is_available():
-                inputs = {k: v.to(f"cuda:{self.device_idx}") for k, v in inputs.items()}
-            
-            # Get embeddings
-            with torch.no_grad():
-                outputs = self._model.get_text_features(**inputs)
+        Returns:
+            List of BridgeResult objects, one per pair
+        """
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        if inputs is None:
+            inputs = self._prepare_inputs([image for _, image in items])
+        
+        # Get embeddings, one row per image
+        if self.use_onnx:
+            image_embeds = self._run_onnx("visual", inputs)
+        else:
+            with self._inference_context():
+                outputs = self._model.get_image_features(**self._to_device(inputs))
                 
                 # Normalize if requested
                 if self.normalize:
                     outputs = outputs / outputs.norm(dim=-1, keepdim=True)
                 
                 # Convert to numpy array
-                text_embeds = outputs.cpu().numpy()[0]
+                image_embeds = outputs.float().cpu().numpy()
+        
+        results = []
+        for (path, _), embedding in zip(items, image_embeds):
+            embedding = embedding.tolist()
+            
+            # Generate a simple token for compatibility
+            results.append(BridgeResult(
+                tokens=["image_embedding"],
+                image_features={
+                    "image_path": os.path.abspath(path),
+                    "embedding": embedding
+                },
+                multimodal_embeddings=embedding
+            ))
+        return results
+    
+    def _prepare_inputs(self, images: List[Any]) -> Dict[str, Any]:
+        """
+        Turn loaded images into model inputs on the CPU.
+        
+        This only touches the processor, so batch processing runs it on the
+        image loading threads. When the model is on GPU the tensors are
+        pinned, which lets _to_device copy them without blocking.
+        
+        Args:
+            images: PIL images in RGB mode
+            
+        Returns:
+            Dictionary of input tensors
+        """
+        import torch
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        # ONNX Runtime takes numpy arrays directly
+        if self.use_onnx:
+            return dict(self._processor(images=images, return_tensors="np"))
+        
+        inputs = self._processor(images=images, return_tensors="pt")
+        if self.device_idx >= 0 and torch.cuda.is_available():
+            inputs = {k: v.pin_memory() for k, v in inputs.items()}
+        return inputs
+    
+    def _to_device(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Move prepared inputs to the adapter's device.
+        
+        Args:
+            inputs: Model inputs from _prepare_inputs
+            
+        Returns:
+            The same inputs on the adapter's device
+        """
+        import torch
+        
+        # Move to device if needed; copies from pinned memory are asynchronous
+        if self.device_idx < 0 or not torch.cuda.is_available():
+            return inputs
+        
+        device = f"cuda:{self.device_idx}"
+        return {k: v.to(device, non_blocking=True) for k, v in inputs.items()}
+    
+    def from_text(self, text: str) -> BridgeResult:
+        """
+        Process text and return embedding results.
+        
+        Args:
+            text: Text to process
+            
+        Returns:
+            BridgeResult containing the processed information
+        """
+        with self._measure_performance():
+            # Validate text input
+            text = validate_text_input(text)
+            
+            text_embeds = self._text_embedding(text)
             
             # Tokenize text
             tokens = text.split()
@@ -368,6 +468,184 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
                 multimodal_embeddings=text_embeds.tolist()
             )
     
+    def _text_embedding(self, text: str) -> Any:
+        """
+        Get the embedding of a text, running the text tower only on cache misses.
+        
+        Args:
+            text: Validated text
+            
+        Returns:
+            Numpy array with the text embedding
+        """
+        key = hash_text(text)
+        if self.embedding_cache_size > 0:
+            with self._embedding_cache_lock:
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+                    return cached
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        if self.use_onnx:
+            inputs = self._processor(text=[text], return_tensors="np", padding=True)
+            embedding = self._run_onnx("textual", inputs)[0]
+        else:
+            embedding = self._embed_text(text)
+        
+        if self.embedding_cache_size > 0:
+            with self._embedding_cache_lock:
+                self._embedding_cache[key] = embedding
+                while len(self._embedding_cache) > self.embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+        return embedding
+    
+    def _embed_text(self, text: str) -> Any:
+        """
+        Embed a text with the PyTorch model.
+        
+        Args:
+            text: Validated text
+            
+        Returns:
+            Numpy array with the text embedding
+        """
+        import torch
+        
+        # Process text
+        inputs = self._processor(
+            text=[text],
+            return_tensors="pt",
+            padding=True
+        )
+        
+        # Move to device if needed
+        if self.device_idx >= 0 and torch.cuda.is_available():
+            inputs = {k: v.to(f"cuda:{self.device_idx}") for k, v in inputs.items()}
+        
+        # Get embeddings
+        with self._inference_context():
+            outputs = self._model.get_text_features(**inputs)
+            
+            # Normalize if requested
+            if self.normalize:
+                outputs = outputs / outputs.norm(dim=-1, keepdim=True)
+            
+            # Convert to numpy array
+            return outputs.float().cpu().numpy()[0]
+    
+    def _run_onnx(self, tower: str, inputs: Dict[str, Any]) -> Any:
+        """
+        Embed inputs with an exported ONNX tower.
+        
+        Args:
+            tower: "visual" or "textual"
+            inputs: Processor outputs as numpy arrays
+            
+        Returns:
+            Numpy array of embeddings, one row per input
+        """
+        session = self._get_onnx_session(tower)
+        feed = {arg.name: np.asarray(inputs[arg.name]) for arg in session.get_inputs()}
+        embeds = session.run(None, feed)[0]
+        
+        # Normalize if requested
+        if self.normalize:
+            embeds = embeds / np.linalg.norm(embeds, axis=-1, keepdims=True)
+        return embeds
+    
+    def _get_onnx_session(self, tower: str) -> Any:
+        """
+        Get the ONNX Runtime session for a CLIP tower, exporting it on first use.
+        
+        The towers are exported to ``clip_visual.onnx`` and ``clip_textual.onnx``
+        under the ONNX cache directory, so later runs only load them.
+        
+        Args:
+            tower: "visual" or "textual"
+            
+        Returns:
+            onnxruntime.InferenceSession
+            
+        Raises:
+            ImportError: If onnxruntime is not installed
+        """
+        with self._onnx_lock:
+            session = self._onnx_sessions.get(tower)
+            if session is not None:
+                return session
+            
+            try:
+                import onnxruntime
+            except ImportError:
+                raise ImportError(
+                    "onnxruntime not installed. Install with: pip install 'bridgenlp[onnx]' "
+                    "or manually install: onnxruntime>=1.15 onnx>=1.14"
+                )
+            
+            model_dir = os.path.join(self.onnx_cache_dir, self.model_name.replace("/", "--"))
+            path = os.path.join(model_dir, f"clip_{tower}.onnx")
+            if not os.path.exists(path):
+                os.makedirs(model_dir, exist_ok=True)
+                self._export_onnx(tower, path)
+            
+            session = onnxruntime.InferenceSession(path, providers=["CPUExecutionProvider"])
+            self._onnx_sessions[tower] = session
+            return session
+    
+    def _export_onnx(self, tower: str, path: str) -> None:
+        """
+        Export the text or vision tower of the CLIP model to ONNX.
+        
+        Args:
+            tower: "visual" or "textual"
+            path: File to write the ONNX graph to
+        """
+        import torch
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        class Tower(torch.nn.Module):
+            def __init__(self, model, method):
+                super().__init__()
+                self.model = model
+                self.method = method
+            
+            def forward(self, *args):
+                return getattr(self.model, self.method)(*args)
+        
+        if tower == "visual":
+            size = self._model.config.vision_config.image_size
+            module = Tower(self._model, "get_image_features")
+            args = (torch.zeros(1, 3, size, size),)
+            input_names = ["pixel_values"]
+            dynamic_axes = {"pixel_values": {0: "batch"}}
+        else:
+            module = Tower(self._model, "get_text_features")
+            args = (torch.ones(1, 8, dtype=torch.long), torch.ones(1, 8, dtype=torch.long))
+            input_names = ["input_ids", "attention_mask"]
+            dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["embeds"] = {0: "batch"}
+        
+        logger.info(f"Exporting the {tower} tower of {self.model_name} to {path}")
+        
+        # Write to a temporary file first so an interrupted export is not picked up
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                module, args, tmp_path,
+                input_names=input_names,
+                output_names=["embeds"],
+                dynamic_axes=dynamic_axes,
+                opset_version=17
+            )
+        os.replace(tmp_path, path)
+    
     def from_tokens(self, tokens: List[str]) -> BridgeResult:
         """
         Process pre-tokenized text and return embedding results.
@@ -465,4 +743,7 @@ class MultimodalEmbeddingsBridge(MultimodalBridgeBase):
             self._model = None
             self._processor = None
             self._model_loaded = False
+            self._onnx_sessions = {}
+            with self._embedding_cache_lock:
+                self._embedding_cache.clear()
             free_memory()
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""
+Bridge adapter that captions images and detects objects in one pass.
+
+Running ImageCaptioningBridge and ObjectDetectionBridge separately reads
+and decodes every image twice and runs the two models one after the
+other. This adapter loads each image once and feeds the same decoded
+images to both models concurrently.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union, Any, Tuple
+
+try:
+    import spacy
+    from spacy.tokens import Doc
+except ImportError:
+    spacy = None
+    Doc = Any
+
+from ..config import BridgeConfig
+from ..multimodal_base import MultimodalBridgeBase
+from ..result import BridgeResult
+from .image_captioning import ImageCaptioningBridge
+from .object_detection import ObjectDetectionBridge
+
+
+class MultiTaskImageBridge(MultimodalBridgeBase):
+    """
+    Bridge adapter combining image captioning and object detection.
+    
+    Each result carries the captions and caption tokens of the captioning
+    model together with the objects found by the detection model. The
+    detection labels and spans are not carried over, since they index into
+    the object labels rather than the caption tokens; use
+    ``detected_objects`` or the ``image_features`` arrays instead.
+    """
+    
+    def __init__(self, captioning_model: str = "nlpconnect/vit-gpt2-image-captioning",
+                 detection_model: str = "facebook/detr-resnet-50",
+                 device: Union[int, str] = -1, config: Optional[BridgeConfig] = None):
+        """
+        Initialize the bridge adapter.
+        
+        Args:
+            captioning_model: Name or path of the image captioning model
+            detection_model: Name or path of the object detection model
+            device: Device to run the models on (-1 for CPU, >=0 for specific GPU, or "cuda"/"cpu")
+            config: Configuration for the adapter, shared by both models
+        """
+        super().__init__(config)
+        
+        # Explicit model names take precedence over config.model_name, so
+        # the shared config cannot point both children at the same model
+        self.captioning = ImageCaptioningBridge(
+            model_name=captioning_model, device=device, config=config
+        )
+        self.detection = ObjectDetectionBridge(
+            model_name=detection_model, device=device, config=config
+        )
+        
+        self.batch_size = config.batch_size if config and config.batch_size > 1 else 8
+    
+    def from_image(self, image_path: str) -> BridgeResult:
+        """
+        Caption an image and detect the objects in it.
+        
+        Args:
+            image_path: Path to the image file
+        
+        Returns:
+            BridgeResult containing captions and detected objects
+        
+        Raises:
+            ValueError: If the image path is invalid
+        """
+        validated_path = self.validate_image_path(image_path)
+        return self.from_image_batch([validated_path])[0]
+    
+    def from_image_batch(self, image_paths: List[str],
+                         batch_size: Optional[int] = None) -> List[BridgeResult]:
+        """
+        Caption several images and detect the objects in them.
+        
+        Every image is read once, and both processors prepare the next chunk
+        while the current one is in the models. Each chunk is passed to the
+        detection model on a worker thread while the captioning model runs
+        on the calling thread.
+        
+        Args:
+            image_paths: List of paths to image files
+            batch_size: Images per forward pass (defaults to self.batch_size)
+        
+        Returns:
+            List of BridgeResult objects, one per path. Paths that could not
+            be processed get an error result.
+        """
+        with self._measure_performance():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                def prepare(images: List[Any]) -> Tuple[Any, Any]:
+                    return (
+                        self.captioning._prepare_inputs(images),
+                        self.detection._prepare_inputs(images)
+                    )
+                
+                def process(items: List[Tuple[str, Any]],
+                            inputs: Tuple[Any, Any]) -> List[BridgeResult]:
+                    caption_inputs, detection_inputs = inputs
+                    detection = executor.submit(
+                        self.detection._process_images, items, detection_inputs
+                    )
+                    captions = self.captioning._process_images(items, caption_inputs)
+                    return [
+                        self._merge_results(caption, detected)
+                        for caption, detected in zip(captions, detection.result())
+                    ]
+                
+                results = self._map_image_batches(
+                    image_paths, batch_size or self.batch_size, process, prepare=prepare
+                )
+            
+            with self._metrics_lock:
+                self._metrics["total_tokens"] += sum(len(result.tokens) for result in results)
+            
+            return results
+    
+    def _merge_results(self, caption: BridgeResult, detected: BridgeResult) -> BridgeResult:
+        """
+        Combine the captioning and detection results for one image.
+        
+        Args:
+            caption: Result of the captioning model
+            detected: Result of the detection model
+        
+        Returns:
+            BridgeResult with the caption tokens and the detected objects
+        """
+        # Detection spans and labels index into the object labels, not the
+        # caption tokens, so only the objects themselves are carried over
+        image_features = dict(detected.image_features or {})
+        image_features.update(caption.image_features or {})
+        
+        return BridgeResult(
+            tokens=caption.tokens,
+            captions=caption.captions,
+            detected_objects=detected.detected_objects,
+            image_features=image_features
+        )
+    
+    def from_text(self, text: str) -> BridgeResult:
+        """
+        Process raw text and return results.
+        
+        This adapter primarily works with images, but implements this method
+        for compatibility with the base interface.
+        
+        Args:
+            text: Raw text to process (interpreted as an image path)
+        
+        Returns:
+            BridgeResult containing processed information
+        """
+        # Attempt to interpret the text as an image path
+        if os.path.exists(text) and os.path.isfile(text):
+            return self.from_image(text)
+        else:
+            # Return a minimal result with tokens and a warning
+            tokens = text.split()
+            return BridgeResult(
+                tokens=tokens,
+                labels=["warning: text-only input to multi-task image model"]
+            )
+    
+    def from_tokens(self, tokens: List[str]) -> BridgeResult:
+        """
+        Process pre-tokenized text and return results.
+        
+        This adapter primarily works with images, but implements this method
+        for compatibility with the base interface.
+        
+        Args:
+            tokens: List of pre-tokenized strings
+        
+        Returns:
+            BridgeResult containing processed information
+        """
+        # Reconstruct text from tokens
+        text = " ".join(tokens)
+        return self.from_text(text)
+    
+    def from_spacy(self, doc: Doc) -> Doc:
+        """
+        Process a spaCy Doc and return an enhanced Doc with image results.
+        
+        This method assumes the Doc has a custom attribute with the image path.
+        If not, it falls back to using the Doc text as a potential image path.
+        
+        Args:
+            doc: spaCy Doc object to process
+        
+        Returns:
+            The same Doc with additional image attributes attached
+        """
+        with self._measure_performance():
+            # Check for custom image path attribute
+            image_path = None
+            if hasattr(doc._, "image_path") and doc._.image_path:
+                image_path = doc._.image_path
+            else:
+                # Try to interpret the text as an image path
+                text = doc.text
+                if os.path.exists(text) and os.path.isfile(text):
+                    image_path = text
+            
+            # Process the image if found, otherwise just return the original doc
+            if image_path:
+                result = self.from_image(image_path)
+            else:
+                # Create minimal result with a warning
+                result = BridgeResult(
+                    tokens=[token.text for token in doc],
+                    labels=["warning: no image path found for multi-task image model"]
+                )
+            return result.attach_to_spacy(doc)
+    
+    def from_audio(self, audio_path: str) -> BridgeResult:
+        """
+        Process an audio file and return structured results.
+        
+        This adapter doesn't support audio processing, so it returns an error result.
+        
+        Args:
+            audio_path: Path to the audio file
+        
+        Returns:
+            BridgeResult containing an error message
+        """
+        # Validate path exists but return an error result
+        self.validate_audio_path(audio_path)
+        
+        return BridgeResult(
+            tokens=["audio_not_supported"],
+            labels=["warning: audio processing not supported by multi-task image model"]
+        )
+    
+    def from_text_and_image(self, text: str, image_path: str) -> BridgeResult:
+        """
+        Process text and image together and return results.
+        
+        For this adapter, we ignore the text and just process the image.
+        
+        Args:
+            text: Text to process (ignored in this implementation)
+            image_path: Path to the image file
+        
+        Returns:
+            BridgeResult containing the processed information
+        """
+        return self.from_image(image_path)
+    
+    def cleanup(self):
+        """
+        Clean up resources used by both models.
+        """
+        self.captioning.cleanup()
+        self.detection.cleanup()
@@ -27,7 +27,10 @@ from ..utils import (
     configure_device, 
     get_param_with_fallback, 
     get_or_create_model,
-    create_model_key
+    create_model_key,
+    configure_precision,
+    configure_attention,
+    load_pretrained
 )
 
 
@@ -61,9 +64,24 @@ class ObjectDetectionBridge(MultimodalBridgeBase):
         self.device = get_param_with_fallback(device, config, "device", default_value=-1)
         self.device_idx = configure_device(self.device)
         
+        # Reduced precision on GPU (None keeps the model in float32)
+        self.dtype = get_param_with_fallback(None, config, "dtype", default_value="fp16")
+        self.torch_dtype = configure_precision(
+            self.dtype, self.device_idx,
+            allow_tf32=get_param_with_fallback(None, config, "allow_tf32", default_value=False)
+        )
+        
+        # Attention kernels to load the model with (None keeps the model default)
+        self.attn_implementation = configure_attention(
+            get_param_with_fallback(None, config, "attn_implementation"), self.device_idx
+        )
+        
         # Additional parameters from config
         self.threshold = get_param_with_fallback(0.9, config, "params", "threshold", 0.9)
         
+        # from_image_batch always batches, so a batch_size of 1 means "use the default"
+        self.batch_size = config.batch_size if config and config.batch_size > 1 else 8
+        
         # For image size, handle both tuple and dict formats
         default_size = (800, 800)  # (height, width)
         if config and config.image_size:
@@ -88,6 +106,10 @@ class ObjectDetectionBridge(MultimodalBridgeBase):
         
         # Create a unique key for this model in the registry
         self.model_key = create_model_key(self.model_name, "object_detection", self.device_idx)
+        if self.torch_dtype is not None:
+            self.model_key += f"_{self.dtype}"
+        if self.attn_implementation is not None:
+            self.model_key += f"_{self.attn_implementation}"
     
     def _load_model_and_processor(self):
         """
@@ -104,7 +126,10 @@ class ObjectDetectionBridge(MultimodalBridgeBase):
             def create_model_components():
                 # Load model and processor
                 processor = AutoFeatureExtractor.from_pretrained(self.model_name)
-                model = AutoModelForObjectDetection.from_pretrained(self.model_name)
+                model = load_pretrained(
+                    AutoModelForObjectDetection, self.model_name, self.attn_implementation,
+                    torch_dtype=self.torch_dtype
+                )
                 
                 # Move to device
                 if (self.device_idx >= 0 and torch.cuda.is_available()):
@@ -162,20 +187,71 @@ class ObjectDetectionBridge(MultimodalBridgeBase):
             # Open image
             image = Image.open(image_path).convert("RGB")
             
-            # Process image
-            inputs = self._processor(images=image, return_tensors="pt")
-            
-            # Move to device if needed
-            if self.device_idx >= 0 and torch.cuda.is_available():
-                inputs = {k: v.to(f"cuda:{self.device_idx}") for k, v in inputs.items()}
-            
-            return inputs, image.size
+            return self._encode_images([image]), image.size
                 
         except ImportError:
             raise ImportError("PIL not installed. Install with: pip install 'bridgenlp[multimodal]' or manually install: pillow>=9.0.0")
         except Exception as e:
             raise ValueError(f"Error processing image: {str(e)}")
     
+    def _encode_images(self, images: List[Any]) -> Dict[str, Any]:
+        """
+        Turn loaded images into model inputs on the adapter's device.
+        
+        Args:
+            images: PIL images in RGB mode
+            
+        Returns:
+            Dictionary of batched input tensors
+        """
+        return self._to_device(self._prepare_inputs(images))
+    
+    def _prepare_inputs(self, images: List[Any]) -> Dict[str, Any]:
+        """
+        Turn loaded images into batched input tensors on the CPU.
+        
+        This only touches the processor, so batch processing runs it on the
+        image loading threads. When the model is on GPU the tensors are
+        pinned, which lets _to_device copy them without blocking.
+        
+        Args:
+            images: PIL images in RGB mode
+            
+        Returns:
+            Dictionary of batched input tensors
+        """
+        import torch
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        # The processor pads the images to a common size and adds a pixel mask
+        inputs = self._processor(images=images, return_tensors="pt")
+        
+        if self.device_idx >= 0 and torch.cuda.is_available():
+            inputs = {k: v.pin_memory() for k, v in inputs.items()}
+        
+        return inputs
+    
+    def _to_device(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Move prepared inputs to the adapter's device.
+        
+        Args:
+            inputs: Dictionary of input tensors from _prepare_inputs
+            
+        Returns:
+            Dictionary of input tensors on the adapter's device
+        """
+        import torch
+        
+        # Move to device if needed; copies from pinned memory are asynchronous
+        if self.device_idx >= 0 and torch.cuda.is_available():
+            inputs = {k: v.to(f"cuda:{self.device_idx}", non_blocking=True) for k, v in inputs.items()}
+        
+        return inputs
+    
     def from_image(self, image_path: str) -> BridgeResult:
         """
         Process an image and return object detection results.
@@ -201,93 +277,187 @@ class ObjectDetectionBridge(MultimodalBridgeBase):
             inputs, original_size = self._preprocess_image(validated_path)
             
             # Run inference
-            import torch
-            
-            with torch.no_grad():
-                outputs = self._model(**inputs)
-            
-            # Post-process results
-            # The model returns logits and bounding boxes
-            probas = outputs.logits.softmax(-1)[0, :, :-1]
-            keep = probas.max(-1).values > self.threshold
+            detections = self._to_host(self._detect(inputs, [original_size]))
             
-            # Convert kept predictions to the original image size
-            target_sizes = torch.tensor([original_size])
-            if self.device_idx >= 0 and torch.cuda.is_available():
-                target_sizes = target_sizes.to(f"cuda:{self.device_idx}")
-                
-            boxes = outputs.pred_boxes[0, keep]
+            return self._build_result(validated_path, original_size, *detections[0])
+    
+    def from_image_batch(self, image_paths: List[str],
+                         batch_size: Optional[int] = None) -> List[BridgeResult]:
+        """
+        Detect objects in several images, running the model once per chunk.
+        
+        Images are loaded and preprocessed on a thread pool while the previous
+        chunk is being processed, and each chunk goes through the model as one
+        padded batch.
+        
+        Args:
+            image_paths: List of paths to image files
+            batch_size: Images per forward pass (defaults to self.batch_size)
             
-            # Convert from center format to (x1, y1, x2, y2)
-            img_h, img_w = target_sizes.unbind(1)
-            scale_fct = torch.stack([img_w, img_h, img_w, img_h], dim=1)
-            boxes = boxes * scale_fct
+        Returns:
+            List of BridgeResult objects, one per path. Paths that could not
+            be processed get an error result.
+        """
+        with self._measure_performance():
+            results = self._map_image_batches(
+                image_paths, batch_size or self.batch_size, self._process_images,
+                prepare=self._prepare_inputs
+            )
             
-            # Get class labels
-            prob_values, prob_indices = probas[keep].max(-1)
+            with self._metrics_lock:
+                self._metrics["total_tokens"] += sum(len(result.tokens) for result in results)
             
-            # Convert to Python lists
-            boxes = boxes.cpu().numpy()
-            prob_values = prob_values.cpu().numpy()
-            prob_indices = prob_indices.cpu().numpy()
+            return results
+    
+    def _process_images(self, items: List[Tuple[str, Any]],
+                        inputs: Optional[Dict[str, Any]] = None) -> List[BridgeResult]:
+        """
+        Detect objects in already loaded images with a single forward pass.
+        
+        Args:
+            items: List of (path, PIL image) pairs
+            inputs: Inputs for the images from _prepare_inputs, if already built
             
-            # Get object labels from the model's config
-            id2label = self._model.config.id2label
+        Returns:
+            List of BridgeResult objects, one per pair
+        """
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self._load_model_and_processor()
+        
+        if inputs is None:
+            inputs = self._prepare_inputs([image for _, image in items])
+        sizes = [image.size for _, image in items]
+        detections = self._to_host(self._detect(self._to_device(inputs), sizes))
+        
+        return [
+            self._build_result(path, size, *row)
+            for (path, _), size, row in zip(items, sizes, detections)
+        ]
+    
+    def _detect(self, inputs: Dict[str, Any], sizes: List[Tuple[int, int]]) -> Tuple[Any, Any, Any, Any]:
+        """
+        Run the model and post-process its output without leaving the device.
+        
+        Post-processing covers the whole batch at once, so the results are
+        copied to the host once per batch (see _to_host) rather than once
+        per image, and callers can keep chaining the tensors on the device.
+        
+        Args:
+            inputs: Model inputs on the adapter's device
+            sizes: Size of each original image as (width, height)
             
-            # Create list of detected objects
-            detected_objects = []
-            token_spans = []
-            labels = []
+        Returns:
+            Tuple of (scores, class ids, boxes, keep mask) tensors on the
+            adapter's device. Scores, class ids and the mask are (batch,
+            queries), boxes are (batch, queries, 4) in (x1, y1, x2, y2)
+            pixels of the original images.
+        """
+        import torch
+        
+        with self._inference_context():
+            outputs = self._model(**inputs)
+        
+        with torch.inference_mode():
+            # The model returns logits and bounding boxes
+            # Scores and boxes are post-processed in float32 even when the
+            # model ran in reduced precision
+            probas = outputs.logits.float().softmax(-1)[..., :-1]
+            scores, class_ids = probas.max(-1)
+            keep = scores > self.threshold
+            
+            # Convert from normalized (center x, center y, width, height) to
+            # (x1, y1, x2, y2) pixels of the original image
+            cx, cy, w, h = outputs.pred_boxes.float().unbind(-1)
+            size = torch.tensor(sizes, dtype=torch.float32, device=cx.device)
+            img_w, img_h = size[:, :1], size[:, 1:]  # PIL sizes are (width, height)
+            boxes = torch.stack([
+                (cx - w / 2) * img_w, (cy - h / 2) * img_h,
+                (cx + w / 2) * img_w, (cy + h / 2) * img_h
+            ], dim=-1)
+        
+        return scores, class_ids, boxes, keep
+    
+    def _to_host(self, detections: Tuple[Any, Any, Any, Any]) -> List[Tuple[Any, Any, Any]]:
+        """
+        Copy the kept detections of a batch to NumPy arrays.
+        
+        Args:
+            detections: Tuple returned by _detect
             
-            for i, (box, prob_idx, prob_val) in enumerate(zip(boxes, prob_indices, prob_values)):
-                x1, y1, x2, y2 = box.tolist()
-                label = id2label[prob_idx.item()]
-                confidence = prob_val.item()
-                
-                # Round coordinates to integers
-                x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-                
-                # Create object entry
-                obj = {
-                    "id": i,
-                    "label": label,
-                    "score": confidence,
-                    "box": [x1, y1, x2, y2]
-                }
-                
-                detected_objects.append(obj)
-                labels.append(label)
-                token_spans.append((i, i+1))  # Each object gets a token span
-            
-            # Create tokens from labels
-            tokens = labels
-            
-            # Create image features dictionary
-            import os
-            image_features = {
-                "image_path": os.path.abspath(validated_path),
-                "size": original_size,
-                "num_objects": len(detected_objects)
-            }
-            
-            # Generate a simple caption
-            if detected_objects:
-                caption = f"Image containing {', '.join(labels[:5])}"
-                if len(labels) > 5:
-                    caption += f" and {len(labels) - 5} other objects"
-                captions = [caption]
-            else:
-                captions = ["No objects detected in the image"]
+        Returns:
+            List of (scores, class ids, boxes) NumPy arrays, one per image
+        """
+        scores, class_ids, boxes, keep = (t.cpu().numpy() for t in detections)
+        return [
+            (scores[row][mask], class_ids[row][mask], boxes[row][mask])
+            for row, mask in enumerate(keep)
+        ]
+    
+    def _build_result(self, image_path: str, original_size: Tuple[int, int],
+                      scores: Any, class_ids: Any, boxes: Any) -> BridgeResult:
+        """
+        Build the result for the detections of one image.
+        
+        Args:
+            image_path: Path of the image
+            original_size: Size of the original image as (width, height)
+            scores: float32 scores of the kept detections
+            class_ids: Class ids of the kept detections
+            boxes: float32 (x1, y1, x2, y2) pixel boxes of the kept detections
             
-            # Return structured result
-            return BridgeResult(
-                tokens=tokens,
-                spans=token_spans,
-                labels=labels,
-                captions=captions,
-                detected_objects=detected_objects,
-                image_features=image_features
+        Returns:
+            BridgeResult containing detected objects. image_features also
+            holds them as parallel "labels", "scores" (float32, N) and
+            "boxes" (float32, N x 4) arrays.
+        """
+        # Get object labels from the model's config
+        id2label = self._model.config.id2label
+        labels = [id2label[class_id] for class_id in class_ids.tolist()]
+        
+        # Create list of detected objects, with coordinates rounded to integers
+        detected_objects = [
+            {"id": i, "label": label, "score": score, "box": box}
+            for i, (label, score, box) in enumerate(
+                zip(labels, scores.tolist(), boxes.astype(int).tolist())
             )
+        ]
+        token_spans = [(i, i + 1) for i in range(len(labels))]  # Each object gets a token span
+        
+        # Create tokens from labels
+        tokens = labels
+        
+        # Create image features dictionary. The detections are also kept as
+        # parallel arrays so callers can filter them with vectorized
+        # operations, e.g. image_features["scores"] >= 0.7
+        import os
+        image_features = {
+            "image_path": os.path.abspath(image_path),
+            "size": original_size,
+            "num_objects": len(detected_objects),
+            "labels": labels,
+            "scores": scores,
+            "boxes": boxes
+        }
+        
+        # Generate a simple caption
+        if detected_objects:
+            caption = f"Image containing {', '.join(labels[:5])}"
+            if len(labels) > 5:
+                caption += f" and {len(labels) - 5} other objects"
+            captions = [caption]
+        else:
+            captions = ["No objects detected in the image"]
+        
+        # Return structured result
+        return BridgeResult(
+            tokens=tokens,
+            spans=token_spans,
+            labels=labels,
+            captions=captions,
+            detected_objects=detected_objects,
+            image_features=image_features
+        )
     
     def from_text(self, text: str) -> BridgeResult:
         """
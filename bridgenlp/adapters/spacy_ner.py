@@ -7,6 +7,7 @@ import warnings
 from typing import Dict, List, Optional, Tuple, Union
 
 import spacy
+from spacy.language import Language
 from spacy.tokens import Doc
 
 from ..base import BridgeBase
@@ -22,16 +23,20 @@ class SpacyNERBridge(BridgeBase):
     framework, allowing for consistent access to entity information.
     """
     
-    def __init__(self, model_name: str = "en_core_web_sm", config: Optional[BridgeConfig] = None):
+    def __init__(self, model_name: str = "en_core_web_sm", config: Optional[BridgeConfig] = None,
+                 nlp: Optional[Language] = None):
         """
         Initialize the named entity recognition bridge.
         
         Args:
             model_name: Name of the spaCy model to use
             config: Configuration for the adapter
+            nlp: Already loaded spaCy pipeline to reuse instead of loading
+                 model_name again
         
         Raises:
             ImportError: If spaCy model is not installed
+            ValueError: If the pipeline has no NER component
         """
         # Always call the parent constructor first
         super().__init__(config)
@@ -47,6 +52,14 @@ class SpacyNERBridge(BridgeBase):
             elif isinstance(config.device, int) and config.device >= 0:
                 self.use_gpu = True
         
+        if nlp is not None:
+            # Share the caller's pipeline rather than loading a second copy
+            if "ner" not in nlp.pipe_names:
+                raise ValueError("The provided spaCy pipeline does not have an NER component")
+            self._nlp = nlp
+            self.model_name = f"{nlp.lang}_{nlp.meta.get('name', 'pipeline')}"
+            return
+        
         # Initialize model
         try:
             # Set GPU preference if requested
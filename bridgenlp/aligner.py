@@ -6,7 +6,9 @@ with special handling for various script types (Latin, CJK, Arabic, Cyrillic, et
 and improved performance for both small and large documents.
 """
 
+import collections
 import re
+import threading
 import time
 import warnings
 from typing import List, Optional, Tuple, Dict, Set, Union, Callable
@@ -187,6 +189,118 @@ class MockDoc:
 # This fixes the typing issue with Optional[Span]
 
 
+# Patterns shared by the tokenizers and normalizers, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_WORD_OR_PUNCT_RE = re.compile(r'\w+|[^\w\s]')
+_ARABIC_TOKEN_RE = re.compile(
+    r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]+|\w+|[^\w\s]'
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_cjk_char(char: str) -> bool:
+    """
+    Check whether a character is CJK, Hiragana, Katakana or Hangul.
+    
+    Args:
+        char: A single character
+        
+    Returns:
+        True if the Unicode name of the character marks it as CJK
+    """
+    try:
+        name = unicodedata.name(char).lower()
+    except (ValueError, TypeError):
+        return False
+    return 'cjk' in name or 'hiragana' in name or 'katakana' in name or 'hangul' in name
+
+
+@lru_cache(maxsize=4096)
+def _nfkd(token: str) -> str:
+    """
+    NFKD-normalize a token, caching the result.
+    
+    The similarity scorers compare the same segment tokens against many
+    candidate spans, so each token is normalized once instead of per span.
+    
+    Args:
+        token: Token text
+        
+    Returns:
+        Normalized token text
+    """
+    return unicodedata.normalize('NFKD', token)
+
+
+# Code point ranges counted as CJK even when the character name does not say so
+_CJK_RANGES = (
+    (0x4E00, 0x9FFF),   # CJK Unified Ideographs
+    (0x3040, 0x30FF),   # Hiragana and Katakana
+    (0xAC00, 0xD7AF),   # Hangul Syllables
+    (0x3400, 0x4DBF),   # CJK Unified Ideographs Extension A
+    (0x20000, 0x2A6DF), # CJK Unified Ideographs Extension B
+    (0x2A700, 0x2B73F), # CJK Unified Ideographs Extension C
+    (0x2B740, 0x2B81F), # CJK Unified Ideographs Extension D
+    (0x2B820, 0x2CEAF)  # CJK Unified Ideographs Extension E
+)
+
+
+# The aligner only needs tokens, so components of the pipelines it loads
+# itself are not loaded at all
+_UNUSED_PIPES = ["tok2vec", "tagger", "parser", "senter", "ner", "lemmatizer", "attribute_ruler"]
+
+# Bounds of the per-aligner cache of tokenized documents
+_DOC_CACHE_SIZE = 128
+_DOC_CACHE_MAX_CHARS = 10000
+
+# ASCII control characters have no Unicode name, so _char_script counts
+# them as 'other'; every other ASCII character is Latin or ignored
+_ASCII_CONTROL_RE = re.compile(r'[\x00-\x08\x0e-\x1f\x7f]')
+
+
+@lru_cache(maxsize=4096)
+def _char_script(char: str) -> Optional[str]:
+    """
+    Classify a single character by script.
+    
+    Texts draw on a small alphabet, so caching the result means the
+    Unicode name lookup runs once per distinct character instead of once
+    per character of every text.
+    
+    Args:
+        char: A single character
+        
+    Returns:
+        Script type ('latin', 'cjk', 'arabic', 'cyrillic', 'other'), or
+        None for whitespace, punctuation and non-letter symbols
+    """
+    if char in string.whitespace or char in string.punctuation:
+        return None
+    
+    # Get character name which includes script information
+    try:
+        name = unicodedata.name(char).lower()
+    except (ValueError, TypeError):
+        # If we can't get the name, count as other
+        return 'other'
+    
+    # Detect script type based on character properties
+    if 'latin' in name or 'ascii' in name:
+        return 'latin'
+    # CJK detection - use both name and code point range check
+    if ('cjk' in name or 'hiragana' in name or 'katakana' in name or
+            'hangul' in name or 'ideograph' in name or
+            any(start <= ord(char) <= end for start, end in _CJK_RANGES)):
+        return 'cjk'
+    if 'arabic' in name or 'hebrew' in name:
+        return 'arabic'
+    if 'cyrillic' in name:
+        return 'cyrillic'
+    if unicodedata.category(char).startswith('L'):  # Letter category
+        return 'other'
+    return None
+
+
 class TokenAligner:
     """Utility for aligning tokens between different tokenization schemes with improved performance."""
 
@@ -199,7 +313,7 @@ class TokenAligner:
             default_language: Default spaCy model name (default: 'en_core_web_sm')
         """
         # Set memory cleanup interval
-        self._last_cleanup = time.time()
+        self._last_cleanup = time.monotonic()
         self._cleanup_interval = 300  # 5 minutes
         self.nlp = nlp
         self.default_language = default_language
@@ -207,6 +321,10 @@ class TokenAligner:
         self._language_models = {}  # Cache for language models
         self._script_handlers = {}  # Cache for script-specific handlers
         
+        # LRU cache of tokenized documents keyed by (text, language)
+        self._doc_cache = collections.OrderedDict()
+        self._doc_cache_lock = threading.Lock()
+        
         # Initialize script-specific handlers
         self._init_script_handlers()
         
@@ -222,7 +340,7 @@ class TokenAligner:
                 )
         elif HAS_SPACY:  # Try to load default model if spaCy is available
             try:
-                self.nlp = spacy.load(default_language)
+                self.nlp = spacy.load(default_language, exclude=_UNUSED_PIPES)
                 self._has_spacy = True
                 self._language_models[default_language] = self.nlp
             except OSError:
@@ -232,7 +350,7 @@ class TokenAligner:
                     from spacy.cli import download
                     print(f"Downloading spaCy model '{default_language}'... (this may take a moment)")
                     download(default_language)
-                    self.nlp = spacy.load(default_language)
+                    self.nlp = spacy.load(default_language, exclude=_UNUSED_PIPES)
                     self._has_spacy = True
                     self._language_models[default_language] = self.nlp
                     print(f"Successfully downloaded and loaded spaCy model '{default_language}'")
@@ -303,6 +421,10 @@ class TokenAligner:
         """
         Get a spaCy Doc object or MockDoc if spaCy is unavailable.
         
+        Alignment only looks at tokens, so only the tokenizer is run.
+        Documents are cached, since the same source and target texts are
+        aligned against many segments; long texts bypass the cache.
+        
         Args:
             text: Input text
             lang: Language code, defaults to instance default
@@ -312,20 +434,48 @@ class TokenAligner:
         """
         lang = lang or self.default_language
         
+        if len(text) > _DOC_CACHE_MAX_CHARS:
+            return self._make_doc(text, lang)
+        
+        key = (text, lang)
+        with self._doc_cache_lock:
+            doc = self._doc_cache.get(key)
+            if doc is not None:
+                self._doc_cache.move_to_end(key)
+                return doc
+        
+        doc = self._make_doc(text, lang)
+        with self._doc_cache_lock:
+            self._doc_cache[key] = doc
+            while len(self._doc_cache) > _DOC_CACHE_SIZE:
+                self._doc_cache.popitem(last=False)
+        return doc
+    
+    def _make_doc(self, text: str, lang: str) -> MockDoc:
+        """
+        Tokenize a text into a spaCy Doc, or a MockDoc if spaCy is unavailable.
+        
+        Args:
+            text: Input text
+            lang: Language code
+        
+        Returns:
+            A spaCy Doc or MockDoc
+        """
         if not self._has_spacy:
             return self._mock_doc(text, lang=lang)
             
         # Use cached language model or load new one
         if lang not in self._language_models:
             try:
-                self._language_models[lang] = spacy.load(f"{lang}_core_web_sm")
+                self._language_models[lang] = spacy.load(f"{lang}_core_web_sm", exclude=_UNUSED_PIPES)
             except OSError:
                 warnings.warn(
                     f"Could not load spaCy model for language '{lang}'. Using default."
                 )
                 lang = self.default_language
                 
-        return self._language_models[lang](text)
+        return self._language_models[lang].make_doc(text)
 
     def _mock_doc(self, text: str, lang: str = None) -> MockDoc:
         """Create a mock spaCy Doc."""
@@ -447,14 +597,10 @@ class TokenAligner:
         if not text:
             return []
             
-        # For Latin scripts, split on whitespace and separate punctuation
-        tokens = []
-        for word in text.split():
-            # Extract words and punctuation as separate tokens
-            word_tokens = re.findall(r'\w+|[^\w\s]', word)
-            tokens.extend([t for t in word_tokens if t.strip()])
-            
-        return tokens
+        # For Latin scripts, split into words and separate punctuation. Neither
+        # alternative matches whitespace, so one pass over the whole text gives
+        # the same tokens as splitting on whitespace first.
+        return _WORD_OR_PUNCT_RE.findall(text)
     
     def _tokenize_cjk(self, text: str, lang: str = None) -> List[str]:
         """
@@ -476,18 +622,7 @@ class TokenAligner:
         current_token = ""
         for char in text:
             # Check if this is a CJK character
-            is_cjk = False
-            try:
-                char_name = unicodedata.name(char).lower()
-                if ('cjk' in char_name or 
-                    'hiragana' in char_name or 
-                    'katakana' in char_name or 
-                    'hangul' in char_name):
-                    is_cjk = True
-            except (ValueError, TypeError):
-                pass
-                
-            if is_cjk:
+            if _is_cjk_char(char):
                 # Add any accumulated non-CJK characters
                 if current_token:
                     tokens.append(current_token)
@@ -531,7 +666,7 @@ class TokenAligner:
         
         # Then separate by whitespace and extract words/punctuation
         tokens = []
-        for token in re.findall(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]+|\w+|[^\w\s]', normalized):
+        for token in _ARABIC_TOKEN_RE.findall(normalized):
             if token.strip():
                 tokens.append(token)
                 
@@ -568,7 +703,7 @@ class TokenAligner:
             Normalized text
         """
         # Clean whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # Convert to lowercase for better matching
         return text.lower()
@@ -585,7 +720,7 @@ class TokenAligner:
             Normalized text
         """
         # Clean whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # For CJK, use NFKC normalization to handle full/half-width character differences
         # but preserve case (case is generally not relevant in CJK)
@@ -603,7 +738,7 @@ class TokenAligner:
             Normalized text
         """
         # Clean whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # For Arabic, use NFKD normalization
         # Arabic needs specialized handling for vowel marks and ligatures
@@ -621,7 +756,7 @@ class TokenAligner:
             Normalized text
         """
         # Clean whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # Use NFD normalization to handle diacritics and basic forms
         return unicodedata.normalize('NFD', text)
@@ -637,8 +772,8 @@ class TokenAligner:
         """Specialized alignment for CJK texts."""
         # Special handling for character-based languages
         # Remove spaces for more flexible matching since CJK doesn't rely on spaces
-        clean_doc_text = re.sub(r'\s+', '', doc.text)
-        clean_search_segment = re.sub(r'\s+', '', text_segment)
+        clean_doc_text = _WHITESPACE_RE.sub('', doc.text)
+        clean_search_segment = _WHITESPACE_RE.sub('', text_segment)
         
         start_char = clean_doc_text.find(clean_search_segment)
         if start_char >= 0:
@@ -698,11 +833,11 @@ class TokenAligner:
         if span_token_count < 1 or segment_token_count < 1:
             return 0.0
             
-        # Calculate token overlap
-        common_count = 0
-        for token in segment_tokens:
-            if token.lower() in span_tokens:
-                common_count += 1
+        # Calculate token overlap (set lookups instead of scanning the span
+        # for every segment token)
+        segment_lower = [token.lower() for token in segment_tokens]
+        span_token_set = set(span_tokens)
+        common_count = sum(1 for token in segment_lower if token in span_token_set)
                 
         base_score = common_count / max(span_token_count, segment_token_count)
         
@@ -711,9 +846,8 @@ class TokenAligner:
         max_check = min(span_token_count, segment_token_count, 5)  # Check first 5 tokens max
         
         for i in range(max_check):
-            if i < span_token_count and i < segment_token_count:
-                if span_tokens[i] == segment_tokens[i].lower():
-                    position_bonus += 0.05
+            if span_tokens[i] == segment_lower[i]:
+                position_bonus += 0.05
                     
         return base_score + position_bonus
     
@@ -794,13 +928,8 @@ class TokenAligner:
             
         # Calculate normalized token overlap
         # Arabic needs normalization to handle different forms of the same character
-        normalized_span = [unicodedata.normalize('NFKD', t) for t in span_tokens]
-        normalized_segment = [unicodedata.normalize('NFKD', t) for t in segment_tokens]
-        
-        common_count = 0
-        for token in normalized_segment:
-            if token in normalized_span:
-                common_count += 1
+        normalized_span = {_nfkd(t) for t in span_tokens}
+        common_count = sum(1 for t in segment_tokens if _nfkd(t) in normalized_span)
                 
         # More lenient scoring for Arabic
         return common_count / max(span_token_count, segment_token_count)
@@ -827,6 +956,11 @@ class TokenAligner:
         # Clear the LRU cache for normalize_text
         if hasattr(self, '_normalize_text'):
             self._normalize_text.cache_clear()
+        
+        # Clear the tokenized document cache
+        if hasattr(self, '_doc_cache'):
+            with self._doc_cache_lock:
+                self._doc_cache.clear()
             
         # Clear language models that aren't the default
         if hasattr(self, '_language_models') and self.default_language in self._language_models:
@@ -839,7 +973,7 @@ class TokenAligner:
         
     def _maybe_cleanup(self):
         """Check if it's time to clean up resources and do so if needed."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self._last_cleanup > self._cleanup_interval:
             self.cleanup_resources()
             self._last_cleanup = current_time
@@ -858,6 +992,14 @@ class TokenAligner:
         """
         if not text:
             return 'latin'
+        
+        # Check a sample of the text (up to 100 characters)
+        sample = text[:100]
+        
+        # Printable ASCII can only count towards Latin, which also wins a
+        # tie at zero, so the common case skips the per-character loop
+        if sample.isascii() and not _ASCII_CONTROL_RE.search(sample):
+            return 'latin'
             
         # Create counters for different script types
         script_counts = {
@@ -868,43 +1010,10 @@ class TokenAligner:
             'other': 0
         }
         
-        # Check a sample of the text (up to 100 characters)
-        sample = text[:min(100, len(text))]
         for char in sample:
-            if char in string.whitespace or char in string.punctuation:
-                continue
-                
-            # Get character name which includes script information
-            try:
-                name = unicodedata.name(char).lower()
-                category = unicodedata.category(char)
-                
-                # Detect script type based on character properties
-                if 'latin' in name or 'ascii' in name:
-                    script_counts['latin'] += 1
-                # CJK detection - use both name and code point range check
-                elif ('cjk' in name or 'hiragana' in name or 'katakana' in name or 
-                      'hangul' in name or 'ideograph' in name or
-                      any(start <= ord(char) <= end for start, end in [
-                          (0x4E00, 0x9FFF),   # CJK Unified Ideographs
-                          (0x3040, 0x30FF),   # Hiragana and Katakana
-                          (0xAC00, 0xD7AF),   # Hangul Syllables
-                          (0x3400, 0x4DBF),   # CJK Unified Ideographs Extension A
-                          (0x20000, 0x2A6DF), # CJK Unified Ideographs Extension B
-                          (0x2A700, 0x2B73F), # CJK Unified Ideographs Extension C
-                          (0x2B740, 0x2B81F), # CJK Unified Ideographs Extension D
-                          (0x2B820, 0x2CEAF)  # CJK Unified Ideographs Extension E
-                      ])):
-                    script_counts['cjk'] += 1
-                elif 'arabic' in name or 'hebrew' in name:
-                    script_counts['arabic'] += 1
-                elif 'cyrillic' in name:
-                    script_counts['cyrillic'] += 1
-                elif category.startswith('L'):  # Letter category
-                    script_counts['other'] += 1
-            except (ValueError, TypeError):
-                # If we can't get the name, count as other
-                script_counts['other'] += 1
+            script = _char_script(char)
+            if script is not None:
+                script_counts[script] += 1
                 
         # Return the dominant script type - give double weight to CJK characters
         # because a single CJK character carries more semantic content than a Latin letter
@@ -931,7 +1040,7 @@ class TokenAligner:
             return self._normalize_text_uncached(text, lang)
             
         # Clean whitespace first
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         if not text:
             return ""
             
@@ -957,7 +1066,7 @@ class TokenAligner:
             Normalized text
         """
         # Clean whitespace first
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         if not text:
             return ""
             
@@ -1012,14 +1121,10 @@ class TokenAligner:
         elif script_type == 'arabic':
             # For Arabic and similar scripts, use special tokenization
             # For now, use a whitespace+punctuation approach
-            tokens = []
-            for token in re.findall(r'\w+|[^\w\s]', text):
-                if token.strip():
-                    tokens.append(token)
-            return tokens
+            return _WORD_OR_PUNCT_RE.findall(text)
         else:
             # For Latin and other scripts, default to space-based tokenization + punctuation
-            return [token for token in re.findall(r'\w+|[^\w\s]', text) if token.strip()]
+            return _WORD_OR_PUNCT_RE.findall(text)
     
     def fuzzy_align(self, doc, text_segment: str, lang: str = None, script_type: str = None) -> Optional[MockSpan]:
         """
@@ -1051,7 +1156,7 @@ class TokenAligner:
             return None
 
         # Clean and normalize text
-        clean_segment = re.sub(r"\s+", " ", text_segment).strip()
+        clean_segment = _WHITESPACE_RE.sub(' ', text_segment).strip()
         if not clean_segment:
             warnings.warn("Empty text segment for alignment after cleaning")
             return None
@@ -1083,8 +1188,8 @@ class TokenAligner:
         # since whitespace doesn't necessarily indicate word boundaries
         if script_type == 'cjk':
             # Remove all spaces for CJK exact matching since they may not be significant
-            clean_doc_text = re.sub(r'\s+', '', doc_text)
-            clean_search_segment = re.sub(r'\s+', '', clean_segment)
+            clean_doc_text = _WHITESPACE_RE.sub('', doc_text)
+            clean_search_segment = _WHITESPACE_RE.sub('', clean_segment)
             
             start_char = clean_doc_text.find(clean_search_segment)
             if start_char >= 0:
@@ -1125,13 +1230,8 @@ class TokenAligner:
                 end_char = start_char + len(clean_segment)
                 return self.align_char_span(doc, start_char, end_char)
 
-        # Get tokens using script-specific tokenization
-        if script_type in self._script_handlers:
-            segment_tokens = self._script_handlers[script_type]["tokenize"](clean_segment, lang)
-        else:
-            segment_tokens = self._script_handlers["other"]["tokenize"](clean_segment, lang)
-            
-        # Choose alignment strategy based on document size
+        # Choose alignment strategy based on document size. Each strategy
+        # tokenizes the segment in its own way, so it is not tokenized here
         doc_len = len(doc)
         
         # Use script-aware alignment strategies
@@ -1188,7 +1288,7 @@ class TokenAligner:
             if script_type == 'cjk':
                 segment_tokens = self._tokenize_by_script(text_segment, script_type)
             else:
-                segment_tokens = [t for t in re.findall(r'\w+|[^\w\s]', text_segment) if t.strip()]
+                segment_tokens = _WORD_OR_PUNCT_RE.findall(text_segment)
             
         if not segment_tokens:
             return None
@@ -1497,7 +1597,7 @@ class TokenAligner:
             if script_type == 'cjk':
                 segment_tokens = self._tokenize_by_script(text_segment, script_type)
             else:
-                segment_tokens = [t for t in re.findall(r'\w+|[^\w\s]', text_segment.lower()) if t.strip()]
+                segment_tokens = _WORD_OR_PUNCT_RE.findall(text_segment.lower())
             
         segment_len = len(segment_tokens)
         doc_len = len(doc)
@@ -1590,7 +1690,7 @@ class TokenAligner:
                 segment_tokens = self._tokenize_by_script(text_segment, script_type)
             else:
                 # For Latin and other scripts, use standard tokenization
-                segment_tokens = [t for t in re.findall(r'\w+|[^\w\s]', text_segment.lower()) if t.strip()]
+                segment_tokens = _WORD_OR_PUNCT_RE.findall(text_segment.lower())
             
         segment_len = len(segment_tokens)
         doc_len = len(doc)
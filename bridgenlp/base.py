@@ -3,24 +3,65 @@ Base abstract classes for BridgeNLP adapters.
 """
 
 from abc import ABC, abstractmethod
+from array import array
 import contextlib
 import threading
 import time
-from typing import Dict, List, Optional, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 
-try:
-    import spacy
+# spaCy is only needed for type hints here; importing it eagerly costs
+# hundreds of milliseconds for callers that never touch a Doc
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except ImportError:
-    # Provide a helpful error message but allow the module to be imported
-    print("Warning: spaCy not installed. Install with: pip install spacy")
-    spacy = None
-    Doc = Any
 
 from .config import BridgeConfig
 from .result import BridgeResult
 
 
+# Shared, stateless context manager used when metrics collection is disabled
+_NO_METRICS = contextlib.nullcontext()
+
+# Slots of BridgeBase._counters, the per-call metrics updated on every
+# measured call; kept in a flat int64 array to avoid dict lookups on the
+# hot path. Time is accumulated in integer nanoseconds so it never drifts.
+_CALLS = 0
+_TIME_NS = 1
+_ERRORS = 2
+_NUM_COUNTERS = 3
+
+
+class _PerformanceTimer:
+    """
+    Context manager that records call count, time, and errors for a bridge.
+    
+    Written as a plain class rather than a generator-based context manager
+    to avoid allocating a generator frame on every call.
+    """
+    
+    __slots__ = ("_bridge", "_start")
+    
+    def __init__(self, bridge: "BridgeBase"):
+        self._bridge = bridge
+        self._start = 0
+    
+    def __enter__(self):
+        bridge = self._bridge
+        # Thread-safe increment of call count
+        with bridge._metrics_lock:
+            bridge._counters[_CALLS] += 1
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.perf_counter_ns() - self._start
+        bridge = self._bridge
+        with bridge._metrics_lock:
+            if exc_type is not None:
+                bridge._counters[_ERRORS] += 1
+            bridge._counters[_TIME_NS] += elapsed
+        return False  # Don't suppress exceptions
+
+
 class BridgeBase(ABC):
     """
     Abstract base class for all bridge adapters.
@@ -37,11 +78,11 @@ class BridgeBase(ABC):
             config: Configuration for the adapter
         """
         self.config = config
+        # Call count, time and errors live in _counters (see _CALLS etc.);
+        # _metrics holds token counts and any adapter-specific metrics
+        self._counters = array("q", [0] * _NUM_COUNTERS)
         self._metrics = {
-            "num_calls": 0,
-            "total_time": 0.0,
-            "total_tokens": 0,
-            "errors": 0
+            "total_tokens": 0
         }
         self._metrics_lock = threading.RLock()
     
@@ -132,34 +173,19 @@ class BridgeBase(ABC):
         """
         return [self.from_spacy(doc) for doc in docs]
     
-    @contextlib.contextmanager
     def _measure_performance(self):
         """
         Context manager to measure performance metrics.
         
         This automatically tracks call count, processing time, and errors
-        for all processing methods.
-        """
-        if not hasattr(self, "config") or not self.config or not self.config.collect_metrics:
-            yield
-            return
-        
-        start_time = time.time()
-        
-        # Thread-safe increment of call count
-        with self._metrics_lock:
-            self._metrics["num_calls"] += 1
-        
-        try:
-            yield
-        except Exception as e:
-            with self._metrics_lock:
-                self._metrics["errors"] += 1
-            raise e
-        finally:
-            elapsed = time.time() - start_time
-            with self._metrics_lock:
-                self._metrics["total_time"] += elapsed
+        for all processing methods. When metrics collection is disabled a
+        shared no-op context manager is returned, so the default path costs
+        a single attribute check per call.
+        """
+        config = getattr(self, "config", None)
+        if not config or not config.collect_metrics:
+            return _NO_METRICS
+        return _PerformanceTimer(self)
     
     def get_metrics(self) -> Dict[str, float]:
         """
@@ -169,7 +195,12 @@ class BridgeBase(ABC):
             Dictionary of metrics including average processing time
         """
         with self._metrics_lock:
-            metrics = dict(self._metrics)
+            metrics = {
+                "num_calls": self._counters[_CALLS],
+                "total_time": self._counters[_TIME_NS] * 1e-9,
+                "errors": self._counters[_ERRORS],
+            }
+            metrics.update(self._metrics)
         
         # Calculate derived metrics
         if metrics["num_calls"] > 0:
@@ -184,11 +215,9 @@ class BridgeBase(ABC):
     def reset_metrics(self) -> None:
         """Reset all performance metrics."""
         with self._metrics_lock:
+            self._counters = array("q", [0] * _NUM_COUNTERS)
             self._metrics = {
-                "num_calls": 0,
-                "total_time": 0.0,
-                "total_tokens": 0,
-                "errors": 0
+                "total_tokens": 0
             }
     
     def __enter__(self):
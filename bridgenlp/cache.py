@@ -0,0 +1,163 @@
+"""
+Persistent result cache for BridgeNLP pipelines.
+
+This module provides a disk-backed store for BridgeResult objects so that
+cached results survive process restarts and can be shared between worker
+processes on the same machine. It is used as the second tier behind the
+in-memory LRU cache of Pipeline.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Callable, Optional
+
+from .result import BridgeResult
+
+# Bytes read at a time when hashing a file
+_DIGEST_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash the contents of a file, for keying results computed from it.
+
+    Unlike a path or modification time, the digest stays valid when a
+    file is moved or copied and changes when its bytes do.
+
+    Args:
+        path: Path of the file to hash
+
+    Returns:
+        Hex BLAKE2b digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PersistentCache:
+    """
+    SQLite-backed key/value store for pipeline results.
+
+    Results are pickled, so only point the cache at a file you trust.
+    Once the store holds more than ``max_entries`` results the oldest
+    entries are evicted first.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        """
+        Open (or create) a persistent cache.
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of results to keep on disk
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        dir_path = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_path, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL lets readers in other processes proceed while one process writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "key TEXT UNIQUE NOT NULL, "
+            "value BLOB NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[BridgeResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached result, or None if the key is not present
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def set(self, key: str, result: BridgeResult) -> None:
+        """
+        Store a result, evicting the oldest entries if the cache is full.
+
+        Args:
+            key: Cache key
+            result: Result to store
+        """
+        value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-inserting moves the key to the newest position
+                self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                cursor = self._conn.execute(
+                    "INSERT INTO results (key, value) VALUES (?, ?)", (key, value)
+                )
+                self._conn.execute(
+                    "DELETE FROM results WHERE id <= ?",
+                    (cursor.lastrowid - self.max_entries,)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_or_compute(self, key: str, compute: Callable[[], BridgeResult]) -> BridgeResult:
+        """
+        Look up a cached result, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Function producing the result when it is not cached
+
+        Returns:
+            The cached or freshly computed result
+        """
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.set(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
@@ -283,7 +283,7 @@ def process_stream(bridge: BridgeBase, input_stream: TextIO,
     if show_progress:
         pbar = tqdm(total=total_lines, desc="Processing", unit="texts")
     
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     processed_count = 0
     
     try:
@@ -337,7 +337,7 @@ def process_stream(bridge: BridgeBase, input_stream: TextIO,
             pbar.close()
     
     # Print summary statistics
-    elapsed_time = time.time() - start_time
+    elapsed_time = (time.perf_counter_ns() - start_time) * 1e-9
     if processed_count > 0 and show_progress:
         print(f"Processed {processed_count} texts in {elapsed_time:.4f}s "
               f"({processed_count / elapsed_time:.2f} texts/sec)" if elapsed_time > 0 else
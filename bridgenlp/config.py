@@ -33,6 +33,12 @@ class BridgeConfig:
     max_length: Optional[int] = None
     use_threading: bool = False
     num_threads: int = 4
+    torch_threads: Optional[int] = None  # PyTorch CPU threads (None: one per physical core)
+    # Precision on GPU: "fp16", "bf16" or "fp32" (None: fp16 for image models, fp32 for
+    # text generation; CPU always uses fp32)
+    dtype: Optional[str] = None
+    attn_implementation: Optional[str] = None  # "eager", "sdpa" or "flash_attention_2" (None: model default)
+    allow_tf32: bool = False  # Let float32 matmuls use TF32 on GPU (a process-wide PyTorch setting)
     
     # Resource management
     unload_on_del: bool = True
@@ -40,6 +46,8 @@ class BridgeConfig:
     
     # Result caching
     cache_results: bool = False  # Enable result caching for pipelines
+    persistent_cache_path: Optional[str] = None  # SQLite file backing the result cache on disk
+    persistent_cache_size: int = 100000  # Maximum number of results kept on disk
     
     # Metrics collection
     collect_metrics: bool = False
@@ -47,6 +55,9 @@ class BridgeConfig:
     # Pipeline options
     pipeline_parallel: bool = False  # Run pipeline stages in parallel when possible
     pipeline_timeout: Optional[float] = None  # Timeout for pipeline operations in seconds
+    max_batch_size: int = 1  # Coalesce concurrent async calls into batches of up to this size
+    max_latency: float = 0.005  # Longest time in seconds a call waits for its batch to fill
+    pipeline_depth: int = 4  # Items buffered between stages by AsyncPipeline.stream
     
     # Image processing options
     image_size: Optional[Dict[str, int]] = None  # e.g., {"height": 224, "width": 224}
@@ -88,6 +99,7 @@ class BridgeConfig:
         # Environment variable overrides
         env_device = os.getenv("BRIDGENLP_DEVICE")
         env_batch_size = os.getenv("BRIDGENLP_BATCH_SIZE")
+        env_torch_threads = os.getenv("BRIDGENLP_TORCH_THREADS")
         if env_device is not None:
             config.device = env_device
         if env_batch_size is not None:
@@ -97,6 +109,13 @@ class BridgeConfig:
                 raise ValueError(
                     f"Invalid batch size in BRIDGENLP_BATCH_SIZE: {env_batch_size}"
                 )
+        if env_torch_threads is not None:
+            try:
+                config.torch_threads = int(env_torch_threads)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid thread count in BRIDGENLP_TORCH_THREADS: {env_torch_threads}"
+                )
         
         # Validate device
         if isinstance(config.device, str) and config.device not in ["cpu", "cuda", "-1"]:
@@ -8,8 +8,9 @@ and initialize bridge adapters.
 
 import json
 import os
+import re
 import sys
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 # Add the parent directory to the path so we can import bridgenlp
 # Need to add the parent of the parent directory to find the bridgenlp package
@@ -20,6 +21,37 @@ from bridgenlp.cli import load_bridge
 import spacy
 
 
+# Word lists for the mock sentiment bridge, built once at import time
+POSITIVE_WORDS = frozenset(["love", "amazing", "good", "great", "excellent"])
+NEGATIVE_WORDS = frozenset(["worst", "bad", "terrible", "awful", "hate"])
+_WORD_RE = re.compile(r"\w+")
+
+
+def _sentiment_label(words: Iterable[str]) -> str:
+    """
+    Score lowercase words against the sentiment word lists.
+    
+    Args:
+        words: Lowercase words to score
+        
+    Returns:
+        "POSITIVE", "NEGATIVE", or "NEUTRAL"
+    """
+    pos_count = 0
+    neg_count = 0
+    for word in words:
+        if word in POSITIVE_WORDS:
+            pos_count += 1
+        elif word in NEGATIVE_WORDS:
+            neg_count += 1
+    
+    if pos_count > neg_count:
+        return "POSITIVE"
+    if neg_count > pos_count:
+        return "NEGATIVE"
+    return "NEUTRAL"
+
+
 def main():
     """Run the configuration demo."""
     # Create a configuration programmatically
@@ -58,23 +90,8 @@ def main():
             # Use the context manager properly
             with self._measure_performance():
                 # Simple sentiment logic - just for demo
-                positive_words = ["love", "amazing", "good", "great", "excellent"]
-                negative_words = ["worst", "bad", "terrible", "awful", "hate"]
-                
-                text_lower = text.lower()
                 tokens = text.split()
-                
-                # Count positive and negative words
-                pos_count = sum(1 for word in positive_words if word in text_lower)
-                neg_count = sum(1 for word in negative_words if word in text_lower)
-                
-                # Determine sentiment
-                if pos_count > neg_count:
-                    label = "POSITIVE"
-                elif neg_count > pos_count:
-                    label = "NEGATIVE"
-                else:
-                    label = "NEUTRAL"
+                label = _sentiment_label(_WORD_RE.findall(text.lower()))
                 
                 # Update metrics
                 self._metrics["total_tokens"] += len(tokens)
@@ -86,25 +103,11 @@ def main():
         
         def from_tokens(self, tokens: List[str]) -> BridgeResult:
             with self._measure_performance():
-                text = " ".join(tokens)
-                # Don't call from_text which would double-count metrics
-                # Simple sentiment logic - just for demo
-                positive_words = ["love", "amazing", "good", "great", "excellent"]
-                negative_words = ["worst", "bad", "terrible", "awful", "hate"]
-                
-                text_lower = text.lower()
-                
-                # Count positive and negative words
-                pos_count = sum(1 for word in positive_words if word in text_lower)
-                neg_count = sum(1 for word in negative_words if word in text_lower)
-                
-                # Determine sentiment
-                if pos_count > neg_count:
-                    label = "POSITIVE"
-                elif neg_count > pos_count:
-                    label = "NEGATIVE"
-                else:
-                    label = "NEUTRAL"
+                # Don't call from_text which would double-count metrics; extract
+                # words from each token the same way so punctuation is ignored
+                label = _sentiment_label(
+                    word for token in tokens for word in _WORD_RE.findall(token.lower())
+                )
                 
                 # Update metrics
                 self._metrics["total_tokens"] += len(tokens)
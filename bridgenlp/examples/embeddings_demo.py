@@ -19,27 +19,27 @@ from bridgenlp import BridgeConfig
 from bridgenlp.adapters.hf_embeddings import HuggingFaceEmbeddingsBridge
 
 
-def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+def similarity_matrix(embeddings: List[List[float]], normalized: bool = False) -> np.ndarray:
     """
-    Calculate cosine similarity between two vectors.
+    Calculate pairwise cosine similarities between embeddings.
+    
+    Each vector is normalized once up front, after which all pairs are
+    computed with a single matrix product.
     
     Args:
-        vec1: First vector
-        vec2: Second vector
+        embeddings: List of embedding vectors
+        normalized: Whether the vectors are already unit length, in which
+            case the normalization step is skipped
         
     Returns:
-        Cosine similarity score
+        Square matrix where entry (i, j) is the cosine similarity of i and j
     """
-    vec1 = np.array(vec1)
-    vec2 = np.array(vec2)
-    norm1 = np.linalg.norm(vec1)
-    norm2 = np.linalg.norm(vec2)
-    
-    # Avoid division by zero
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
-        
-    return np.dot(vec1, vec2) / (norm1 * norm2)
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if not normalized:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Leave zero vectors as zeros to avoid division by zero
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms != 0)
+    return matrix @ matrix.T
 
 
 def main():
@@ -70,23 +70,23 @@ def main():
     
     print("Generating embeddings for example texts...")
     
-    # Process texts and store embeddings
-    embeddings = []
+    # Embed all texts in a single batched forward pass
     with bridge:
-        for text in texts:
-            result = bridge.from_text(text)
-            embedding = result.roles[0]["embedding"]
-            embeddings.append(embedding)
-            print(f"Text: {text}")
-            print(f"Embedding shape: {len(embedding)} dimensions")
-            print()
+        results = bridge.from_batch(texts)
+    
+    embeddings = [result.roles[0]["embedding"] for result in results]
+    for text, embedding in zip(texts, embeddings):
+        print(f"Text: {text}")
+        print(f"Embedding shape: {len(embedding)} dimensions")
+        print()
     
     # Calculate similarity matrix
     print("Similarity matrix:")
-    for i, emb1 in enumerate(embeddings):
-        for j, emb2 in enumerate(embeddings):
-            sim = cosine_similarity(emb1, emb2)
-            print(f"{i+1} vs {j+1}: {sim:.4f}", end="\t")
+    # The bridge already returns unit vectors when normalize is enabled
+    sims = similarity_matrix(embeddings, normalized=bridge.normalize)
+    for i in range(len(embeddings)):
+        for j in range(len(embeddings)):
+            print(f"{i+1} vs {j+1}: {sims[i, j]:.4f}", end="\t")
         print()
     
     # Print performance metrics
@@ -2,8 +2,11 @@
 Base abstract classes for BridgeNLP multimodal adapters.
 """
 
+import contextlib
+import importlib.util
 from abc import abstractmethod
-from typing import Dict, List, Optional, Tuple, Union, Any, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union, Any, BinaryIO
 
 try:
     import spacy
@@ -21,9 +24,10 @@ except ImportError:
     print("Warning: NumPy not installed. Install with: pip install numpy")
     np = None
 
-from .base import BridgeBase
+from .base import BridgeBase, _CALLS, _ERRORS
 from .config import BridgeConfig
 from .result import BridgeResult
+from .utils import inference_context
 
 
 class MultimodalBridgeBase(BridgeBase):
@@ -43,6 +47,26 @@ class MultimodalBridgeBase(BridgeBase):
         """
         super().__init__(config)
         self._model_loaded = False
+        
+        # Set by Pipeline.enable_model_cpu_offload
+        self._offload_hook = None
+    
+    @contextlib.contextmanager
+    def _inference_context(self):
+        """
+        Context manager for model forward passes.
+        
+        Disables autograd and, when the adapter was configured with a reduced
+        precision (``self.torch_dtype``), autocasts CUDA ops to it. If the
+        model is offloaded to the CPU, it is moved back to the GPU first.
+        """
+        # generate() and direct encoder calls bypass the offload hook on forward
+        offload_hook = getattr(self, "_offload_hook", None)
+        if offload_hook is not None:
+            offload_hook.hook.pre_forward(offload_hook.model)
+        
+        with inference_context(getattr(self, "torch_dtype", None)):
+            yield
     
     @abstractmethod
     def from_image(self, image_path: str) -> BridgeResult:
@@ -86,25 +110,169 @@ class MultimodalBridgeBase(BridgeBase):
                             self._metrics["total_tokens"] += len(result.tokens)
                 except Exception as e:
                     # Create an error result and continue processing the batch
-                    error_result = BridgeResult(
-                        tokens=["error"],
-                        labels=[f"Error processing {path}: {str(e)}"]
-                    )
-                    results.append(error_result)
-                    
-                    # Track the error in metrics
-                    if hasattr(self, "_metrics") and "errors" in self._metrics:
-                        with self._metrics_lock:
-                            self._metrics["errors"] += 1
+                    results.append(self._batch_error_result(path, e))
             
             # Correct the call count (batch = 1 call, not len(image_paths) calls)
-            if hasattr(self, "_metrics") and "num_calls" in self._metrics:
+            if hasattr(self, "_counters"):
                 with self._metrics_lock:
                     # Subtract len(image_paths)-1 since we added 1 in _measure_performance
-                    self._metrics["num_calls"] -= (len(image_paths) - 1)
+                    self._counters[_CALLS] -= (len(image_paths) - 1)
             
             return results
     
+    def _batch_error_result(self, path: str, error: Exception) -> BridgeResult:
+        """
+        Build the result for a batch item that failed and count the error.
+        
+        Args:
+            path: Path of the item that failed
+            error: The exception raised while processing it
+            
+        Returns:
+            BridgeResult describing the error
+        """
+        if hasattr(self, "_counters"):
+            with self._metrics_lock:
+                self._counters[_ERRORS] += 1
+        return BridgeResult(
+            tokens=["error"],
+            labels=[f"Error processing {path}: {str(error)}"]
+        )
+    
+    def _load_image(self, image_path: str) -> Any:
+        """
+        Open an image file for the model.
+        
+        Subclasses can override this to decode images another way, as long
+        as their processor accepts the result.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            The image as an RGB PIL image
+        """
+        from PIL import Image
+        
+        return Image.open(image_path).convert("RGB")
+    
+    def _iter_image_batches(self, image_paths: List[str], batch_size: int,
+                            prepare: Optional[Callable[[List[Any]], Any]] = None
+                            ) -> Iterator[Tuple[int, List[Any], Any]]:
+        """
+        Load images in chunks, reading the next chunk while the caller works.
+        
+        Images are opened with _load_image on a thread pool, so file I/O,
+        decoding and ``prepare`` for chunk n+1 overlap with model inference
+        on chunk n.
+        
+        Args:
+            image_paths: Paths of the images to load
+            batch_size: Number of images per chunk
+            prepare: Optional function turning the successfully loaded images
+                of a chunk into model inputs, run on the thread pool
+            
+        Yields:
+            Tuples of (offset of the chunk in image_paths, loaded images,
+            prepared inputs or None). An image that could not be loaded is
+            replaced by its exception, and so are the inputs if ``prepare``
+            raised.
+            
+        Raises:
+            ImportError: If PIL is not installed
+        """
+        if importlib.util.find_spec("PIL") is None:
+            raise ImportError("PIL not installed. Install with: pip install 'bridgenlp[multimodal]' or manually install: pillow>=9.0.0")
+        
+        def load(path):
+            try:
+                return self._load_image(path)
+            except Exception as e:
+                return e
+        
+        def load_chunk(futures):
+            # The loads were queued before this task, so waiting cannot deadlock
+            images = [future.result() for future in futures]
+            loaded = [image for image in images if not isinstance(image, Exception)]
+            try:
+                inputs = prepare(loaded) if prepare is not None and loaded else None
+            except Exception as e:
+                # Handed to the caller so only this chunk fails
+                inputs = e
+            return images, inputs
+        
+        with ThreadPoolExecutor(max_workers=min(batch_size, 8)) as executor:
+            def submit(start):
+                futures = [executor.submit(load, p) for p in image_paths[start:start + batch_size]]
+                return executor.submit(load_chunk, futures)
+            
+            pending = submit(0)
+            for start in range(0, len(image_paths), batch_size):
+                images, inputs = pending.result()
+                
+                # Start reading the next chunk before handing this one over
+                next_start = start + batch_size
+                if next_start < len(image_paths):
+                    pending = submit(next_start)
+                
+                yield start, images, inputs
+    
+    def _map_image_batches(self, image_paths: List[str], batch_size: int,
+                           process: Callable[[List[Tuple[str, Any]], Any], List[BridgeResult]],
+                           prepare: Optional[Callable[[List[Any]], Any]] = None
+                           ) -> List[BridgeResult]:
+        """
+        Run a batch function over images loaded in chunks.
+        
+        Paths are validated up front and images are read with
+        _iter_image_batches. Invalid paths and unreadable images get an
+        error result and never reach ``process``. If ``prepare`` or
+        ``process`` raises, every image of that chunk gets an error result.
+        
+        Args:
+            image_paths: Paths of the images to process
+            batch_size: Number of images per call to ``process``
+            process: Function mapping a list of (path, image) pairs and the
+                prepared inputs for those images to one result per pair
+            prepare: Optional function turning a list of images into model
+                inputs ahead of time (see _iter_image_batches)
+            
+        Returns:
+            List of BridgeResult objects, one per path
+        """
+        results = [None] * len(image_paths)
+        
+        valid = []
+        for index, path in enumerate(image_paths):
+            try:
+                valid.append((index, self.validate_image_path(path)))
+            except ValueError as e:
+                results[index] = self._batch_error_result(path, e)
+        
+        if valid:
+            paths = [path for _, path in valid]
+            for start, images, inputs in self._iter_image_batches(paths, batch_size, prepare):
+                loaded = []
+                for (index, path), image in zip(valid[start:start + batch_size], images):
+                    if isinstance(image, Exception):
+                        results[index] = self._batch_error_result(path, image)
+                    else:
+                        loaded.append((index, path, image))
+                if not loaded:
+                    continue
+                
+                try:
+                    if isinstance(inputs, Exception):
+                        raise inputs
+                    chunk_results = process([(path, image) for _, path, image in loaded], inputs)
+                except Exception as e:
+                    # A failed chunk only costs its own images, not the whole batch
+                    chunk_results = [self._batch_error_result(path, e) for _, path, _ in loaded]
+                for (index, _, _), result in zip(loaded, chunk_results):
+                    results[index] = result
+        
+        return results
+    
     @abstractmethod
     def from_audio(self, audio_path: str) -> BridgeResult:
         """
@@ -147,22 +315,13 @@ class MultimodalBridgeBase(BridgeBase):
                             self._metrics["total_tokens"] += len(result.tokens)
                 except Exception as e:
                     # Create an error result and continue processing the batch
-                    error_result = BridgeResult(
-                        tokens=["error"],
-                        labels=[f"Error processing {path}: {str(e)}"]
-                    )
-                    results.append(error_result)
-                    
-                    # Track the error in metrics
-                    if hasattr(self, "_metrics") and "errors" in self._metrics:
-                        with self._metrics_lock:
-                            self._metrics["errors"] += 1
+                    results.append(self._batch_error_result(path, e))
             
             # Correct the call count (batch = 1 call, not len(audio_paths) calls)
-            if hasattr(self, "_metrics") and "num_calls" in self._metrics:
+            if hasattr(self, "_counters"):
                 with self._metrics_lock:
                     # Subtract len(audio_paths)-1 since we added 1 in _measure_performance
-                    self._metrics["num_calls"] -= (len(audio_paths) - 1)
+                    self._counters[_CALLS] -= (len(audio_paths) - 1)
             
             return results
     
@@ -223,15 +382,15 @@ class MultimodalBridgeBase(BridgeBase):
                     results.append(error_result)
                     
                     # Track the error in metrics
-                    if hasattr(self, "_metrics") and "errors" in self._metrics:
+                    if hasattr(self, "_counters"):
                         with self._metrics_lock:
-                            self._metrics["errors"] += 1
+                            self._counters[_ERRORS] += 1
             
             # Correct the call count (batch = 1 call, not len(texts) calls)
-            if hasattr(self, "_metrics") and "num_calls" in self._metrics:
+            if hasattr(self, "_counters"):
                 with self._metrics_lock:
                     # Subtract len(texts)-1 since we added 1 in _measure_performance
-                    self._metrics["num_calls"] -= (len(texts) - 1)
+                    self._counters[_CALLS] -= (len(texts) - 1)
             
             return results
     
@@ -18,6 +18,7 @@ import os
 import threading
 import copy
 import collections
+import inspect
 from typing import Dict, List, Optional, Union, Any, Callable, TypeVar, Generic, Tuple, Set, Deque
 
 try:
@@ -29,7 +30,9 @@ except ImportError:
 
 from .base import BridgeBase
 from .config import BridgeConfig
-from .result import BridgeResult
+from .result import _EXT_DEFAULTS, BridgeResult, _register_extensions
+from .utils import hash_text, hash_tokens, token_texts
+from .cache import PersistentCache
 from .aligner import TokenAligner
 from .multimodal_base import MultimodalBridgeBase
 
@@ -84,20 +87,111 @@ class Pipeline(BridgeBase):
         # Cache for intermediate results with thread-safe implementation
         # This improves performance for repeated calls with the same text
         self._cache_enabled = config.cache_results if config and hasattr(config, "cache_results") else False
-        self._cache = {}
-        # Use a thread-safe deque with maximum length for LRU cache management
+        # Insertion order of the OrderedDict doubles as the LRU order
+        self._cache = collections.OrderedDict()
         self._cache_size = config.cache_size if config and hasattr(config, "cache_size") else 100
-        self._cache_keys = collections.deque(maxlen=self._cache_size)
         self._cache_hits = 0
         self._cache_misses = 0
         self._cache_lock = threading.RLock()
         
+        # Optional second cache tier on disk, shared across processes and restarts
+        self._persistent_cache = None
+        if self._cache_enabled and config and config.persistent_cache_path:
+            self._persistent_cache = PersistentCache(
+                config.persistent_cache_path, config.persistent_cache_size
+            )
+            self._cache_namespace = self._fingerprint()
+        
         # Thread-safe conditions dictionary for conditional execution
         # Maps adapter index to a condition function that takes the previous result
         # and returns a boolean indicating whether to run the adapter
         with self._conditions_lock:
             self._conditions = {}
     
+    def _fingerprint(self) -> str:
+        """
+        Identify this pipeline's adapters and their settings.
+        
+        Used to namespace persistent cache keys so that pipelines built from
+        different models never read each other's results. Besides the config,
+        this covers the attributes named after constructor arguments, such as
+        the labels of a classification adapter.
+        
+        Returns:
+            Hex digest describing the adapter chain
+        """
+        parts = []
+        for adapter in self.adapters:
+            adapter_config = getattr(adapter, "config", None)
+            parts.append("|".join([
+                f"{type(adapter).__module__}.{type(adapter).__qualname__}",
+                str(getattr(adapter, "model_name", None)),
+                repr(sorted(adapter_config.to_dict().items(), key=lambda item: item[0]))
+                if adapter_config else "",
+                repr(self._constructor_state(adapter)),
+            ]))
+        return format(hash_text("\n".join(parts)), "016x")
+    
+    @staticmethod
+    def _constructor_state(adapter: BridgeBase) -> List[Tuple[str, Any]]:
+        """
+        Collect the adapter attributes that were set from constructor arguments.
+        
+        Only attributes sharing a name with a constructor argument and holding
+        plain values (strings, numbers and containers of them) are included,
+        since other objects have no repr that is stable across processes.
+        
+        Args:
+            adapter: Adapter in the pipeline
+            
+        Returns:
+            Sorted list of (name, value) pairs
+        """
+        def is_plain(value):
+            if value is None or isinstance(value, (str, int, float, bool)):
+                return True
+            if isinstance(value, (list, tuple)):
+                return all(is_plain(item) for item in value)
+            if isinstance(value, dict):
+                return all(is_plain(k) and is_plain(v) for k, v in value.items())
+            return False
+        
+        try:
+            names = inspect.signature(type(adapter).__init__).parameters
+        except (TypeError, ValueError):
+            return []
+        state = []
+        for name in sorted(names):
+            if name in ("self", "config") or not hasattr(adapter, name):
+                continue
+            value = getattr(adapter, name)
+            if is_plain(value):
+                state.append((name, value))
+        return state
+    
+    def _shared_cache(self) -> Optional[PersistentCache]:
+        """
+        Get the persistent cache tier, unless results must stay private.
+        
+        Condition functions cannot be identified across processes, so while
+        any condition is registered results are neither read from nor written
+        to the persistent tier; other pipelines would otherwise share results
+        computed with a different set of adapters skipped.
+        
+        Returns:
+            The persistent cache, or None
+        """
+        with self._conditions_lock:
+            if self._conditions:
+                return None
+        return self._persistent_cache
+    
+    @property
+    def _cache_keys(self) -> List[str]:
+        """Cache keys ordered from least to most recently used."""
+        with self._cache_lock:
+            return list(self._cache)
+    
     def from_text(self, text: str) -> BridgeResult:
         """
         Process raw text through the pipeline of adapters in a thread-safe manner.
@@ -127,7 +221,7 @@ class Pipeline(BridgeBase):
             with self._pipeline_lock:
                 try:
                     # Check cache if enabled
-                    cache_key = f"text:{hash(text)}"
+                    cache_key = f"text:{hash_text(text)}"
                     cached_result = self._check_cache(cache_key)
                     if cached_result:
                         # Return a copy of the cached result to prevent modifications
@@ -154,11 +248,11 @@ class Pipeline(BridgeBase):
                     skip_adapter = False
                     with self._conditions_lock:
                         if i in self._conditions:
-                            # Make a deep copy of combined_result for the condition function
-                            # to avoid external modifications during condition evaluation
-                            condition_result = copy.deepcopy(combined_result)
+                            # Snapshot combined_result unless the condition is read-only
+                            condition_fn = self._conditions[i]
+                            condition_result = self._condition_input(condition_fn, combined_result)
                             # If the condition returns False, skip this adapter
-                            if not self._conditions[i](condition_result):
+                            if not condition_fn(condition_result):
                                 skip_adapter = True
                     
                     if skip_adapter:
@@ -177,8 +271,8 @@ class Pipeline(BridgeBase):
                 # Cache the result if enabled (thread-safe method with internal locking)
                 self._update_cache(cache_key, combined_result)
                 
-                # Return deep copy to ensure the caller can't modify our cached data
-                return copy.deepcopy(combined_result)
+                # The cache keeps its own copy, so the result can be returned as is
+                return combined_result
                 
             except Exception as e:
                 # Handle processing errors
@@ -213,10 +307,8 @@ class Pipeline(BridgeBase):
             with self._pipeline_lock:
                 try:
                     # Check cache if enabled
-                    # Use a tuple of tokens for hashing (immutable)
-                    # Create a safe copy of tokens to avoid modification during hashing
-                    token_tuple = tuple(str(t) for t in tokens)
-                    cache_key = f"tokens:{hash(token_tuple)}"
+                    # Hash the joined tokens in one pass rather than building a tuple
+                    cache_key = f"tokens:{hash_tokens(tokens)}"
                     
                     cached_result = self._check_cache(cache_key)
                     if cached_result:
@@ -247,11 +339,11 @@ class Pipeline(BridgeBase):
                     skip_adapter = False
                     with self._conditions_lock:
                         if i in self._conditions:
-                            # Make a deep copy of combined_result for the condition function
-                            # to avoid external modifications during condition evaluation
-                            condition_result = copy.deepcopy(combined_result)
+                            # Snapshot combined_result unless the condition is read-only
+                            condition_fn = self._conditions[i]
+                            condition_result = self._condition_input(condition_fn, combined_result)
                             # If the condition returns False, skip this adapter
-                            if not self._conditions[i](condition_result):
+                            if not condition_fn(condition_result):
                                 skip_adapter = True
                     
                     if skip_adapter:
@@ -270,8 +362,8 @@ class Pipeline(BridgeBase):
                 # Cache the result if enabled (thread-safe method with internal locking)
                 self._update_cache(cache_key, combined_result)
                 
-                # Return deep copy to ensure the caller can't modify our cached data
-                return copy.deepcopy(combined_result)
+                # The cache keeps its own copy, so the result can be returned as is
+                return combined_result
                 
             except Exception as e:
                 # Handle processing errors
@@ -309,8 +401,8 @@ class Pipeline(BridgeBase):
                     # Hash the doc text and tokens
                     try:
                         # Create immutable values for hashing
-                        text_hash = hash(doc.text)
-                        tokens_hash = hash(tuple(t.text for t in doc))
+                        text_hash = hash_text(doc.text)
+                        tokens_hash = hash_tokens(token_texts(doc))
                         cache_key = f"spacy:{text_hash}:{tokens_hash}"
                     except Exception as e:
                         # If hashing fails, generate a unique cache key
@@ -337,29 +429,20 @@ class Pipeline(BridgeBase):
                     # Return the original doc unchanged
                     return doc
             
-            # Thread-safe extension registration
-            # Use a class-level lock for spaCy extension registration to avoid race conditions
-            # between different instances of the Pipeline class
-            with threading.RLock():
-                try:
-                    # Register the spaCy extensions if they don't exist yet to avoid None errors
-                    for ext_name in ["nlp_bridge_spans", "nlp_bridge_clusters", "nlp_bridge_roles", "nlp_bridge_labels",
-                                   "nlp_bridge_image_features", "nlp_bridge_audio_features", "nlp_bridge_multimodal_embeddings",
-                                   "nlp_bridge_detected_objects", "nlp_bridge_captions"]:
-                        if not Doc.has_extension(ext_name):
-                            Doc.set_extension(ext_name, default=None)
-                        # Initialize with empty containers if None
-                        if getattr(doc._, ext_name) is None:
-                            default_value = [] if ext_name not in ["nlp_bridge_image_features", "nlp_bridge_audio_features", "nlp_bridge_multimodal_embeddings"] else None
-                            setattr(doc._, ext_name, default_value)
-                except Exception as e:
-                    import warnings
-                    warnings.warn(f"Error registering spaCy extensions: {e}")
+            # Make sure the bridge extensions exist and start out empty
+            _register_extensions()
+            for ext_name, default in _EXT_DEFAULTS.items():
+                if getattr(doc._, ext_name) is None:
+                    setattr(doc._, ext_name, default())
             
             try:
+                # Adapters attach data to the Doc without retokenizing it, so
+                # the token texts are read once and copied into each result
+                tokens = token_texts(doc)
+                
                 # Create a combined result to hold data from all adapters
                 combined_result = BridgeResult(
-                    tokens=[t.text for t in doc],
+                    tokens=tokens,
                     spans=[],
                     clusters=[],
                     roles=[],
@@ -374,7 +457,7 @@ class Pipeline(BridgeBase):
                 # when accessing doc extensions
                 with self._result_lock:
                     first_result = BridgeResult(
-                        tokens=[t.text for t in doc],
+                        tokens=tokens[:],
                         spans=copy.deepcopy(doc._.nlp_bridge_spans) if doc._.nlp_bridge_spans else [],
                         clusters=copy.deepcopy(doc._.nlp_bridge_clusters) if doc._.nlp_bridge_clusters else [],
                         roles=copy.deepcopy(doc._.nlp_bridge_roles) if doc._.nlp_bridge_roles else [],
@@ -390,11 +473,11 @@ class Pipeline(BridgeBase):
                     skip_adapter = False
                     with self._conditions_lock:
                         if i in self._conditions:
-                            # Make a deep copy of combined_result for the condition function
-                            # to avoid external modifications during condition evaluation
-                            condition_result = copy.deepcopy(combined_result)
+                            # Snapshot combined_result unless the condition is read-only
+                            condition_fn = self._conditions[i]
+                            condition_result = self._condition_input(condition_fn, combined_result)
                             # If the condition returns False, skip this adapter
-                            if not self._conditions[i](condition_result):
+                            if not condition_fn(condition_result):
                                 skip_adapter = True
                     
                     if skip_adapter:
@@ -414,7 +497,7 @@ class Pipeline(BridgeBase):
                     # Use thread-safe deep copies to avoid race conditions
                     with self._result_lock:
                         adapter_result = BridgeResult(
-                            tokens=[t.text for t in doc],
+                            tokens=tokens[:],
                             spans=copy.deepcopy(doc._.nlp_bridge_spans) if doc._.nlp_bridge_spans else [],
                             clusters=copy.deepcopy(doc._.nlp_bridge_clusters) if doc._.nlp_bridge_clusters else [],
                             roles=copy.deepcopy(doc._.nlp_bridge_roles) if doc._.nlp_bridge_roles else [],
@@ -499,7 +582,6 @@ class Pipeline(BridgeBase):
                         
                     cached_result = self._check_cache(cache_key)
                     if cached_result:
-                        # Return a deep copy to prevent external modification
                         return cached_result
                         
                     # Make a thread-safe copy of adapters
@@ -535,11 +617,11 @@ class Pipeline(BridgeBase):
                     skip_adapter = False
                     with self._conditions_lock:
                         if idx in self._conditions:
-                            # Make a deep copy of combined_result for the condition function
-                            # to avoid external modifications during condition evaluation
-                            condition_result = copy.deepcopy(combined_result)
+                            # Snapshot combined_result unless the condition is read-only
+                            condition_fn = self._conditions[idx]
+                            condition_result = self._condition_input(condition_fn, combined_result)
                             # If the condition returns False, skip this adapter
-                            if not self._conditions[idx](condition_result):
+                            if not condition_fn(condition_result):
                                 skip_adapter = True
                     
                     if skip_adapter:
@@ -558,8 +640,8 @@ class Pipeline(BridgeBase):
                 # Cache the result if enabled (thread-safe method with internal locking)
                 self._update_cache(cache_key, combined_result)
                 
-                # Return deep copy to ensure the caller can't modify our cached data
-                return copy.deepcopy(combined_result)
+                # The cache keeps its own copy, so the result can be returned as is
+                return combined_result
                 
             except Exception as e:
                 # Handle processing errors
@@ -618,7 +700,6 @@ class Pipeline(BridgeBase):
                     
                     cached_result = self._check_cache(cache_key)
                     if cached_result:
-                        # Return a deep copy to prevent external modification
                         return cached_result
                     
                     # Make a thread-safe copy of adapters
@@ -654,11 +735,11 @@ class Pipeline(BridgeBase):
                     skip_adapter = False
                     with self._conditions_lock:
                         if idx in self._conditions:
-                            # Make a deep copy of combined_result for the condition function
-                            # to avoid external modifications during condition evaluation
-                            condition_result = copy.deepcopy(combined_result)
+                            # Snapshot combined_result unless the condition is read-only
+                            condition_fn = self._conditions[idx]
+                            condition_result = self._condition_input(condition_fn, combined_result)
                             # If the condition returns False, skip this adapter
-                            if not self._conditions[idx](condition_result):
+                            if not condition_fn(condition_result):
                                 skip_adapter = True
                     
                     if skip_adapter:
@@ -677,8 +758,8 @@ class Pipeline(BridgeBase):
                 # Cache the result if enabled (thread-safe method with internal locking)
                 self._update_cache(cache_key, combined_result)
                 
-                # Return deep copy to ensure the caller can't modify our cached data
-                return copy.deepcopy(combined_result)
+                # The cache keeps its own copy, so the result can be returned as is
+                return combined_result
                 
             except Exception as e:
                 # Handle processing errors
@@ -719,80 +800,98 @@ class Pipeline(BridgeBase):
                 detected_objects=copy.deepcopy(result1.detected_objects),
                 captions=copy.copy(result1.captions)
             )
-            
-            # Apply alignment to map from the second result to the first
-            # For simplicity, we'll just add from the second result
-            # A more sophisticated implementation would merge entries
-            
-            # Add spans if they don't already exist
-            for span in result2.spans:
-                if span not in combined.spans:
-                    combined.spans.append(copy.copy(span))
-            
-            # Add clusters if they don't already exist
-            for cluster in result2.clusters:
-                if not any(self._clusters_overlap(cluster, existing) for existing in combined.clusters):
-                    combined.clusters.append(copy.deepcopy(cluster))
-            
-            # Add roles from the second result
-            for role in result2.roles:
-                # Check if this role already exists with the same text
-                if not any(r.get("text") == role.get("text") and 
-                          r.get("role") == role.get("role") for r in combined.roles):
-                    combined.roles.append(copy.deepcopy(role))
-            
-            # Merge labels from result2
-            if not combined.labels and result2.labels:
-                # If result1 has no labels but result2 does, use result2's labels
-                combined.labels = copy.copy(result2.labels)
-            elif combined.labels and result2.labels:
-                # Create a new labels list to avoid modifying the original
-                new_labels = list(combined.labels)
-                
-                # If both have labels, prefer non-"O" labels
-                for i, label in enumerate(result2.labels):
-                    if i < len(new_labels):
-                        if new_labels[i] == "O" and label != "O":
-                            new_labels[i] = label
-                    else:
-                        # If result2 has more labels than result1, append them
-                        new_labels.append(label)
-                        
-                combined.labels = new_labels
-            
-            # Merge multimodal fields
-            
-            # Merge image features
-            if not combined.image_features and result2.image_features:
-                combined.image_features = copy.deepcopy(result2.image_features)
-            elif combined.image_features and result2.image_features:
-                # If both have image features, create a new merged dictionary
-                combined.image_features = {**combined.image_features, **result2.image_features}
-                
-            # Merge audio features
-            if not combined.audio_features and result2.audio_features:
-                combined.audio_features = copy.deepcopy(result2.audio_features)
-            elif combined.audio_features and result2.audio_features:
-                # If both have audio features, create a new merged dictionary
-                combined.audio_features = {**combined.audio_features, **result2.audio_features}
-                
-            # Use multimodal embeddings from the most feature-rich result
-            if not combined.multimodal_embeddings and result2.multimodal_embeddings:
-                combined.multimodal_embeddings = copy.copy(result2.multimodal_embeddings)
-                
-            # Add detected objects if they don't already exist
-            for obj in result2.detected_objects:
-                # Check if this object already exists with the same label and box
-                if not any(o.get("label") == obj.get("label") and 
-                          o.get("box") == obj.get("box") for o in combined.detected_objects):
-                    combined.detected_objects.append(copy.deepcopy(obj))
-                    
-            # Add captions if they don't already exist
-            for caption in result2.captions:
-                if caption not in combined.captions:
-                    combined.captions.append(caption)
-            
-            return combined
+
+            return self._merge_into(combined, result2, copy_items=True)
+
+    def _merge_into(self, target: BridgeResult, source: BridgeResult,
+                    copy_items: bool = False) -> BridgeResult:
+        """
+        Merge ``source`` into ``target`` in place.
+
+        Unlike :meth:`_combine_results`, ``target`` is not copied first, so this
+        is meant for accumulators owned by the caller. Items taken from ``source``
+        are appended by reference unless ``copy_items`` is set.
+
+        Args:
+            target: Result to merge into (modified in place)
+            source: Result to merge from (left untouched)
+            copy_items: Deep copy items taken from ``source``
+
+        Returns:
+            The updated ``target``
+        """
+        take = copy.deepcopy if copy_items else (lambda item: item)
+
+        # Apply alignment to map from the second result to the first
+        # For simplicity, we'll just add from the second result
+        # A more sophisticated implementation would merge entries
+
+        # Add spans if they don't already exist
+        for span in source.spans:
+            if span not in target.spans:
+                target.spans.append(copy.copy(span) if copy_items else span)
+
+        # Add clusters if they don't already exist
+        for cluster in source.clusters:
+            if not any(self._clusters_overlap(cluster, existing) for existing in target.clusters):
+                target.clusters.append(take(cluster))
+
+        # Add roles from the second result
+        for role in source.roles:
+            # Check if this role already exists with the same text
+            if not any(r.get("text") == role.get("text") and
+                      r.get("role") == role.get("role") for r in target.roles):
+                target.roles.append(take(role))
+
+        # Merge labels from source
+        if not target.labels and source.labels:
+            # If target has no labels but source does, use source's labels
+            target.labels = source.labels[:]
+        elif target.labels and source.labels:
+            labels = target.labels
+
+            # If both have labels, prefer non-"O" labels
+            for i, label in enumerate(source.labels):
+                if i < len(labels):
+                    if labels[i] == "O" and label != "O":
+                        labels[i] = label
+                else:
+                    # If source has more labels than target, append them
+                    labels.append(label)
+
+        # Merge multimodal fields
+
+        # Merge image features
+        if not target.image_features and source.image_features:
+            target.image_features = take(source.image_features)
+        elif target.image_features and source.image_features:
+            # If both have image features, create a new merged dictionary
+            target.image_features = {**target.image_features, **source.image_features}
+
+        # Merge audio features
+        if not target.audio_features and source.audio_features:
+            target.audio_features = take(source.audio_features)
+        elif target.audio_features and source.audio_features:
+            # If both have audio features, create a new merged dictionary
+            target.audio_features = {**target.audio_features, **source.audio_features}
+
+        # Use multimodal embeddings from the most feature-rich result
+        if not target.multimodal_embeddings and source.multimodal_embeddings:
+            target.multimodal_embeddings = copy.copy(source.multimodal_embeddings)
+
+        # Add detected objects if they don't already exist
+        for obj in source.detected_objects:
+            # Check if this object already exists with the same label and box
+            if not any(o.get("label") == obj.get("label") and
+                      o.get("box") == obj.get("box") for o in target.detected_objects):
+                target.detected_objects.append(take(obj))
+
+        # Add captions if they don't already exist
+        for caption in source.captions:
+            if caption not in target.captions:
+                target.captions.append(caption)
+
+        return target
     
     def _clusters_overlap(self, cluster1: List[Tuple[int, int]], cluster2: List[Tuple[int, int]]) -> bool:
         """
@@ -812,6 +911,89 @@ class Pipeline(BridgeBase):
         # Check for any overlap
         return bool(spans1.intersection(spans2))
     
+    def enable_model_cpu_offload(self, gpu_id: int = 0) -> None:
+        """
+        Keep only the model of the running adapter on the GPU.
+        
+        Each adapter's model is moved to the CPU and given an accelerate hook
+        that moves it to the GPU when it runs, offloading the model that ran
+        before it. Peak GPU memory is then that of the largest model rather
+        than the sum of all of them, at the cost of a host-device copy each
+        time a different model runs. The hooks also fire when the adapters
+        are called directly. Adapters without a PyTorch model are left alone.
+        
+        Models from the shared model registry are reloaded under their own
+        ``_offload`` key first, so other adapter instances using the same
+        model keep it on the GPU. An adapter of this pipeline that had
+        already loaded its model therefore holds a second copy afterwards;
+        the shared one stays in the registry until ``unload_model`` is
+        called for its old key.
+        
+        Args:
+            gpu_id: Index of the GPU to run the models on
+            
+        Raises:
+            ImportError: If accelerate is not installed
+        """
+        try:
+            from accelerate import cpu_offload_with_hook
+        except ImportError:
+            raise ImportError(
+                "accelerate not installed. Install with: pip install 'bridgenlp[speedups]' "
+                "or manually install: accelerate>=0.20"
+            )
+        
+        device = f"cuda:{gpu_id}"
+        with self._pipeline_lock:
+            hooks = []
+            for adapter in self.adapters:
+                model_key = getattr(adapter, "model_key", None)
+                if (hasattr(adapter, "_load_model_and_processor") and model_key
+                        and not model_key.endswith("_offload")):
+                    # Hooks on a registry model would also offload it under
+                    # every other adapter sharing it
+                    adapter.model_key = f"{model_key}_offload"
+                    adapter._model = None
+                    adapter._model_loaded = False
+                
+                model = self._adapter_model(adapter)
+                if model is None:
+                    continue
+                
+                _, hook = cpu_offload_with_hook(
+                    model, device, prev_module_hook=hooks[-1] if hooks else None
+                )
+                if isinstance(adapter, MultimodalBridgeBase):
+                    adapter._offload_hook = hook
+                hooks.append(hook)
+            
+            # Close the chain so the first model offloads the last one when the pipeline runs again
+            if len(hooks) > 1:
+                hooks[0].hook.prev_module_hook = hooks[-1]
+    
+    @staticmethod
+    def _adapter_model(adapter: BridgeBase) -> Optional[Any]:
+        """
+        Get the PyTorch model behind an adapter, loading it if needed.
+        
+        Args:
+            adapter: Adapter in the pipeline
+            
+        Returns:
+            The model, or None if the adapter does not run one
+        """
+        # Adapters built on a transformers pipeline
+        if hasattr(adapter, "_pipeline"):
+            return getattr(adapter.pipeline, "model", None)
+        
+        # Adapters that load the model themselves
+        if hasattr(adapter, "_load_model_and_processor"):
+            if getattr(adapter, "_model", None) is None:
+                adapter._load_model_and_processor()
+            return adapter._model
+        
+        return None
+    
     def get_metrics(self) -> Dict[str, float]:
         """
         Get performance metrics for the pipeline.
@@ -819,17 +1001,8 @@ class Pipeline(BridgeBase):
         Returns:
             Dictionary of metrics including adapter-specific metrics
         """
-        # Get a thread-safe copy of the metrics
-        with self._metrics_lock:
-            metrics = dict(self._metrics)
-        
-        # Calculate derived metrics
-        if metrics["num_calls"] > 0:
-            metrics["avg_time"] = metrics["total_time"] / metrics["num_calls"]
-            if metrics["total_tokens"] > 0 and metrics["total_time"] > 0.00001:
-                metrics["tokens_per_second"] = metrics["total_tokens"] / metrics["total_time"]
-            elif metrics["total_tokens"] > 0:
-                metrics["tokens_per_second"] = float('inf')
+        # Base metrics, including derived averages
+        metrics = super().get_metrics()
         
         # Add cache metrics if enabled
         if self._cache_enabled:
@@ -861,6 +1034,14 @@ class Pipeline(BridgeBase):
         and returns a boolean indicating whether to run the adapter at the
         specified index. This method is thread-safe.
         
+        Adding a condition clears the in-memory result cache, and from then
+        on the persistent cache tier is not used by this pipeline.
+        
+        The condition normally receives a deep copy of the combined result so
+        it cannot corrupt the pipeline state. Conditions that only read the
+        result can set ``condition_fn.readonly = True`` to receive it directly
+        and skip the copy.
+        
         Args:
             adapter_index: Index of the adapter to conditionally execute (>= 1)
             condition_fn: Function that takes a BridgeResult and returns a boolean
@@ -874,6 +1055,27 @@ class Pipeline(BridgeBase):
         # Thread-safe update of conditions
         with self._conditions_lock:
             self._conditions[adapter_index] = condition_fn
+        
+        # Results cached so far were computed without this condition
+        with self._cache_lock:
+            self._cache.clear()
+    
+    @staticmethod
+    def _condition_input(condition_fn: Callable[[BridgeResult], bool],
+                         result: BridgeResult) -> BridgeResult:
+        """
+        Get the result to pass to a condition function.
+        
+        Args:
+            condition_fn: The condition function about to be called
+            result: The combined result so far
+            
+        Returns:
+            The result itself for read-only conditions, otherwise a deep copy
+        """
+        if getattr(condition_fn, "readonly", False):
+            return result
+        return copy.deepcopy(result)
     
     def _update_cache(self, cache_key: str, result: BridgeResult) -> None:
         """
@@ -893,45 +1095,27 @@ class Pipeline(BridgeBase):
             
         with self._cache_lock:
             try:
-                # Create a deep copy of the result to prevent external mutations
+                # Store a copy of the result to prevent external mutations
                 # affecting our cached data
-                result_copy = copy.deepcopy(result)
-                
-                # When using a deque with maxlen, we don't need to manually
-                # manage eviction because the deque automatically removes
-                # the oldest item when adding a new one if maxlen is reached.
+                self._cache[cache_key] = result.clone()
+                self._cache.move_to_end(cache_key)
                 
-                # If the key already exists, remove it first
-                if cache_key in self._cache:
-                    self._cache.pop(cache_key, None)
-                    # Try to remove it from the deque too, but this might fail
-                    # if another thread already removed it
-                    try:
-                        self._cache_keys.remove(cache_key)
-                    except ValueError:
-                        pass  # Key already removed, that's fine
-                        
-                # Add new item - the deque will automatically handle LRU eviction
-                self._cache[cache_key] = result_copy
-                self._cache_keys.append(cache_key)
-                
-                # If the cache is larger than the limit, remove oldest entries
-                # This is a safety measure in case the automatic deque maxlen
-                # mechanism fails for some reason
+                # Evict least recently used entries beyond the size limit
                 while len(self._cache) > self._cache_size:
-                    try:
-                        # Get the oldest key (left side of the deque)
-                        oldest_key = self._cache_keys[0]
-                        self._cache_keys.popleft()
-                        self._cache.pop(oldest_key, None)
-                    except (IndexError, KeyError):
-                        # Handle race conditions where another thread modified the cache
-                        break
+                    self._cache.popitem(last=False)
                         
             except Exception as e:
                 # Log errors but don't crash the pipeline
                 import warnings
                 warnings.warn(f"Error updating cache: {e}")
+        
+        persistent_cache = self._shared_cache()
+        if persistent_cache is not None:
+            try:
+                persistent_cache.set(f"{self._cache_namespace}:{cache_key}", result)
+            except Exception as e:
+                import warnings
+                warnings.warn(f"Error updating persistent cache: {e}")
     
     def _check_cache(self, cache_key: str) -> Optional[BridgeResult]:
         """
@@ -939,14 +1123,15 @@ class Pipeline(BridgeBase):
         
         This method ensures thread-safe access to the cache, using appropriate
         locking to prevent race conditions. When a cache hit occurs, it returns
-        a deep copy of the cached result to prevent subsequent modification
-        of the cached data.
+        a copy of the cached result (see BridgeResult.clone) to prevent
+        subsequent modification of the cached data. Misses in memory fall through to the persistent
+        cache, if one is configured.
         
         Args:
             cache_key: The cache key to check
             
         Returns:
-            A deep copy of the cached result if found, otherwise None
+            A copy of the cached result if found, otherwise None
         """
         if not self._cache_enabled:
             return None
@@ -956,21 +1141,12 @@ class Pipeline(BridgeBase):
                 if cache_key in self._cache:
                     self._cache_hits += 1
                     
-                    # Update key position in LRU tracking
-                    try:
-                        # Try to remove and re-add the key to move it to the end
-                        self._cache_keys.remove(cache_key)
-                        self._cache_keys.append(cache_key)
-                    except ValueError:
-                        # If the key wasn't in the deque for some reason, just add it
-                        self._cache_keys.append(cache_key)
-                    
-                    # Return a deep copy to prevent external modifications
-                    # affecting cached data
-                    return copy.deepcopy(self._cache[cache_key])
+                    # Mark the entry as most recently used
+                    self._cache.move_to_end(cache_key)
                     
-                self._cache_misses += 1
-                return None
+                    # Return a copy to prevent external modifications
+                    # affecting cached data
+                    return self._cache[cache_key].clone()
             except Exception as e:
                 # Log errors but don't crash the pipeline
                 import warnings
@@ -978,6 +1154,26 @@ class Pipeline(BridgeBase):
                 # Safely increment misses even in case of error
                 self._cache_misses += 1
                 return None
+        
+        # Fall back to the persistent tier and promote hits into memory
+        result = None
+        persistent_cache = self._shared_cache()
+        if persistent_cache is not None:
+            try:
+                result = persistent_cache.get(f"{self._cache_namespace}:{cache_key}")
+            except Exception as e:
+                import warnings
+                warnings.warn(f"Error checking persistent cache: {e}")
+        
+        with self._cache_lock:
+            if result is None:
+                self._cache_misses += 1
+                return None
+            self._cache_hits += 1
+            self._cache[cache_key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result.clone()
             
     def cleanup(self):
         """
@@ -996,9 +1192,13 @@ class Pipeline(BridgeBase):
         # Clear the cache
         with self._cache_lock:
             self._cache.clear()
-            self._cache_keys.clear()
             self._cache_hits = 0
             self._cache_misses = 0
         
+        # Entries on disk are kept for the next process; just release the file
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+            self._persistent_cache = None
+        
         # Force garbage collection
         gc.collect()
\ No newline at end of file
@@ -1,21 +1,116 @@
-import copy
+import asyncio
+import collections
 import inspect
-import threading
-from typing import List
+import warnings
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Union
 
-try:
-    import spacy
+if TYPE_CHECKING:
     from spacy.tokens import Doc
-except ImportError:  # pragma: no cover - optional dependency
-    spacy = None
-    Doc = object  # type: ignore
 
+from .base import BridgeBase
+from .config import BridgeConfig
 from .pipeline import Pipeline
-from .result import BridgeResult
+from .result import _EXT_DEFAULTS, BridgeResult, _register_extensions
+from .utils import hash_text, hash_tokens, token_texts
+
+
+# Marks the end of a stream as it travels through the stage queues
+_STREAM_END = object()
+
+async def _iterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    """Iterate a sync or async iterable asynchronously."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class AsyncBatcher:
+    """
+    Coalesce concurrent single-item awaits into batched calls.
+
+    Items submitted while a batch is open are collected until either
+    ``max_batch_size`` items are pending or ``max_latency`` seconds have
+    passed since the first one arrived. The batch is then handed to
+    ``process_batch`` and each result is delivered to its caller's future.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch_size: int, max_latency: float):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_batch_size = max_batch_size
+        self.max_latency = max(0.0, max_latency)
+        self._process_batch = process_batch
+        self._pending = collections.deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks
+        self._tasks = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue ``item`` for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = [self._pending.popleft()
+                     for _ in range(min(self.max_batch_size, len(self._pending)))]
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch) -> None:
+        try:
+            results = await self._process_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch returned {len(results)} results for {len(batch)} inputs"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
 
 
 class AsyncPipeline(Pipeline):
-    """Asynchronous version of :class:`Pipeline`."""
+    """
+    Asynchronous version of :class:`Pipeline`.
+
+    When ``config.max_batch_size`` is greater than one, concurrent
+    :meth:`from_text` calls are coalesced by an :class:`AsyncBatcher` in front
+    of the first adapter, which receives them through ``from_batch``.
+
+    :meth:`stream` runs every adapter as its own stage connected by bounded
+    queues, so for a stream of inputs the per-item latency is hidden behind
+    the slowest stage instead of the sum of all stages.
+    """
+
+    def __init__(self, adapters: List[BridgeBase], config: Optional[BridgeConfig] = None):
+        super().__init__(adapters, config)
+        max_batch_size = getattr(config, "max_batch_size", None) or 1
+        self._batcher = None
+        if max_batch_size > 1:
+            self._batcher = AsyncBatcher(
+                self._process_first_batch,
+                max_batch_size,
+                getattr(config, "max_latency", 0.005),
+            )
 
     async def __aenter__(self):
         for adapter in self.adapters:
@@ -31,48 +126,189 @@ class AsyncPipeline(Pipeline):
                 adapter.cleanup()
         return False
 
+    async def _check_cache_async(self, cache_key: str) -> Optional[BridgeResult]:
+        """Check the cache, reading the persistent tier off the event loop."""
+        if self._shared_cache() is None:
+            return self._check_cache(cache_key)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._check_cache, cache_key)
+
+    async def _update_cache_async(self, cache_key: str, result: BridgeResult) -> None:
+        """Update the cache, writing the persistent tier off the event loop."""
+        if self._shared_cache() is None:
+            self._update_cache(cache_key, result)
+            return
+        # Awaited, so the caller only gets the result once it has been copied
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._update_cache, cache_key, result)
+
     async def _call_adapter(self, adapter, method: str, *args):
         func = getattr(adapter, method)
         if inspect.iscoroutinefunction(func):
             return await func(*args)
         return func(*args)
 
+    async def _call_adapter_batch(self, adapter, texts: List[str]) -> List[BridgeResult]:
+        batch_fn = adapter.from_batch
+        if inspect.iscoroutinefunction(batch_fn):
+            return await batch_fn(texts)
+        if inspect.iscoroutinefunction(adapter.from_text):
+            # The default from_batch would return unawaited coroutines here
+            return list(await asyncio.gather(*(adapter.from_text(t) for t in texts)))
+        return batch_fn(texts)
+
+    async def _process_first_batch(self, texts: List[str]) -> List[BridgeResult]:
+        return await self._call_adapter_batch(self.adapters[0], texts)
+
+    def _accumulator(self, result: BridgeResult) -> BridgeResult:
+        """Shallow copy ``result`` into a fresh accumulator that may be mutated."""
+        return BridgeResult(
+            tokens=result.tokens[:],
+            spans=result.spans[:],
+            clusters=result.clusters[:],
+            roles=result.roles[:],
+            labels=result.labels[:],
+            image_features=result.image_features,
+            audio_features=result.audio_features,
+            multimodal_embeddings=result.multimodal_embeddings,
+            detected_objects=result.detected_objects[:],
+            captions=result.captions[:],
+        )
+
+    def _should_skip(self, index: int, result: BridgeResult) -> bool:
+        """Evaluate the condition for adapter ``index``, snapshotting only if one exists."""
+        with self._conditions_lock:
+            condition = self._conditions.get(index)
+        if condition is None:
+            return False
+        return not condition(self._condition_input(condition, result))
+
+    @staticmethod
+    def _result_from_doc(doc: "Doc", tokens: List[str]) -> BridgeResult:
+        """View the bridge extensions of ``doc`` as a result without copying them."""
+        return BridgeResult(
+            tokens=tokens,
+            spans=doc._.nlp_bridge_spans or [],
+            clusters=doc._.nlp_bridge_clusters or [],
+            roles=doc._.nlp_bridge_roles or [],
+            labels=doc._.nlp_bridge_labels or [],
+        )
+
+    async def stream(
+        self, texts: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[BridgeResult]:
+        """
+        Process a stream of texts with all adapter stages running concurrently.
+
+        Each adapter runs in its own task and hands results to the next one
+        through an ``asyncio.Queue`` holding at most ``config.pipeline_depth``
+        items, which bounds memory and applies backpressure to the source.
+        Results are yielded in input order.
+
+        Args:
+            texts: Sync or async iterable of texts
+
+        Yields:
+            BridgeResult for each input text
+        """
+        local_adapters = list(self.adapters)
+        depth = getattr(self.config, "pipeline_depth", None) or 4
+        queues = [asyncio.Queue(maxsize=depth) for _ in local_adapters]
+        tasks = [asyncio.ensure_future(self._stream_source(texts, local_adapters[0], queues[0]))]
+        for i, adapter in enumerate(local_adapters[1:], 1):
+            tasks.append(asyncio.ensure_future(
+                self._stream_stage(i, adapter, queues[i - 1], queues[i])
+            ))
+        try:
+            while True:
+                item = await queues[-1].get()
+                if item is _STREAM_END:
+                    break
+                _, cache_key, result, done = item
+                if not done:
+                    with self._metrics_lock:
+                        self._metrics["total_tokens"] += len(result.tokens)
+                    await self._update_cache_async(cache_key, result)
+                yield result
+            # Surface errors raised while iterating the source
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _stream_source(self, texts, adapter, out: asyncio.Queue) -> None:
+        try:
+            async for text in _iterate(texts):
+                await out.put(await self._stream_first(adapter, text))
+        finally:
+            await out.put(_STREAM_END)
+
+    async def _stream_first(self, adapter, text: str):
+        # Items are (text, cache_key, result, done); done items skip later stages
+        if not text or not isinstance(text, str) or not text.strip():
+            return (text, None, BridgeResult(tokens=[]), True)
+        cache_key = f"text:{hash_text(text)}"
+        cached_result = await self._check_cache_async(cache_key)
+        if cached_result:
+            return (text, cache_key, cached_result, True)
+        try:
+            result = await self._call_adapter(adapter, "from_text", text)
+        except Exception as e:
+            warnings.warn(f"Error during pipeline text processing: {e}")
+            return (text, cache_key, BridgeResult(tokens=[]), True)
+        return (text, cache_key, self._accumulator(result), False)
+
+    async def _stream_stage(self, index: int, adapter, inp: asyncio.Queue,
+                            out: asyncio.Queue) -> None:
+        while True:
+            item = await inp.get()
+            if item is not _STREAM_END:
+                text, cache_key, result, done = item
+                try:
+                    if not done and not self._should_skip(index, result):
+                        next_result = await self._call_adapter(adapter, "from_text", text)
+                        self._merge_into(result, next_result)
+                except Exception as e:
+                    warnings.warn(f"Error during pipeline text processing: {e}")
+                    item = (text, cache_key, BridgeResult(tokens=[]), True)
+            await out.put(item)
+            if item is _STREAM_END:
+                return
+
     async def from_text(self, text: str) -> BridgeResult:
         with self._measure_performance():
             if not text or not isinstance(text, str) or not text.strip():
                 return BridgeResult(tokens=[])
-            with self._pipeline_lock:
-                try:
-                    cache_key = f"text:{hash(text)}"
-                    cached_result = self._check_cache(cache_key)
-                    if cached_result:
-                        return cached_result
-                    local_adapters = list(self.adapters)
-                    if not local_adapters:
-                        raise ValueError("No adapters available for processing")
-                except Exception as e:  # pragma: no cover - defensive
-                    import warnings
-                    warnings.warn(f"Error initializing pipeline processing: {e}")
-                    return BridgeResult(tokens=[])
+            # The cache has its own lock and the adapter list is only read here,
+            # so concurrent calls do not need to serialize on the pipeline lock
             try:
-                combined_result = await self._call_adapter(local_adapters[0], "from_text", text)
+                cache_key = f"text:{hash_text(text)}"
+                cached_result = await self._check_cache_async(cache_key)
+                if cached_result:
+                    return cached_result
+                local_adapters = list(self.adapters)
+                if not local_adapters:
+                    raise ValueError("No adapters available for processing")
+            except Exception as e:  # pragma: no cover - defensive
+                warnings.warn(f"Error initializing pipeline processing: {e}")
+                return BridgeResult(tokens=[])
+            try:
+                if self._batcher is not None:
+                    first_result = await self._batcher.submit(text)
+                else:
+                    first_result = await self._call_adapter(local_adapters[0], "from_text", text)
+                combined_result = self._accumulator(first_result)
                 for i, adapter in enumerate(local_adapters[1:], 1):
-                    skip_adapter = False
-                    with self._conditions_lock:
-                        if i in self._conditions:
-                            condition_result = copy.deepcopy(combined_result)
-                            if not self._conditions[i](condition_result):
-                                skip_adapter = True
-                    if skip_adapter:
+                    if self._should_skip(i, combined_result):
                         continue
                     next_result = await self._call_adapter(adapter, "from_text", text)
-                    combined_result = self._combine_results(combined_result, next_result)
+                    self._merge_into(combined_result, next_result)
                 with self._metrics_lock:
                     self._metrics["total_tokens"] += len(combined_result.tokens)
-                self._update_cache(cache_key, combined_result)
-                return copy.deepcopy(combined_result)
+                # The cache stores its own copy, so the accumulator can be handed out as is
+                await self._update_cache_async(cache_key, combined_result)
+                return combined_result
             except Exception as e:  # pragma: no cover - defensive
-                import warnings
                 warnings.warn(f"Error during pipeline text processing: {e}")
                 return BridgeResult(tokens=[])
 
@@ -80,149 +316,92 @@ class AsyncPipeline(Pipeline):
         with self._measure_performance():
             if not tokens or not isinstance(tokens, list):
                 return BridgeResult(tokens=[])
-            with self._pipeline_lock:
-                try:
-                    token_tuple = tuple(str(t) for t in tokens)
-                    cache_key = f"tokens:{hash(token_tuple)}"
-                    cached_result = self._check_cache(cache_key)
-                    if cached_result:
-                        return cached_result
-                    local_adapters = list(self.adapters)
-                    if not local_adapters:
-                        raise ValueError("No adapters available for processing")
-                except Exception as e:  # pragma: no cover - defensive
-                    import warnings
-                    warnings.warn(f"Error initializing pipeline token processing: {e}")
-                    return BridgeResult(tokens=[])
+            try:
+                cache_key = f"tokens:{hash_tokens(tokens)}"
+                cached_result = await self._check_cache_async(cache_key)
+                if cached_result:
+                    return cached_result
+                local_adapters = list(self.adapters)
+                if not local_adapters:
+                    raise ValueError("No adapters available for processing")
+            except Exception as e:  # pragma: no cover - defensive
+                warnings.warn(f"Error initializing pipeline token processing: {e}")
+                return BridgeResult(tokens=[])
             try:
                 safe_tokens = list(tokens)
-                combined_result = await self._call_adapter(local_adapters[0], "from_tokens", safe_tokens)
+                combined_result = self._accumulator(
+                    await self._call_adapter(local_adapters[0], "from_tokens", safe_tokens)
+                )
                 for i, adapter in enumerate(local_adapters[1:], 1):
-                    skip_adapter = False
-                    with self._conditions_lock:
-                        if i in self._conditions:
-                            condition_result = copy.deepcopy(combined_result)
-                            if not self._conditions[i](condition_result):
-                                skip_adapter = True
-                    if skip_adapter:
+                    if self._should_skip(i, combined_result):
                         continue
                     next_result = await self._call_adapter(adapter, "from_tokens", safe_tokens)
-                    combined_result = self._combine_results(combined_result, next_result)
+                    self._merge_into(combined_result, next_result)
                 with self._metrics_lock:
                     self._metrics["total_tokens"] += len(combined_result.tokens)
-                self._update_cache(cache_key, combined_result)
-                return copy.deepcopy(combined_result)
+                await self._update_cache_async(cache_key, combined_result)
+                return combined_result
             except Exception as e:  # pragma: no cover - defensive
-                import warnings
                 warnings.warn(f"Error during pipeline token processing: {e}")
                 return BridgeResult(tokens=[])
 
-    async def from_spacy(self, doc: Doc) -> Doc:
+    async def from_spacy(self, doc: "Doc") -> "Doc":
         with self._measure_performance():
             if not doc:
                 raise ValueError("Cannot process empty Doc")
-            with self._pipeline_lock:
-                try:
-                    try:
-                        text_hash = hash(doc.text)
-                        tokens_hash = hash(tuple(t.text for t in doc))
-                        cache_key = f"spacy:{text_hash}:{tokens_hash}"
-                    except Exception as e:
-                        import uuid
-                        cache_key = f"spacy:uuid:{uuid.uuid4()}"
-                        import warnings
-                        warnings.warn(f"Error hashing spaCy doc: {e}, using UUID instead")
-                    cached_result = self._check_cache(cache_key)
-                    if cached_result:
-                        return cached_result.attach_to_spacy(doc)
-                    local_adapters = list(self.adapters)
-                    if not local_adapters:
-                        raise ValueError("No adapters available for processing")
-                except Exception as e:  # pragma: no cover - defensive
-                    import warnings
-                    warnings.warn(f"Error initializing pipeline spaCy processing: {e}")
-                    return doc
-
-            with threading.RLock():
+            try:
                 try:
-                    for ext_name in [
-                        "nlp_bridge_spans",
-                        "nlp_bridge_clusters",
-                        "nlp_bridge_roles",
-                        "nlp_bridge_labels",
-                        "nlp_bridge_image_features",
-                        "nlp_bridge_audio_features",
-                        "nlp_bridge_multimodal_embeddings",
-                        "nlp_bridge_detected_objects",
-                        "nlp_bridge_captions",
-                    ]:
-                        if not Doc.has_extension(ext_name):
-                            Doc.set_extension(ext_name, default=None)
-                        if getattr(doc._, ext_name) is None:
-                            default_value = [] if ext_name not in [
-                                "nlp_bridge_image_features",
-                                "nlp_bridge_audio_features",
-                                "nlp_bridge_multimodal_embeddings",
-                            ] else None
-                            setattr(doc._, ext_name, default_value)
-                except Exception as e:  # pragma: no cover - defensive
-                    import warnings
-                    warnings.warn(f"Error registering spaCy extensions: {e}")
+                    text_hash = hash_text(doc.text)
+                    tokens_hash = hash_tokens(token_texts(doc))
+                    cache_key = f"spacy:{text_hash}:{tokens_hash}"
+                except Exception as e:
+                    import uuid
+                    cache_key = f"spacy:uuid:{uuid.uuid4()}"
+                    warnings.warn(f"Error hashing spaCy doc: {e}, using UUID instead")
+                cached_result = await self._check_cache_async(cache_key)
+                if cached_result:
+                    return cached_result.attach_to_spacy(doc)
+                local_adapters = list(self.adapters)
+                if not local_adapters:
+                    raise ValueError("No adapters available for processing")
+            except Exception as e:  # pragma: no cover - defensive
+                warnings.warn(f"Error initializing pipeline spaCy processing: {e}")
+                return doc
+
+            _register_extensions()
+            for ext_name, default in _EXT_DEFAULTS.items():
+                if getattr(doc._, ext_name) is None:
+                    setattr(doc._, ext_name, default())
 
             try:
-                combined_result = BridgeResult(tokens=[t.text for t in doc])
+                tokens = token_texts(doc)
+                combined_result = BridgeResult(tokens=tokens)
                 doc = await self._call_adapter(local_adapters[0], "from_spacy", doc)
                 with self._result_lock:
-                    first_result = BridgeResult(
-                        tokens=[t.text for t in doc],
-                        spans=copy.deepcopy(doc._.nlp_bridge_spans) if doc._.nlp_bridge_spans else [],
-                        clusters=copy.deepcopy(doc._.nlp_bridge_clusters) if doc._.nlp_bridge_clusters else [],
-                        roles=copy.deepcopy(doc._.nlp_bridge_roles) if doc._.nlp_bridge_roles else [],
-                        labels=copy.copy(doc._.nlp_bridge_labels) if doc._.nlp_bridge_labels else [],
-                    )
-                combined_result = self._combine_results(combined_result, first_result)
+                    self._merge_into(combined_result, self._result_from_doc(doc, tokens))
                 for i, adapter in enumerate(local_adapters[1:], 1):
-                    skip_adapter = False
-                    with self._conditions_lock:
-                        if i in self._conditions:
-                            condition_result = copy.deepcopy(combined_result)
-                            if not self._conditions[i](condition_result):
-                                skip_adapter = True
-                    if skip_adapter:
+                    if self._should_skip(i, combined_result):
                         continue
-                    with self._result_lock:
-                        current_spans = copy.deepcopy(doc._.nlp_bridge_spans) if doc._.nlp_bridge_spans else []
-                        current_clusters = copy.deepcopy(doc._.nlp_bridge_clusters) if doc._.nlp_bridge_clusters else []
-                        current_roles = copy.deepcopy(doc._.nlp_bridge_roles) if doc._.nlp_bridge_roles else []
-                        current_labels = copy.copy(doc._.nlp_bridge_labels) if doc._.nlp_bridge_labels else []
-
                     doc = await self._call_adapter(adapter, "from_spacy", doc)
                     with self._result_lock:
-                        adapter_result = BridgeResult(
-                            tokens=[t.text for t in doc],
-                            spans=copy.deepcopy(doc._.nlp_bridge_spans) if doc._.nlp_bridge_spans else [],
-                            clusters=copy.deepcopy(doc._.nlp_bridge_clusters) if doc._.nlp_bridge_clusters else [],
-                            roles=copy.deepcopy(doc._.nlp_bridge_roles) if doc._.nlp_bridge_roles else [],
-                            labels=copy.copy(doc._.nlp_bridge_labels) if doc._.nlp_bridge_labels else [],
-                        )
-                    combined_result = self._combine_results(combined_result, adapter_result)
-                    with self._result_lock:
-                        doc._.nlp_bridge_spans = copy.deepcopy(combined_result.spans)
-                        doc._.nlp_bridge_clusters = copy.deepcopy(combined_result.clusters)
-                        doc._.nlp_bridge_roles = copy.deepcopy(combined_result.roles)
-                        doc._.nlp_bridge_labels = copy.copy(combined_result.labels)
+                        self._merge_into(combined_result, self._result_from_doc(doc, tokens))
+                        # Give the doc its own list objects so later adapters that
+                        # append in place cannot alias the accumulator
+                        doc._.nlp_bridge_spans = combined_result.spans[:]
+                        doc._.nlp_bridge_clusters = combined_result.clusters[:]
+                        doc._.nlp_bridge_roles = combined_result.roles[:]
+                        doc._.nlp_bridge_labels = combined_result.labels[:]
 
                 with self._metrics_lock:
                     self._metrics["total_tokens"] += len(doc)
                 with self._result_lock:
-                    combined_result.image_features = copy.deepcopy(doc._.nlp_bridge_image_features) if doc._.nlp_bridge_image_features else None
-                    combined_result.audio_features = copy.deepcopy(doc._.nlp_bridge_audio_features) if doc._.nlp_bridge_audio_features else None
-                    combined_result.multimodal_embeddings = copy.copy(doc._.nlp_bridge_multimodal_embeddings) if doc._.nlp_bridge_multimodal_embeddings else None
-                    combined_result.detected_objects = copy.deepcopy(doc._.nlp_bridge_detected_objects) if doc._.nlp_bridge_detected_objects else []
-                    combined_result.captions = copy.copy(doc._.nlp_bridge_captions) if doc._.nlp_bridge_captions else []
-                self._update_cache(cache_key, combined_result)
+                    combined_result.image_features = doc._.nlp_bridge_image_features or None
+                    combined_result.audio_features = doc._.nlp_bridge_audio_features or None
+                    combined_result.multimodal_embeddings = doc._.nlp_bridge_multimodal_embeddings or None
+                    combined_result.detected_objects = list(doc._.nlp_bridge_detected_objects or [])
+                    combined_result.captions = list(doc._.nlp_bridge_captions or [])
+                await self._update_cache_async(cache_key, combined_result)
                 return doc
             except Exception as e:  # pragma: no cover - defensive
-                import warnings
                 warnings.warn(f"Error during pipeline spaCy processing: {e}")
                 return doc
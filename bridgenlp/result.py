@@ -2,8 +2,13 @@
 Result container for NLP and multimodal model outputs.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+import collections
+import json
+import math
+import sys
+import threading
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 import warnings
 
 try:
@@ -12,13 +17,178 @@ except ImportError:
     np = None
 
 try:
-    import spacy
-    from spacy.tokens import Doc
+    import orjson
 except ImportError:
-    spacy = None
-    Doc = Any
+    orjson = None
+
+# spaCy is only needed once a result is attached to a Doc; importing it
+# eagerly would slow down every user of BridgeResult
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+
+# Doc extensions that results are attached to, mapped to a factory for the
+# value an unset extension starts out with (the feature extensions stay None)
+_EXT_DEFAULTS = {
+    "nlp_bridge_spans": list,
+    "nlp_bridge_clusters": list,
+    "nlp_bridge_roles": list,
+    "nlp_bridge_labels": list,
+    "nlp_bridge_image_features": type(None),
+    "nlp_bridge_audio_features": type(None),
+    "nlp_bridge_multimodal_embeddings": type(None),
+    "nlp_bridge_detected_objects": list,
+    "nlp_bridge_captions": list,
+}
+
+# Extension registration is global, so it only has to happen once per process
+_extensions_registered = False
+_extensions_lock = threading.Lock()
+
+
+def _register_extensions() -> None:
+    """
+    Register the bridge Doc extensions on first use.
+    
+    After the first call this is a single flag check. The lock is only taken
+    until registration has happened, to stop two threads from registering
+    the same extension at once (which spaCy rejects).
+    
+    Raises:
+        ImportError: If spaCy is not installed
+    """
+    global _extensions_registered
+    if _extensions_registered:
+        return
+    with _extensions_lock:
+        if _extensions_registered:
+            return
+        try:
+            from spacy.tokens import Doc
+        except ImportError:
+            raise ImportError("spaCy not installed. Install with: pip install spacy")
+        for ext_name in _EXT_DEFAULTS:
+            if not Doc.has_extension(ext_name):
+                Doc.set_extension(ext_name, default=None)
+        _extensions_registered = True
+
+
+# Types that are already JSON scalars
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Types that _ensure_serializable converts itself, so earlier steps can pass them through
+_JSON_CONVERTIBLE = _JSON_SCALARS + (list, dict, tuple)
+
+
+def _is_convertible(value: Any) -> bool:
+    """
+    Check whether a value can be left for _ensure_serializable to handle.
+    
+    Args:
+        value: Value to check
+        
+    Returns:
+        True for JSON scalars, containers and numpy values, False otherwise
+    """
+    if isinstance(value, _JSON_CONVERTIBLE):
+        return True
+    return np is not None and isinstance(value, (np.ndarray, np.generic))
+
+
+def _copy_containers(obj: Any) -> Any:
+    """
+    Recursively copy lists, dicts and numpy arrays, sharing all other values.
+    
+    Args:
+        obj: Object to copy
+        
+    Returns:
+        Copy of obj with fresh list, dict and array containers
+    """
+    if isinstance(obj, list):
+        return [_copy_containers(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _copy_containers(value) for key, value in obj.items()}
+    if np is not None and isinstance(obj, np.ndarray):
+        return obj.copy()
+    return obj
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """
+    Recursively replace NaN and infinite floats with None.
+    
+    Args:
+        obj: JSON-compatible object
+        
+    Returns:
+        Copy of obj in which non-finite floats are None
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    return obj
+
+
+def _warn_converted(converted: List[str]) -> None:
+    """
+    Issue one warning for all values that were converted to strings.
+    
+    Args:
+        converted: Descriptions of the converted values
+    """
+    shown = ", ".join(converted[:5])
+    if len(converted) > 5:
+        shown += ", ..."
+    warnings.warn(f"Converted {len(converted)} non-serializable value(s) to strings: {shown}")
+
+
+def _intern_labels(labels: List[Any]) -> List[Any]:
+    """
+    Intern label strings so results share one object per distinct label.
+    
+    Label vocabularies are small, so across a batch the same few strings
+    repeat constantly. Tokens are not interned as their vocabulary is
+    unbounded.
+    
+    Args:
+        labels: Labels to intern
+        
+    Returns:
+        New list with every str label interned and other values unchanged
+    """
+    return [sys.intern(label) if type(label) is str else label for label in labels]
+
+
+def _with_slots(cls: type) -> type:
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    This mirrors ``dataclass(slots=True)``, which is only available from
+    Python 3.10. Instances drop their per-object ``__dict__``, which makes
+    them smaller and speeds up attribute access.
+    
+    Args:
+        cls: Dataclass to rebuild
+        
+    Returns:
+        A new class with the same fields, methods and base classes
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    # Class-level defaults would shadow the slot descriptors
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
 
 
+@_with_slots
 @dataclass
 class BridgeResult:
     """
@@ -26,6 +196,10 @@ class BridgeResult:
     
     This class provides a consistent interface for different types of
     NLP and multimodal model outputs, making them compatible with token-based pipelines.
+    
+    ``spans`` and ``clusters`` must hold plain Python ints and ``labels`` and
+    ``captions`` strings; ``to_json`` only walks the free-form fields (roles,
+    features and detected objects) looking for values to convert.
     """
     
     tokens: List[str]
@@ -41,6 +215,34 @@ class BridgeResult:
     detected_objects: List[Dict[str, Any]] = field(default_factory=list)
     captions: List[str] = field(default_factory=list)
     
+    def __post_init__(self):
+        self.labels = _intern_labels(self.labels)
+    
+    def clone(self) -> "BridgeResult":
+        """
+        Create an independent copy of this result.
+        
+        Lists, dicts and numpy arrays are copied at every level, so the clone
+        can be mutated freely without affecting the original. Immutable
+        values such as strings and tuples are shared, which makes this much
+        cheaper than ``copy.deepcopy``.
+        
+        Returns:
+            A new BridgeResult with copied containers
+        """
+        return BridgeResult(
+            tokens=list(self.tokens),
+            spans=list(self.spans),
+            clusters=_copy_containers(self.clusters),
+            roles=_copy_containers(self.roles),
+            labels=self.labels,  # __post_init__ builds a new list
+            image_features=_copy_containers(self.image_features),
+            audio_features=_copy_containers(self.audio_features),
+            multimodal_embeddings=_copy_containers(self.multimodal_embeddings),
+            detected_objects=_copy_containers(self.detected_objects),
+            captions=list(self.captions),
+        )
+    
     def to_json(self) -> Dict[str, Any]:
         """
         Convert the result to a JSON-serializable dictionary.
@@ -70,8 +272,8 @@ class BridgeResult:
             roles = self._deep_copy_roles(self.roles)
             result["roles"] = roles
         if self.labels:
-            # Ensure labels are strings
-            result["labels"] = [str(label) if not isinstance(label, str) else label 
+            # Ensure labels are valid strings
+            result["labels"] = [self._sanitize_string(label if isinstance(label, str) else str(label))
                                for label in self.labels]
             
         # Add multimodal fields with special handling
@@ -89,19 +291,48 @@ class BridgeResult:
             for obj in self.detected_objects:
                 obj_copy = dict(obj)
                 for k, v in obj_copy.items():
-                    if not self._is_json_serializable(v):
+                    if not _is_convertible(v):
                         obj_copy[k] = str(v)
                 objects.append(obj_copy)
             result["detected_objects"] = objects
         if self.captions:
-            # Ensure captions are strings
-            result["captions"] = [str(caption) if not isinstance(caption, str) else caption 
+            # Ensure captions are valid strings
+            result["captions"] = [self._sanitize_string(caption if isinstance(caption, str) else str(caption))
                                  for caption in self.captions]
             
-        # Ensure all values are JSON serializable
-        self._ensure_serializable(result)
+        # Only the free-form fields can hold values that still need converting;
+        # tokens, spans, clusters, labels and captions are already native
+        converted = []
+        for key in ("roles", "image_features", "audio_features", "detected_objects"):
+            if key in result:
+                self._ensure_serializable(result[key], converted)
+        if converted:
+            _warn_converted(converted)
             
         return result
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the result to UTF-8 encoded JSON.
+        
+        Uses orjson when it is installed (``pip install bridgenlp[speedups]``)
+        and the standard library encoder otherwise. Both produce the same
+        compact JSON for the dictionary returned by to_json: non-string dict
+        keys become strings, and NaN and infinite floats become ``null``,
+        since JSON has no literal for them.
+        
+        Returns:
+            JSON document as bytes
+        """
+        data = self.to_json()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        try:
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+        except ValueError:
+            # Only walk the data again when it actually holds a non-finite float
+            text = json.dumps(_replace_non_finite(data), ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
         
     def _sanitize_tokens(self, tokens: List[Any]) -> List[str]:
         """
@@ -117,17 +348,20 @@ class BridgeResult:
         for token in tokens:
             # Handle different token types
             if isinstance(token, str):
-                # String tokens can be used as-is
-                result.append(token)
+                # String tokens only need sanitizing
+                result.append(self._sanitize_string(token))
             elif np is not None and isinstance(token, np.ndarray):
-                # Convert numpy arrays to lists
-                result.append(token.tolist())
+                # Convert numpy arrays to lists of native values
+                converted = token.tolist()
+                if isinstance(converted, list):
+                    self._ensure_serializable(converted)
+                result.append(converted)
             elif hasattr(token, 'text'):
                 # Handle spaCy-like objects with .text attribute
-                result.append(token.text)
+                result.append(self._sanitize_string(str(token.text)))
             else:
                 # Convert other types to string
-                result.append(str(token))
+                result.append(self._sanitize_string(str(token)))
                 
         return result
         
@@ -154,7 +388,7 @@ class BridgeResult:
                 elif hasattr(value, 'text'):
                     # Handle spaCy-like objects with .text attribute
                     role_copy[key] = value.text
-                elif not self._is_json_serializable(value):
+                elif not _is_convertible(value):
                     # Convert other non-serializable types to string
                     role_copy[key] = str(value)
                 else:
@@ -184,7 +418,7 @@ class BridgeResult:
             elif isinstance(value, list):
                 # Handle lists that might contain non-serializable items
                 result[key] = self._convert_list_to_serializable(value)
-            elif not self._is_json_serializable(value):
+            elif not _is_convertible(value):
                 # Convert other non-serializable types to string
                 result[key] = str(value)
             else:
@@ -216,7 +450,7 @@ class BridgeResult:
             elif isinstance(item, tuple):
                 # Convert tuples to lists
                 result.append(list(item))
-            elif not self._is_json_serializable(item):
+            elif not _is_convertible(item):
                 # Convert other non-serializable types to string
                 result.append(str(item))
             else:
@@ -261,61 +495,69 @@ class BridgeResult:
             except (TypeError, ValueError):
                 return []
         
-    def _ensure_serializable(self, obj: Union[Dict, List, Any]) -> None:
+    def _ensure_serializable(self, obj: Union[Dict, List, Any],
+                             converted: Optional[List[str]] = None) -> None:
         """
-        Recursively ensure all values in a dictionary or list are JSON serializable.
+        Ensure all values in a dictionary or list are JSON serializable, in place.
         
         This is a final validation step to guarantee that the object graph is entirely
         serializable. It handles:
         - Converting tuples to lists
         - Converting non-serializable objects to strings
-        - Special handling for numpy arrays and other common types
+        - Special handling for numpy arrays and scalars
         - Sanitizing problematic string content
         
+        The structure is walked with an explicit stack rather than recursion,
+        so deeply nested data costs no Python call frames.
+        
         Args:
-            obj: Dictionary, list, or value to check
+            obj: Dictionary or list to check
+            converted: Optional list that collects a description of every value
+                converted to a string. When omitted, a single warning is issued
+                here instead, so callers walking several objects can pass one
+                list and warn once at the end.
         """
-        if isinstance(obj, dict):
-            for key, value in list(obj.items()):
-                if isinstance(value, (dict, list)):
-                    self._ensure_serializable(value)
+        report = converted is None
+        if report:
+            converted = []
+        stack = collections.deque([obj])
+        while stack:
+            container = stack.pop()
+            if isinstance(container, dict):
+                # Only values of existing keys are reassigned below, which is
+                # safe while iterating, so the items need no snapshot
+                items = container.items()
+            else:
+                items = enumerate(container)
+            
+            for key, value in items:
+                if isinstance(value, _JSON_SCALARS):
+                    if isinstance(value, str):
+                        # Ensure all strings are valid unicode
+                        container[key] = self._sanitize_string(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
                 elif isinstance(value, tuple):
                     # Convert tuples to lists for JSON serialization
-                    obj[key] = list(value)
-                    self._ensure_serializable(obj[key])
+                    container[key] = list(value)
+                    stack.append(container[key])
                 elif np is not None and isinstance(value, np.ndarray):
-                    # Convert numpy arrays to lists
-                    obj[key] = value.tolist()
-                    # Ensure the list elements are also serializable
-                    self._ensure_serializable(obj[key])
-                elif not self._is_json_serializable(value):
-                    # For debugging purposes, warn when non-serializable items are converted
-                    warnings.warn(f"Converting non-serializable value for key '{key}' to string")
-                    obj[key] = str(value)
-                elif isinstance(value, str):
-                    # Ensure all strings are valid unicode
-                    obj[key] = self._sanitize_string(value)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                if isinstance(item, tuple):
-                    # Convert tuples to lists for JSON serialization
-                    # but don't warn since this is expected
-                    obj[i] = list(item)
-                    # Check if the tuple contents are serializable
-                    self._ensure_serializable(obj[i])
-                elif isinstance(item, (dict, list)):
-                    self._ensure_serializable(item)
-                elif np is not None and isinstance(item, np.ndarray):
-                    # Convert numpy arrays to lists
-                    obj[i] = item.tolist()
-                    # Ensure the list elements are also serializable
-                    self._ensure_serializable(obj[i])
-                elif not self._is_json_serializable(item):
-                    warnings.warn(f"Converting non-serializable value at index {i} to string")
-                    obj[i] = str(item)
-                elif isinstance(item, str):
-                    # Ensure all strings are valid unicode
-                    obj[i] = self._sanitize_string(item)
+                    # Convert numpy arrays to lists, then check their elements
+                    container[key] = value.tolist()
+                    stack.append(container[key])
+                elif np is not None and isinstance(value, np.generic):
+                    # Convert numpy scalars to the matching Python type
+                    container[key] = value.item()
+                else:
+                    # Record the conversion; the warning is issued once per walk
+                    if isinstance(container, dict):
+                        converted.append(f"key '{key}'")
+                    else:
+                        converted.append(f"index {key}")
+                    container[key] = str(value)
+        
+        if report and converted:
+            _warn_converted(converted)
     
     def _sanitize_string(self, s: str) -> str:
         """
@@ -364,62 +606,12 @@ class BridgeResult:
                     clean_chars.append('?')  # Replace with a safe character
             return ''.join(clean_chars)
     
-    def _is_json_serializable(self, obj: Any) -> bool:
-        """
-        Check if an object is JSON serializable.
-        
-        Tests whether an object can be directly serialized to JSON without conversion.
-        
-        Args:
-            obj: Object to check
-            
-        Returns:
-            True if the object is JSON serializable, False otherwise
-        """
-        # Handle basic JSON types
-        if obj is None or isinstance(obj, (bool, int, float)):
-            return True
-            
-        # Handle strings with special validation
-        if isinstance(obj, str):
-            try:
-                # Try to encode as UTF-8 to verify
-                obj.encode('utf-8')
-                return True
-            except UnicodeEncodeError:
-                return False
-                
-        # Lists and dictionaries are serializable if their contents are
-        if isinstance(obj, list):
-            return all(self._is_json_serializable(item) for item in obj)
-            
-        if isinstance(obj, dict):
-            return (all(isinstance(k, str) for k in obj.keys()) and
-                    all(self._is_json_serializable(v) for v in obj.values()))
-            
-        # Handle numpy arrays (will be converted to lists)
-        if np is not None and isinstance(obj, np.ndarray):
-            # We'll convert numpy arrays to lists regardless of content
-            # This simplifies the logic and avoids issues with boolean arrays
-            return True
-                
-        # Tuples are serializable as lists in JSON if their contents are serializable
-        if isinstance(obj, tuple):
-            return all(self._is_json_serializable(item) for item in obj)
-            
-        # Special handling for numpy scalar types
-        if np is not None:
-            if isinstance(obj, (np.integer, np.floating, np.bool_)):
-                return True
-                
-        # All other types are not directly serializable
-        return False
-    
-    def attach_to_spacy(self, doc: Doc) -> Doc:
+    def attach_to_spacy(self, doc: "Doc") -> "Doc":
         """
         Attach the result data to a spaCy Doc as custom extensions.
         
-        This method registers and assigns Doc._ extensions safely and idempotently.
+        The Doc._ extensions are registered once per process, the first time any
+        result is attached, and then simply assigned.
         
         Args:
             doc: spaCy Doc to attach results to
@@ -429,34 +621,13 @@ class BridgeResult:
             
         Raises:
             ValueError: If the doc is None
+            ImportError: If spaCy is not installed
         """
         if doc is None:
             raise ValueError("Cannot attach results to None")
         
-        if spacy is None:
-            raise ImportError("spaCy not installed. Install with: pip install spacy")
-            
-        # Register extensions if they don't exist
-        if not Doc.has_extension("nlp_bridge_spans"):
-            Doc.set_extension("nlp_bridge_spans", default=None)
-        if not Doc.has_extension("nlp_bridge_clusters"):
-            Doc.set_extension("nlp_bridge_clusters", default=None)
-        if not Doc.has_extension("nlp_bridge_roles"):
-            Doc.set_extension("nlp_bridge_roles", default=None)
-        if not Doc.has_extension("nlp_bridge_labels"):
-            Doc.set_extension("nlp_bridge_labels", default=None)
-        
-        # Register multimodal extensions if they don't exist
-        if not Doc.has_extension("nlp_bridge_image_features"):
-            Doc.set_extension("nlp_bridge_image_features", default=None)
-        if not Doc.has_extension("nlp_bridge_audio_features"):
-            Doc.set_extension("nlp_bridge_audio_features", default=None)
-        if not Doc.has_extension("nlp_bridge_multimodal_embeddings"):
-            Doc.set_extension("nlp_bridge_multimodal_embeddings", default=None)
-        if not Doc.has_extension("nlp_bridge_detected_objects"):
-            Doc.set_extension("nlp_bridge_detected_objects", default=None)
-        if not Doc.has_extension("nlp_bridge_captions"):
-            Doc.set_extension("nlp_bridge_captions", default=None)
+        # Register extensions on first use; afterwards this is a flag check
+        _register_extensions()
         
         # Assign values - text fields
         doc._.nlp_bridge_spans = self.spans
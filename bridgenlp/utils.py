@@ -4,16 +4,26 @@ Utility functions for BridgeNLP.
 This module provides common utility functions used across the BridgeNLP framework.
 """
 
+import contextlib
 import gc
+import hashlib
+import logging
 import os
 import threading
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
 
 try:
     import torch
 except ImportError:
     torch = None
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
 
 # Global model registry to avoid loading the same model multiple times
 _MODEL_REGISTRY = {}
@@ -49,6 +59,182 @@ def configure_device(device_config: Union[int, str, None]) -> int:
     return device
 
 
+def configure_threads(torch_threads: Optional[int]) -> None:
+    """
+    Set the number of threads PyTorch uses for ops on the CPU.
+    
+    The thread pool is shared by the whole process, so the last adapter
+    configured with a thread count wins.
+    
+    Args:
+        torch_threads: Value from BridgeConfig.torch_threads (None keeps the
+            PyTorch default of one thread per physical core)
+    """
+    if torch is None or not torch_threads:
+        return
+    if torch.get_num_threads() != torch_threads:
+        torch.set_num_threads(torch_threads)
+
+
+# Names accepted for BridgeConfig.dtype
+_TORCH_DTYPES = {"fp16": "float16", "bf16": "bfloat16", "fp32": "float32"}
+
+
+def configure_precision(dtype: Optional[str], device_idx: int,
+                        allow_tf32: bool = False, fp16_fallback: bool = True) -> Optional[Any]:
+    """
+    Resolve the reduced precision to run a model in.
+    
+    Reduced precision only pays off on GPUs with tensor cores, so CPU
+    models always stay in float32.
+    
+    Args:
+        dtype: Precision name from BridgeConfig.dtype ("fp16", "bf16" or "fp32")
+        device_idx: Device index from configure_device (-1 for CPU)
+        allow_tf32: Let the matmuls that remain in float32 use TF32 on GPU.
+            This is a process-wide PyTorch setting, so it is only changed
+            when asked for (BridgeConfig.allow_tf32).
+        fp16_fallback: Run in fp16 when bf16 is asked for on a GPU without
+            bf16 support; otherwise such models stay in float32
+        
+    Returns:
+        torch dtype to load the weights in and autocast to, or None to run
+        in float32
+        
+    Raises:
+        ValueError: If the precision name is unknown
+    """
+    if dtype is not None and dtype not in _TORCH_DTYPES:
+        raise ValueError(f"Invalid dtype: {dtype}. Must be one of {sorted(_TORCH_DTYPES)}")
+    
+    if torch is None or device_idx < 0:
+        return None
+    
+    if allow_tf32:
+        torch.set_float32_matmul_precision("high")
+    
+    if dtype is None or dtype == "fp32":
+        return None
+    if dtype == "bf16" and not torch.cuda.is_bf16_supported():
+        # Pre-Ampere GPUs emulate bf16 slowly, fp16 has tensor core support
+        return torch.float16 if fp16_fallback else None
+    return getattr(torch, _TORCH_DTYPES[dtype])
+
+
+# Names accepted for BridgeConfig.attn_implementation
+_ATTN_IMPLEMENTATIONS = ("eager", "sdpa", "flash_attention_2")
+
+
+def configure_attention(attn_implementation: Optional[str], device_idx: int) -> Optional[str]:
+    """
+    Resolve the attention kernels to load a model with.
+    
+    FlashAttention 2 needs an Ampere or newer GPU, so it falls back to
+    PyTorch's scaled_dot_product_attention elsewhere.
+    
+    Args:
+        attn_implementation: Name from BridgeConfig.attn_implementation
+            ("eager", "sdpa" or "flash_attention_2")
+        device_idx: Device index from configure_device (-1 for CPU)
+        
+    Returns:
+        Value for the ``attn_implementation`` argument of ``from_pretrained``,
+        or None to let transformers choose
+        
+    Raises:
+        ValueError: If the implementation name is unknown
+    """
+    if attn_implementation is not None and attn_implementation not in _ATTN_IMPLEMENTATIONS:
+        raise ValueError(
+            f"Invalid attn_implementation: {attn_implementation}. "
+            f"Must be one of {list(_ATTN_IMPLEMENTATIONS)}"
+        )
+    
+    if attn_implementation == "flash_attention_2":
+        if (torch is None or device_idx < 0 or not torch.cuda.is_available()
+                or torch.cuda.get_device_capability(device_idx)[0] < 8):
+            return "sdpa"
+    return attn_implementation
+
+
+def load_pretrained(model_cls: Any, model_name: str,
+                    attn_implementation: Optional[str] = None, **kwargs) -> Any:
+    """
+    Call ``model_cls.from_pretrained``, requesting the given attention kernels.
+    
+    Not every architecture implements every attention kernel. When the
+    model rejects the requested one it is loaded with its default instead.
+    
+    Args:
+        model_cls: transformers model class (or Auto class)
+        model_name: Name or path of the model
+        attn_implementation: Value from configure_attention, or None
+        **kwargs: Further arguments for ``from_pretrained``
+        
+    Returns:
+        The loaded model
+    """
+    if attn_implementation is None:
+        return model_cls.from_pretrained(model_name, **kwargs)
+    
+    try:
+        return model_cls.from_pretrained(
+            model_name, attn_implementation=attn_implementation, **kwargs
+        )
+    except (ValueError, ImportError) as e:
+        logger.warning(f"{model_name} does not support attn_implementation="
+                       f"{attn_implementation!r}, using its default: {e}")
+        return model_cls.from_pretrained(model_name, **kwargs)
+
+
+@contextlib.contextmanager
+def inference_context(torch_dtype: Optional[Any] = None):
+    """
+    Context manager for model forward passes and ``generate`` calls.
+    
+    Disables autograd and, given a reduced precision from
+    configure_precision, autocasts CUDA ops to it.
+    
+    Args:
+        torch_dtype: Value from configure_precision, or None for float32
+    """
+    with torch.inference_mode():
+        if torch_dtype is None:
+            yield
+        else:
+            # Weights are already loaded in torch_dtype, so there is nothing
+            # worth caching, and a cast cache would break CUDA graph capture
+            with torch.autocast("cuda", dtype=torch_dtype, cache_enabled=False):
+                yield
+
+
+def pretrained_load_kwargs(device_idx: int = -1) -> Dict[str, Any]:
+    """
+    Build ``from_pretrained`` arguments that shorten cold-start weight loading.
+    
+    With accelerate installed, the model skeleton is created without
+    random initialization and the safetensors shards are read straight
+    into it. Given a GPU index the tensors are materialized on that GPU,
+    skipping the float32 staging copy in host memory.
+    
+    Args:
+        device_idx: Device index from configure_device (-1 to load on CPU
+            and let the caller move the model)
+        
+    Returns:
+        Keyword arguments for ``from_pretrained``; empty without accelerate
+    """
+    try:
+        import accelerate  # noqa: F401
+    except ImportError:
+        return {}
+    
+    kwargs = {"low_cpu_mem_usage": True}
+    if device_idx >= 0 and torch is not None and torch.cuda.is_available():
+        kwargs["device_map"] = {"": device_idx}
+    return kwargs
+
+
 def get_param_with_fallback(
     direct_value: Any, 
     config: Any, 
@@ -75,8 +261,9 @@ def get_param_with_fallback(
     
     # Look in configuration if available
     if config:
-        # Check direct attribute
-        if hasattr(config, config_attr):
+        # Check direct attribute (config_attr="params" only names the params
+        # dict, which is not itself a value)
+        if config_attr != "params" and hasattr(config, config_attr):
             attr_value = getattr(config, config_attr)
             if attr_value is not None:
                 return attr_value
@@ -224,6 +411,84 @@ def get_model_memory_usage(model: Any) -> float:
         return 0.0
 
 
+def sorted_batches(keys: Sequence[Any], batch_size: int) -> Iterator[List[int]]:
+    """
+    Split positions into batches of inputs with similar sort keys.
+    
+    Padding a batch to its longest input wastes work on every shorter
+    one, so generation adapters batch inputs in order of their token
+    length and scatter the results back by position.
+    
+    Args:
+        keys: Sort key per input, usually its token length
+        batch_size: Maximum number of positions per batch
+        
+    Yields:
+        Lists of positions into ``keys``, in ascending key order
+    """
+    batch_size = max(1, batch_size)
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    for start in range(0, len(order), batch_size):
+        yield order[start:start + batch_size]
+
+
+def token_texts(doc: Any) -> List[str]:
+    """
+    Get the text of every token in a Doc.
+    
+    For spaCy Docs the token texts are looked up from the ORTH hashes,
+    read in one ``to_array`` call instead of creating a Token object per
+    token. Other Doc-like objects are iterated.
+    
+    Args:
+        doc: spaCy Doc, or any iterable of tokens with a ``text`` attribute
+        
+    Returns:
+        List of token texts
+    """
+    if hasattr(doc, "to_array") and hasattr(doc, "vocab"):
+        from spacy.attrs import ORTH
+        strings = doc.vocab.strings
+        return [strings[orth] for orth in doc.to_array(ORTH).tolist()]
+    return [t.text for t in doc]
+
+
+def hash_text(text: str) -> int:
+    """
+    Compute a stable 64-bit hash of a string for use in cache keys.
+    
+    Unlike the built-in ``hash``, the value does not depend on
+    ``PYTHONHASHSEED`` and is therefore reusable across processes. Uses
+    xxHash when installed and falls back to BLAKE2b otherwise.
+    
+    Args:
+        text: Text to hash
+        
+    Returns:
+        Unsigned 64-bit integer digest
+    """
+    data = text.encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def hash_tokens(tokens: Iterable[Any]) -> int:
+    """
+    Compute a stable 64-bit hash of a token sequence for use in cache keys.
+    
+    The tokens are joined with the ASCII unit separator and hashed in a
+    single pass, so no intermediate tuple is built.
+    
+    Args:
+        tokens: Tokens to hash (non-string tokens are converted with ``str``)
+        
+    Returns:
+        Unsigned 64-bit integer digest
+    """
+    return hash_text("\x1f".join(map(str, tokens)))
+
+
 def create_model_key(model_name: str, task: str, device: int) -> str:
     """
     Create a unique key for a model in the registry.
@@ -11,6 +11,7 @@ from spacy import displacy
 
 try:
     from bridgenlp.adapters.hf_classification import HuggingFaceClassificationBridge
+    from bridgenlp.result import BridgeResult
 except ImportError:
     raise ImportError(
         "Hugging Face dependencies not found. Install with: "
@@ -20,12 +21,13 @@ except ImportError:
 
 def main():
     """Run the text classification demo."""
-    # Create a spaCy pipeline
-    nlp = spacy.load("en_core_web_sm")
+    # Create a spaCy pipeline. Classification works on raw text, so only the
+    # parser and tagger are kept for the dependency visualization below.
+    nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer"])
     
     # Create a text classification bridge with custom labels
     classification_bridge = HuggingFaceClassificationBridge(
-        labels=["politics", "sports", "technology", "entertainment", "business"]
+        labels=("politics", "sports", "technology", "entertainment", "business")
     )
     
     # Process multiple texts with text classification
@@ -35,11 +37,21 @@ def main():
         "The stock market reached a new high after the interest rate announcement."
     ]
     
-    for text in texts:
-        doc = nlp(text)
-        
-        # Apply text classification
-        doc = classification_bridge.from_spacy(doc)
+    # Tokenize all texts in one nlp.pipe call and classify them in a
+    # single model batch instead of running both once per text. Repeated
+    # texts (common in evaluation loops) are only sent to the model once.
+    docs = nlp.pipe(texts, batch_size=len(texts))
+    unique_texts = list(dict.fromkeys(texts))
+    results_by_text = dict(zip(unique_texts, classification_bridge.from_batch(unique_texts)))
+    
+    classified_docs = []
+    for text, doc in zip(texts, docs):
+        result = results_by_text[text]
+        # Attach the classification results
+        doc = BridgeResult(
+            tokens=[t.text for t in doc],
+            roles=result.roles
+        ).attach_to_spacy(doc)
         
         # Print the classification results
         print(f"\nText: {text}")
@@ -47,9 +59,11 @@ def main():
         for role in doc._.nlp_bridge_roles:
             print(f"  - {role['label']} (confidence: {role['score']:.2f})")
         
-        # Visualize the document
-        print("\nDocument visualization:")
-        displacy.render(doc, style="dep")
+        classified_docs.append(doc)
+    
+    # Visualize all documents in a single rendering pass
+    print("\nDocument visualization:")
+    displacy.render(classified_docs, style="dep")
 
 
 if __name__ == "__main__":
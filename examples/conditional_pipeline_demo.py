@@ -32,13 +32,18 @@ def main():
     print("BridgeNLP Conditional Pipeline Demo")
     print("-----------------------------------")
     
-    # Create a spaCy pipeline
+    # Create a spaCy pipeline. Only NER is needed (SpacyNERBridge reuses
+    # doc.ents), so the other components are not even loaded.
     print("\nInitializing spaCy...")
-    nlp = spacy.load("en_core_web_sm")
+    nlp = spacy.load(
+        "en_core_web_sm",
+        exclude=["tagger", "parser", "attribute_ruler", "lemmatizer"]
+    )
     
     # Create individual adapters
     print("Creating NER adapter...")
-    ner_bridge = SpacyNERBridge(model_name="en_core_web_sm")
+    # Reuse the pipeline loaded above instead of loading the model twice
+    ner_bridge = SpacyNERBridge(nlp=nlp)
     
     print("Creating SRL adapter...")
     srl_bridge = HuggingFaceSRLBridge()
@@ -59,12 +64,19 @@ def main():
     # This allows focusing sentiment analysis only on texts mentioning organizations
     print("Adding condition: Only run sentiment analysis if text mentions an organization...")
     
+    # A plain set lookup beats compiled kernels here: converting the span and
+    # label lists to arrays on every call would cost more than the scan itself
     def has_organization(result):
-        for start, end in result.spans:
-            if start < len(result.labels) and result.labels[start] == "ORG":
-                return True
-        return False
-    
+        labels = result.labels
+        # Cheap C-level scan first: most texts have no ORG label at all
+        if "ORG" not in labels:
+            return False
+        org_positions = {i for i, label in enumerate(labels) if label == "ORG"}
+        return any(start in org_positions for start, _ in result.spans)
+
+    # The condition only reads the result, so the pipeline can skip copying it
+    has_organization.readonly = True
+
     # The sentiment adapter is at index 2 (third adapter)
     pipeline.add_condition(2, has_organization)
     
@@ -20,29 +20,34 @@ except ImportError:
 
 def main():
     """Run the coreference resolution demo."""
-    # Create a spaCy pipeline
-    nlp = spacy.load("en_core_web_sm")
+    # Create a spaCy pipeline. The parser is kept for the dependency
+    # visualization; entities and lemmas are never used.
+    nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer"])
     
     # Create a coreference resolution bridge
     coref_bridge = AllenNLPCorefBridge()
     
-    # Process a text with coreference resolution
-    text = "Julie hugged David because she missed him. She had not seen him in a long time."
-    doc = nlp(text)
+    # Process texts with coreference resolution
+    texts = [
+        "Julie hugged David because she missed him. She had not seen him in a long time."
+    ]
     
-    # Apply coreference resolution
-    doc = coref_bridge.from_spacy(doc)
-    
-    # Print the coreference clusters
-    print("Coreference clusters:")
-    for i, cluster in enumerate(doc._.nlp_bridge_clusters):
-        print(f"Cluster {i + 1}:")
-        for start, end in cluster:
-            print(f"  - {doc[start:end].text}")
-    
-    # Visualize the document
-    print("\nDocument visualization:")
-    displacy.render(doc, style="dep")
+    # nlp.pipe batches the spaCy work; with more texts this is much faster
+    # than calling nlp(text) once per text
+    for doc in nlp.pipe(texts, batch_size=32):
+        # Apply coreference resolution
+        doc = coref_bridge.from_spacy(doc)
+        
+        # Print the coreference clusters
+        print("Coreference clusters:")
+        for i, cluster in enumerate(doc._.nlp_bridge_clusters):
+            print(f"Cluster {i + 1}:")
+            for start, end in cluster:
+                print(f"  - {doc[start:end].text}")
+        
+        # Visualize the document
+        print("\nDocument visualization:")
+        displacy.render(doc, style="dep")
 
 
 if __name__ == "__main__":
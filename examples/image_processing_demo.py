@@ -17,8 +17,7 @@ from typing import List, Dict, Any
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 try:
-    from bridgenlp.adapters.image_captioning import ImageCaptioningBridge
-    from bridgenlp.adapters.object_detection import ObjectDetectionBridge
+    from bridgenlp.adapters.multitask_image import MultiTaskImageBridge
     from bridgenlp.pipeline import Pipeline
     from bridgenlp.config import BridgeConfig
 except ImportError:
@@ -43,6 +42,23 @@ def process_image(image_path: str, use_gpu: bool = False) -> None:
         image_path: Path to the image file
         use_gpu: Whether to use GPU for processing
     """
+    process_images([image_path], use_gpu)
+
+
+def process_images(image_paths: List[str], use_gpu: bool = False, batch_size: int = 8,
+                   dtype: str = "fp16") -> None:
+    """
+    Process images using both captioning and object detection.
+    
+    Each image is read once and the decoded batch is shared by the
+    captioning and detection models, which run side by side.
+    
+    Args:
+        image_paths: Paths to the image files
+        use_gpu: Whether to use GPU for processing
+        batch_size: Number of images per model call
+        dtype: Precision to run the models in on GPU ("fp16", "bf16" or "fp32")
+    """
     device = 0 if use_gpu else -1
     
     # Create a configuration
@@ -50,40 +66,49 @@ def process_image(image_path: str, use_gpu: bool = False) -> None:
     config.device = device
     config.modality = "image"
     config.collect_metrics = True
+    config.batch_size = batch_size
+    config.dtype = dtype
+    if use_gpu:
+        # PyTorch's fused attention kernels where the models support them
+        config.attn_implementation = "sdpa"
     
-    print(f"\nProcessing image: {image_path}")
-    print("-" * 50)
-    
-    # Image captioning
-    print("\n1. Image Captioning")
-    captioning = ImageCaptioningBridge(device=device, config=config)
-    captioning.num_captions = 3  # Generate multiple captions
-    
-    caption_result = captioning.from_image(image_path)
+    # Image captioning and object detection in one pass
+    print("\nImage Captioning + Object Detection")
+    bridge = MultiTaskImageBridge(device=device, config=config)
+    bridge.captioning.num_captions = 3  # Generate multiple captions
+    bridge.detection.threshold = 0.7  # Lower threshold to detect more objects
     
-    print("Captions:")
-    for i, caption in enumerate(caption_result.captions):
-        print(f"  {i+1}. {caption}")
+    results = bridge.from_image_batch(image_paths)
     
-    # Object detection
-    print("\n2. Object Detection")
-    detection = ObjectDetectionBridge(device=device, config=config)
-    detection.threshold = 0.7  # Lower threshold to detect more objects
-    
-    detection_result = detection.from_image(image_path)
-    
-    print(f"Detected {len(detection_result.detected_objects)} objects:")
-    for obj in detection_result.detected_objects:
-        print(f"  - {obj['label']} (confidence: {obj['score']:.2f})")
+    for image_path, result in zip(image_paths, results):
+        print(f"\nProcessing image: {image_path}")
+        print("-" * 50)
+        
+        print("Captions:")
+        for i, caption in enumerate(result.captions):
+            print(f"  {i+1}. {caption}")
+        
+        # Detections also come as parallel arrays, so filtering them is a
+        # single vectorized comparison
+        features = result.image_features or {}
+        if "scores" in features:
+            scores = features["scores"]
+            confident = int((scores >= 0.9).sum())
+            print(f"Detected {len(scores)} objects ({confident} with confidence >= 0.9):")
+            for label, score in zip(features["labels"], scores.tolist()):
+                print(f"  - {label} (confidence: {score:.2f})")
+        
+        # Errors for individual images are reported in the labels
+        for label in result.labels:
+            if label.startswith("Error processing"):
+                print(f"  ! {label}")
     
     # Display performance metrics
     print("\nPerformance Metrics:")
-    print(f"  Captioning: {captioning.get_metrics()['avg_time']:.4f} seconds")
-    print(f"  Detection: {detection.get_metrics()['avg_time']:.4f} seconds")
+    print(f"  Captioning + detection: {bridge.get_metrics()['total_time']:.4f} seconds")
     
     # Clean up resources
-    captioning.cleanup()
-    detection.cleanup()
+    bridge.cleanup()
     
     # If rich is available, show a more detailed view
     if HAS_RICH:
@@ -91,45 +116,55 @@ def process_image(image_path: str, use_gpu: bool = False) -> None:
         
         console.print("\n[bold cyan]Rich Formatted Output[/bold cyan]")
         
-        # Captions panel
-        console.print(Panel(
-            "\n".join([f"{i+1}. {caption}" for i, caption in enumerate(caption_result.captions)]),
-            title="Image Captions",
-            border_style="green"
-        ))
-        
-        # Object detection table
-        table = Table(title="Detected Objects")
-        table.add_column("Label", style="cyan")
-        table.add_column("Confidence", style="magenta")
-        table.add_column("Bounding Box", style="blue")
-        
-        for obj in detection_result.detected_objects:
-            table.add_row(
-                obj['label'],
-                f"{obj['score']:.2f}",
-                f"{obj['box']}"
-            )
-        
-        console.print(table)
+        for image_path, result in zip(image_paths, results):
+            # Captions panel
+            console.print(Panel(
+                "\n".join([f"{i+1}. {caption}" for i, caption in enumerate(result.captions)]),
+                title=f"Image Captions: {os.path.basename(image_path)}",
+                border_style="green"
+            ))
+            
+            # Object detection table
+            table = Table(title="Detected Objects")
+            table.add_column("Label", style="cyan")
+            table.add_column("Confidence", style="magenta")
+            table.add_column("Bounding Box", style="blue")
+            
+            features = result.image_features or {}
+            for label, score, box in zip(
+                features.get("labels", []),
+                features.get("scores", []),
+                features.get("boxes", [])
+            ):
+                table.add_row(
+                    label,
+                    f"{score:.2f}",
+                    f"{box.astype(int).tolist()}"
+                )
+            
+            console.print(table)
 
 
 def main():
     """Main function to run the demo."""
     parser = argparse.ArgumentParser(description="BridgeNLP Image Processing Demo")
-    parser.add_argument("image_path", help="Path to the image file to process")
+    parser.add_argument("image_paths", nargs="+", help="Path(s) to the image file(s) to process")
     parser.add_argument("--gpu", action="store_true", help="Use GPU for processing")
+    parser.add_argument("--batch-size", type=int, default=8, help="Number of images per model call")
+    parser.add_argument("--dtype", choices=["fp16", "bf16", "fp32"], default="fp16",
+                        help="Precision to run the models in on GPU")
     
     args = parser.parse_args()
     
-    # Verify the image file exists
-    if not os.path.exists(args.image_path) or not os.path.isfile(args.image_path):
-        print(f"Error: Image file not found at {args.image_path}")
-        sys.exit(1)
+    # Verify the image files exist
+    for image_path in args.image_paths:
+        if not os.path.exists(image_path) or not os.path.isfile(image_path):
+            print(f"Error: Image file not found at {image_path}")
+            sys.exit(1)
     
-    # Process the image
+    # Process the images
     try:
-        process_image(args.image_path, args.gpu)
+        process_images(args.image_paths, args.gpu, args.batch_size, args.dtype)
     except ImportError as e:
         print(f"Error: Missing dependencies. {str(e)}")
         print("Install required packages with: pip install 'bridgenlp[multimodal]' or pip install transformers torch pillow")
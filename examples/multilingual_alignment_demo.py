@@ -9,6 +9,11 @@ from bridgenlp.aligner import TokenAligner
 from bridgenlp.adapters.hf_translation import HuggingFaceTranslationBridge
 from bridgenlp.result import BridgeResult
 
+def _tokenize_for_script(aligner, text, script_type):
+    """Tokenize text with the aligner's tokenizer for a script type."""
+    handlers = aligner._script_handlers
+    return handlers.get(script_type, handlers["other"])["tokenize"](text)
+
 def demonstrate_script_detection():
     """Demonstrate automatic script detection for various languages."""
     print("\n===== SCRIPT DETECTION =====")
@@ -50,15 +55,7 @@ def demonstrate_script_specific_tokenization():
         print(f"Original: '{text}'")
         
         # Use script-specific tokenization
-        if script_type == "latin" or script_type == "cyrillic":
-            tokens = aligner._tokenize_latin(text)
-        elif script_type == "cjk":
-            tokens = aligner._tokenize_cjk(text)
-        elif script_type == "arabic":
-            tokens = aligner._tokenize_arabic(text)
-        else:
-            tokens = aligner._tokenize_default(text)
-            
+        tokens = _tokenize_for_script(aligner, text, script_type)
         print(f"Tokens ({len(tokens)}): {tokens}")
 
 def demonstrate_multilingual_alignment():
@@ -104,19 +101,7 @@ def demonstrate_multilingual_alignment():
         if span:
             print(f"Match found: '{span.text}'")
             # Calculate similarity score
-            if script_type == "latin" or script_type == "cyrillic":
-                tokens = aligner._tokenize_latin(segment)
-                score_method = aligner._score_latin
-            elif script_type == "cjk":
-                tokens = aligner._tokenize_cjk(segment)
-                score_method = aligner._score_latin  # Fallback to avoid errors
-            elif script_type == "arabic":
-                tokens = aligner._tokenize_arabic(segment)
-                score_method = aligner._score_latin  # Fallback to avoid errors
-            else:
-                tokens = aligner._tokenize_default(segment)
-                score_method = aligner._score_default
-                
+            tokens = _tokenize_for_script(aligner, segment, script_type)
             similarity = aligner._calculate_similarity_score(span, tokens, script_type)
             print(f"Similarity score: {similarity:.2f}")
         else:
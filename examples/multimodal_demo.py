@@ -10,8 +10,15 @@ This example showcases the integration of text and image processing:
 
 import os
 import sys
+import json
+import queue
+import threading
+import importlib.util
 import argparse
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 # Add the parent directory to the path to allow running from examples directory
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -23,6 +30,8 @@ try:
     from bridgenlp.adapters.hf_sentiment import HuggingFaceSentimentBridge
     from bridgenlp.pipeline import Pipeline
     from bridgenlp.config import BridgeConfig
+    from bridgenlp.cache import PersistentCache, file_digest
+    from bridgenlp.utils import hash_text
 except ImportError:
     print("Error: BridgeNLP package not found. Make sure it's installed or run from the correct directory.")
     sys.exit(1)
@@ -31,12 +40,44 @@ try:
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
-    from rich.progress import Progress
+    from rich.progress import track
     HAS_RICH = True
 except ImportError:
     HAS_RICH = False
     print("Note: Install 'rich' package for better output formatting: pip install rich")
 
+# File extensions picked up when searching a directory
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp"}
+
+# Images embedded per forward pass when searching a directory
+EMBED_BATCH_SIZE = 32
+
+# Embeddings and captions are cached here, keyed by model and image contents
+RESULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "bridgenlp", "multimodal_demo.sqlite")
+
+# Image search index files, saved in the searched directory
+HNSW_INDEX_FILE = ".bridgenlp_hnsw.bin"
+HNSW_NAMES_FILE = ".bridgenlp_hnsw.json"
+
+# Normalized float16 embedding matrix for exhaustive search, saved in the searched directory
+EMBEDDINGS_FILE = ".bridgenlp_embeddings.npy"
+EMBEDDINGS_NAMES_FILE = ".bridgenlp_embeddings.json"
+
+# Rows scored per matrix-vector product, bounding the float32 copy of the matrix
+SEARCH_BLOCK_ROWS = 100000
+
+
+# Shared rich console, created on first use
+_console = None
+
+
+def _get_console() -> "Console":
+    """Return the console shared by all output of this demo."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 def calculate_text_image_similarity(text: str, image_path: str, use_gpu: bool = False) -> None:
     """
@@ -54,6 +95,10 @@ def calculate_text_image_similarity(text: str, image_path: str, use_gpu: bool =
     config.device = device
     config.modality = "multimodal"
     config.collect_metrics = True
+    if use_gpu:
+        # bf16 weights (fp16 on pre-Ampere GPUs) with PyTorch's fused attention
+        config.dtype = "bf16"
+        config.attn_implementation = "sdpa"
     
     print(f"\nCalculating similarity between text and image")
     print(f"Text: \"{text}\"")
@@ -80,14 +125,334 @@ def calculate_text_image_similarity(text: str, image_path: str, use_gpu: bool =
     embeddings.cleanup()
 
 
-def image_search_by_text(text_query: str, image_dir: str, use_gpu: bool = False) -> None:
+def _list_images(image_dir: str) -> List[str]:
+    """
+    List the image files in a directory.
+    
+    Args:
+        image_dir: Directory to list
+        
+    Returns:
+        Paths of the files with an image extension, sorted so that indexes
+        are built in a stable order
+    """
+    with os.scandir(image_dir) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+        )
+
+
+def _file_stamp(path: str) -> Tuple[str, int, int]:
+    """
+    Identify the current version of an image file without reading it.
+    
+    Args:
+        path: Path to the image file
+        
+    Returns:
+        Tuple of (file name, modification time in ns, size in bytes), which
+        changes when an image is edited or replaced under the same name
+    """
+    stat = os.stat(path)
+    return os.path.basename(path), stat.st_mtime_ns, stat.st_size
+
+
+def _write_json(path: str, data: Any) -> None:
+    """
+    Write a JSON file, replacing the old one only once the new one is complete.
+    
+    Args:
+        path: Path of the file to write
+        data: JSON-serializable data
+    """
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)
+
+
+def _image_cache_key(model_name: str, task: str, image_path: str) -> Optional[str]:
+    """
+    Build the result cache key of an image, or None if it cannot be read.
+    
+    Args:
+        model_name: Model producing the result
+        task: Kind of result ("embedding" or "caption")
+        image_path: Path to the image file
+        
+    Returns:
+        Cache key combining the model, task and image contents
+    """
+    try:
+        return f"{model_name}:{task}:{file_digest(image_path)}"
+    except OSError:
+        return None
+
+
+def _embed_images(embeddings: MultimodalEmbeddingsBridge, image_files: List[str],
+                  cache: Optional[PersistentCache] = None) -> Tuple[List[str], "np.ndarray"]:
+    """
+    Embed images in batches, showing progress.
+    
+    Images whose contents were embedded by the same model before are read
+    from the cache; the others go through the model in chunks, several
+    chunks at a time.
+    
+    Args:
+        embeddings: Embeddings bridge to use
+        image_files: Paths of the images to embed
+        cache: Optional result cache
+        
+    Returns:
+        Tuple of (paths that were embedded, float32 matrix with one row per path).
+        Images that fail to load are reported and skipped.
+    """
+    results = {}
+    keys = {}
+    if cache is not None:
+        # Hashing is file I/O and releases the GIL, so read the files in parallel
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            digests = executor.map(
+                lambda path: _image_cache_key(embeddings.model_name, "embedding", path), image_files
+            )
+            for image_path, key in zip(image_files, digests):
+                if key is None:
+                    continue
+                keys[image_path] = key
+                cached = cache.get(key)
+                if cached is not None:
+                    results[image_path] = cached
+        if results:
+            print(f"Loaded {len(results)} cached image embeddings")
+    
+    missing = [image_path for image_path in image_files if image_path not in results]
+    chunks = [missing[i:i + EMBED_BATCH_SIZE] for i in range(0, len(missing), EMBED_BATCH_SIZE)]
+    if not chunks:
+        return _stack_embeddings(image_files, results)
+    
+    # Embed a few chunks at once so one chunk's file reads and decoding overlap
+    # another's forward pass; on GPU two are enough and keep memory use bounded
+    max_workers = 2 if embeddings.device_idx >= 0 else min(4, os.cpu_count() or 1)
+    
+    def add(chunk, chunk_results):
+        # Failed images come back as error results
+        for image_path, image_result in zip(chunk, chunk_results):
+            if image_result.image_features:
+                results[image_path] = image_result
+                if image_path in keys:
+                    cache.set(keys[image_path], image_result)
+            else:
+                print(image_result.labels[0])
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(embeddings.from_image_batch, chunk): chunk for chunk in chunks}
+        
+        # Progress is updated from this thread as chunks finish
+        if HAS_RICH:
+            for future in track(as_completed(futures), total=len(futures),
+                                description="[cyan]Embedding images...", console=_get_console()):
+                add(futures[future], future.result())
+        else:
+            # Simple progress without rich
+            done = 0
+            for future in as_completed(futures):
+                add(futures[future], future.result())
+                done += len(futures[future])
+                print(f"Processed {done}/{len(missing)} images", end="\r")
+            print()  # New line after progress
+    
+    return _stack_embeddings(image_files, results)
+
+
+def _stack_embeddings(image_files: List[str], results: Dict[str, Any]) -> Tuple[List[str], "np.ndarray"]:
+    """
+    Stack the embeddings of the images that have one, in input order.
+    
+    Args:
+        image_files: Paths of the images, in the order to keep
+        results: Embedding result per path
+        
+    Returns:
+        Tuple of (paths with an embedding, float32 matrix with one row per path)
+    """
+    paths = [image_path for image_path in image_files if image_path in results]
+    vectors = [results[image_path].image_features["embedding"] for image_path in paths]
+    if not vectors:
+        return paths, np.empty((0, 0), dtype=np.float32)
+    return paths, np.asarray(vectors, dtype=np.float32)
+
+
+def _load_image_index(embeddings: MultimodalEmbeddingsBridge, image_dir: str,
+                      image_files: List[str], cache: Optional[PersistentCache] = None
+                      ) -> Optional[Tuple[Any, List[str], int]]:
+    """
+    Load or build the HNSW index of a directory's image embeddings.
+    
+    The index is saved next to the images, with a JSON file mapping its
+    ids to the name, modification time and size of each image. Later
+    searches load it and only embed images added or changed since; images
+    that were removed or changed are excluded from the results.
+    
+    Args:
+        embeddings: Embeddings bridge to use
+        image_dir: Directory containing the images
+        image_files: Paths of the images currently in the directory
+        cache: Optional result cache for the image embeddings
+        
+    Returns:
+        Tuple of (hnswlib index, file name per id, number of searchable
+        images), or None if hnswlib is not installed or nothing could be
+        embedded
+    """
+    try:
+        import hnswlib
+    except ImportError:
+        print("Note: Install 'hnswlib' to index the directory for faster repeat searches: pip install hnswlib")
+        return None
+    
+    index_path = os.path.join(image_dir, HNSW_INDEX_FILE)
+    names_path = os.path.join(image_dir, HNSW_NAMES_FILE)
+    
+    # Reuse the saved index if it was built with the same model
+    index, stamps = None, []
+    if os.path.exists(index_path) and os.path.exists(names_path):
+        try:
+            with open(names_path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved["model"] == embeddings.model_name:
+                index = hnswlib.Index(space="cosine", dim=saved["dim"])
+                index.load_index(index_path, max_elements=len(saved["files"]))
+                stamps = [tuple(entry) for entry in saved["files"]]
+        except (OSError, ValueError, KeyError, TypeError, RuntimeError) as e:
+            print(f"Rebuilding image index: {str(e)}")
+            index, stamps = None, []
+    
+    # Embed and insert images added or changed since the index was saved
+    current = {path: _file_stamp(path) for path in image_files}
+    known = set(stamps)
+    new_files = [path for path in image_files if current[path] not in known]
+    if new_files:
+        print(f"Indexing {len(new_files)} new images")
+        new_paths, vectors = _embed_images(embeddings, new_files, cache)
+        if new_paths:
+            if index is None:
+                index = hnswlib.Index(space="cosine", dim=vectors.shape[1])
+                index.init_index(max_elements=len(new_paths), ef_construction=200, M=16)
+            else:
+                index.resize_index(len(stamps) + len(new_paths))
+            index.add_items(vectors, np.arange(len(stamps), len(stamps) + len(new_paths)))
+            stamps = stamps + [current[path] for path in new_paths]
+            
+            # Replace the files only once the new ones are complete
+            index.save_index(index_path + ".tmp")
+            os.replace(index_path + ".tmp", index_path)
+            _write_json(names_path, {"model": embeddings.model_name,
+                                     "dim": int(vectors.shape[1]), "files": stamps})
+    
+    if index is None:
+        return None
+    
+    # Hide images that are no longer in the directory or have changed
+    live = set(current.values())
+    searchable = 0
+    for label, stamp in enumerate(stamps):
+        if stamp in live:
+            searchable += 1
+        else:
+            try:
+                index.mark_deleted(label)
+            except RuntimeError:
+                pass  # Already marked
+    
+    return index, [stamp[0] for stamp in stamps], searchable
+
+
+def _load_embedding_matrix(embeddings: MultimodalEmbeddingsBridge, image_dir: str,
+                           image_files: List[str], cache: Optional[PersistentCache] = None
+                           ) -> Tuple[List[str], "np.ndarray"]:
+    """
+    Load or build the normalized embedding matrix of a directory's images.
+    
+    The matrix is saved next to the images as a float16 .npy file, with a
+    JSON file giving the name, modification time and size of the image of
+    each row. Later searches memory-map it, so only the pages touched by
+    the search are read, and only embed images added or changed since;
+    rows of images that were removed or changed are left out.
+    
+    Args:
+        embeddings: Embeddings bridge to use
+        image_dir: Directory containing the images
+        image_files: Paths of the images currently in the directory
+        cache: Optional result cache for the image embeddings
+        
+    Returns:
+        Tuple of (paths with an embedding, float16 matrix with one
+        normalized row per path)
+    """
+    matrix_path = os.path.join(image_dir, EMBEDDINGS_FILE)
+    names_path = os.path.join(image_dir, EMBEDDINGS_NAMES_FILE)
+    
+    # Reuse the saved matrix if it was built with the same model
+    matrix, stamps = None, []
+    if os.path.exists(matrix_path) and os.path.exists(names_path):
+        try:
+            with open(names_path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved["model"] == embeddings.model_name:
+                matrix = np.load(matrix_path, mmap_mode="r")
+                stamps = [tuple(entry) for entry in saved["files"]]
+                if matrix.shape[0] != len(stamps):
+                    raise ValueError("embedding matrix does not match its names file")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Rebuilding embedding matrix: {str(e)}")
+            matrix, stamps = None, []
+    
+    # Embed and append images added or changed since the matrix was saved
+    current = {path: _file_stamp(path) for path in image_files}
+    known = set(stamps)
+    new_files = [path for path in image_files if current[path] not in known]
+    if new_files:
+        new_paths, vectors = _embed_images(embeddings, new_files, cache)
+        if new_paths:
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+            vectors = vectors.astype(np.float16)
+            matrix = vectors if matrix is None else np.concatenate([matrix, vectors])
+            stamps = stamps + [current[path] for path in new_paths]
+            
+            # Replace the files only once the new ones are complete
+            with open(matrix_path + ".tmp", "wb") as f:
+                np.save(f, matrix)
+            os.replace(matrix_path + ".tmp", matrix_path)
+            _write_json(names_path, {"model": embeddings.model_name, "files": stamps})
+    
+    if matrix is None:
+        return [], np.empty((0, 0), dtype=np.float16)
+    
+    # Leave out images that are no longer in the directory or have changed
+    live = set(current.values())
+    rows = [row for row, stamp in enumerate(stamps) if stamp in live]
+    if len(rows) < len(stamps):
+        matrix = matrix[rows]
+    return [os.path.join(image_dir, stamps[row][0]) for row in rows], matrix
+
+
+def image_search_by_text(text_query: str, image_dir: str, use_gpu: bool = False,
+                         use_cache: bool = True) -> None:
     """
     Search for images by text description.
     
+    Image embeddings are kept in an HNSW index saved in the image
+    directory when hnswlib is installed, and otherwise in a memory-mapped
+    matrix saved there that is compared with the query exhaustively, so
+    repeat searches skip re-embedding. Embeddings are also cached by image
+    contents across runs.
+    
     Args:
         text_query: Text description to search for
         image_dir: Directory containing images
         use_gpu: Whether to use GPU for processing
+        use_cache: Whether to use the on-disk result cache
     """
     device = 0 if use_gpu else -1
     
@@ -95,16 +460,20 @@ def image_search_by_text(text_query: str, image_dir: str, use_gpu: bool = False)
     config = BridgeConfig()
     config.device = device
     config.modality = "multimodal"
+    if use_gpu:
+        # bf16 weights (fp16 on pre-Ampere GPUs) with PyTorch's fused attention
+        config.dtype = "bf16"
+        config.attn_implementation = "sdpa"
+    elif importlib.util.find_spec("onnxruntime") is not None:
+        # ONNX Runtime runs CLIP considerably faster than PyTorch on CPU
+        config.params["onnx"] = True
     
     print(f"\nSearching for images matching: \"{text_query}\"")
     print(f"Image directory: {image_dir}")
     print("-" * 50)
     
     # Find image files in the directory
-    image_files = []
-    for file in os.listdir(image_dir):
-        if file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-            image_files.append(os.path.join(image_dir, file))
+    image_files = _list_images(image_dir)
     
     if not image_files:
         print(f"No image files found in {image_dir}")
@@ -115,71 +484,70 @@ def image_search_by_text(text_query: str, image_dir: str, use_gpu: bool = False)
     # Create multimodal embeddings bridge
     embeddings = MultimodalEmbeddingsBridge(device=device, config=config)
     
-    # Calculate text embedding once
-    text_result = embeddings.from_text(text_query)
-    text_embedding = text_result.roles[0]["embedding"]
-    
-    # Calculate similarity with each image
-    similarities = []
+    cache = PersistentCache(RESULT_CACHE_PATH) if use_cache else None
     
-    # Use rich progress bar if available
-    if HAS_RICH:
-        console = Console()
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Calculating similarities...", total=len(image_files))
-            
-            for image_path in image_files:
-                try:
-                    # Get image embedding
-                    image_result = embeddings.from_image(image_path)
-                    image_embedding = image_result.image_features["embedding"]
-                    
-                    # Calculate cosine similarity (dot product of normalized vectors)
-                    import numpy as np
-                    similarity = np.dot(text_embedding, image_embedding)
-                    
-                    similarities.append((image_path, similarity))
-                    progress.update(task, advance=1)
-                except Exception as e:
-                    print(f"Error processing {image_path}: {str(e)}")
-                    progress.update(task, advance=1)
+    # Calculate text embedding once, reusing it when the same query was searched before
+    if cache is not None:
+        text_key = f"{embeddings.model_name}:text:{hash_text(text_query):016x}"
+        text_result = cache.get_or_compute(text_key, lambda: embeddings.from_text(text_query))
     else:
-        # Simple progress without rich
-        for i, image_path in enumerate(image_files):
-            print(f"Processing image {i+1}/{len(image_files)}", end="\r")
-            try:
-                # Get image embedding
-                image_result = embeddings.from_image(image_path)
-                image_embedding = image_result.image_features["embedding"]
-                
-                # Calculate cosine similarity
-                import numpy as np
-                similarity = np.dot(text_embedding, image_embedding)
-                
-                similarities.append((image_path, similarity))
-            except Exception as e:
-                print(f"\nError processing {image_path}: {str(e)}")
-        print()  # New line after progress
-    
-    # Sort by similarity (descending)
-    similarities.sort(key=lambda x: x[1], reverse=True)
+        text_result = embeddings.from_text(text_query)
+    text_embedding = np.asarray(text_result.roles[0]["embedding"], dtype=np.float32)
+    
+    indexed = _load_image_index(embeddings, image_dir, image_files, cache)
+    if indexed is not None:
+        # Approximate nearest neighbours (cosine distance = 1 - similarity)
+        index, names, searchable = indexed
+        k = min(5, searchable)
+        if k:
+            index.set_ef(max(50, k))
+            labels, distances = index.knn_query(text_embedding, k=k)
+            matches = [
+                (os.path.join(image_dir, names[label]), 1.0 - distance)
+                for label, distance in zip(labels[0], distances[0])
+            ]
+        else:
+            matches = []
+    else:
+        # Exhaustive search: cosine similarity is the dot product of normalized
+        # vectors, and the saved rows are already normalized
+        paths, image_matrix = _load_embedding_matrix(embeddings, image_dir, image_files, cache)
+        matches = []
+        if paths:
+            query = text_embedding / max(np.linalg.norm(text_embedding), 1e-12)
+            
+            # numpy has no float16 matrix-vector kernel, so score blocks of rows in float32
+            similarities = np.concatenate([
+                np.asarray(image_matrix[start:start + SEARCH_BLOCK_ROWS], dtype=np.float32) @ query
+                for start in range(0, len(paths), SEARCH_BLOCK_ROWS)
+            ])
+            
+            # Select the top 5 without sorting every score
+            k = min(5, len(paths))
+            top = np.argpartition(similarities, -k)[-k:]
+            top = top[np.argsort(-similarities[top])]
+            matches = [(paths[i], similarities[i]) for i in top]
     
     # Display top results
     print("\nTop matches:")
-    for i, (image_path, similarity) in enumerate(similarities[:5]):
+    for i, (image_path, similarity) in enumerate(matches):
         print(f"{i+1}. {os.path.basename(image_path)} - Similarity: {similarity:.4f}")
     
     # Clean up resources
+    if cache is not None:
+        cache.close()
     embeddings.cleanup()
 
 
-def analyze_image_sentiment(image_path: str, use_gpu: bool = False) -> None:
+def analyze_image_sentiment(image_path: str, use_gpu: bool = False,
+                            use_cache: bool = True) -> None:
     """
     Generate a caption for an image and analyze its sentiment.
     
     Args:
         image_path: Path to the image file
         use_gpu: Whether to use GPU for processing
+        use_cache: Whether to reuse a caption cached for the same image contents
     """
     device = 0 if use_gpu else -1
     
@@ -187,22 +555,38 @@ def analyze_image_sentiment(image_path: str, use_gpu: bool = False) -> None:
     config = BridgeConfig()
     config.device = device
     config.collect_metrics = True
+    if use_gpu:
+        # bf16 weights (fp16 on pre-Ampere GPUs) with PyTorch's fused attention
+        config.dtype = "bf16"
+        config.attn_implementation = "sdpa"
     
     print(f"\nAnalyzing image sentiment: {image_path}")
     print("-" * 50)
     
     # Create the pipeline with captioning and sentiment analysis
-    captioning = ImageCaptioningBridge(device=device)
+    captioning = ImageCaptioningBridge(device=device, config=config)
     sentiment = HuggingFaceSentimentBridge(device=device)
     
     # Create a pipeline that first generates a caption and then analyzes its sentiment
     pipeline = Pipeline([captioning, sentiment], config=config)
     
+    # The two models run one after the other, so only one of them needs to be on the GPU
+    if use_gpu and importlib.util.find_spec("accelerate") is not None:
+        pipeline.enable_model_cpu_offload(gpu_id=device)
+    
     # Process the image
     try:
         # Since the pipeline expects text input, we can't use it directly with an image
         # Instead, we'll manually get the caption and then process it
-        caption_result = captioning.from_image(image_path)
+        key = _image_cache_key(captioning.model_name, "caption", image_path) if use_cache else None
+        if key is not None:
+            cache = PersistentCache(RESULT_CACHE_PATH)
+            try:
+                caption_result = cache.get_or_compute(key, lambda: captioning.from_image(image_path))
+            finally:
+                cache.close()
+        else:
+            caption_result = captioning.from_image(image_path)
         caption = caption_result.captions[0]
         
         print(f"Generated caption: \"{caption}\"")
@@ -218,7 +602,7 @@ def analyze_image_sentiment(image_path: str, use_gpu: bool = False) -> None:
         
         # Pretty display with rich if available
         if HAS_RICH:
-            console = Console()
+            console = _get_console()
             
             console.print("\n[bold cyan]Image Sentiment Analysis[/bold cyan]")
             
@@ -236,15 +620,143 @@ def analyze_image_sentiment(image_path: str, use_gpu: bool = False) -> None:
     sentiment.cleanup()
 
 
+def analyze_image_sentiment_batch(image_paths: List[str], use_gpu: bool = False,
+                                  use_cache: bool = True) -> None:
+    """
+    Caption several images and analyze the sentiment of each caption.
+    
+    Captioning runs on a background thread and hands captions to this
+    thread through a bounded queue, so the sentiment of one chunk of
+    captions is analyzed while the next chunk of images is being captioned.
+    
+    Args:
+        image_paths: Paths to the image files
+        use_gpu: Whether to use GPU for processing
+        use_cache: Whether to reuse captions cached for the same image contents
+    """
+    device = 0 if use_gpu else -1
+    
+    # Create a configuration
+    config = BridgeConfig()
+    config.device = device
+    config.collect_metrics = True
+    if use_gpu:
+        # bf16 weights (fp16 on pre-Ampere GPUs) with PyTorch's fused attention
+        config.dtype = "bf16"
+        config.attn_implementation = "sdpa"
+    
+    print(f"\nAnalyzing the sentiment of {len(image_paths)} images")
+    print("-" * 50)
+    
+    # Both models run at the same time, so unlike analyze_image_sentiment
+    # neither of them is offloaded to the CPU
+    captioning = ImageCaptioningBridge(device=device, config=config)
+    sentiment = HuggingFaceSentimentBridge(device=device)
+    cache = PersistentCache(RESULT_CACHE_PATH) if use_cache else None
+    
+    # Captions waiting for sentiment analysis; bounds how far captioning runs ahead
+    captions = queue.Queue(maxsize=4)
+    stop = threading.Event()
+    
+    def caption_images():
+        try:
+            for start in range(0, len(image_paths), captioning.batch_size):
+                if stop.is_set():
+                    return
+                chunk = image_paths[start:start + captioning.batch_size]
+                
+                # Reuse cached captions, captioning the rest of the chunk in one batch
+                keys = {}
+                results = {}
+                if cache is not None:
+                    for path in chunk:
+                        keys[path] = _image_cache_key(captioning.model_name, "caption", path)
+                        if keys[path] is not None:
+                            results[path] = cache.get(keys[path])
+                missing = [path for path in chunk if results.get(path) is None]
+                if missing:
+                    for path, result in zip(missing, captioning.from_image_batch(missing)):
+                        results[path] = result
+                        if keys.get(path) is not None and result.captions:
+                            cache.set(keys[path], result)
+                
+                for path in chunk:
+                    if stop.is_set():
+                        return
+                    captions.put((path, results[path]))
+        finally:
+            captions.put(None)
+    
+    rows = []
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            producer = executor.submit(caption_images)
+            try:
+                while True:
+                    item = captions.get()
+                    if item is None:
+                        break
+                    
+                    image_path, caption_result = item
+                    if not caption_result.captions:
+                        print(f"{os.path.basename(image_path)}: {caption_result.labels[0]}")
+                        continue
+                    caption = caption_result.captions[0]
+                    
+                    # Analyze sentiment of the caption
+                    sentiment_result = sentiment.from_text(caption)
+                    sentiment_label = sentiment_result.labels[0]
+                    sentiment_score = sentiment_result.roles[0]["score"] if sentiment_result.roles else 0.0
+                    rows.append((image_path, caption, sentiment_label, sentiment_score))
+                    
+                    if not HAS_RICH:
+                        print(f"{os.path.basename(image_path)}: \"{caption}\" - "
+                              f"{sentiment_label} (confidence: {sentiment_score:.4f})")
+            except BaseException:
+                # Unblock the captioning thread if it is waiting on a full queue
+                stop.set()
+                while not producer.done():
+                    try:
+                        captions.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                raise
+            
+            # Re-raise errors from the captioning thread
+            producer.result()
+        
+        # Pretty display with rich if available
+        if HAS_RICH:
+            table = Table(title="Image Sentiment Analysis")
+            table.add_column("Image", style="cyan")
+            table.add_column("Caption")
+            table.add_column("Sentiment", style="green")
+            table.add_column("Confidence", justify="right")
+            for image_path, caption, sentiment_label, sentiment_score in rows:
+                table.add_row(os.path.basename(image_path), caption, sentiment_label, f"{sentiment_score:.4f}")
+            _get_console().print(table)
+    
+    except Exception as e:
+        print(f"Error analyzing images: {str(e)}")
+    
+    # Clean up resources
+    if cache is not None:
+        cache.close()
+    captioning.cleanup()
+    sentiment.cleanup()
+
+
 def main():
     """Main function to run the demo."""
     parser = argparse.ArgumentParser(description="BridgeNLP Multimodal Demo")
     parser.add_argument("--image", help="Path to an image file for similarity or sentiment analysis")
     parser.add_argument("--text", help="Text query for similarity calculation or image search")
-    parser.add_argument("--dir", help="Directory of images to search through")
+    parser.add_argument("--dir", help="Directory of images to search through or analyze")
     parser.add_argument("--mode", choices=["similarity", "search", "sentiment"], 
                         default="similarity", help="Demo mode to run")
     parser.add_argument("--gpu", action="store_true", help="Use GPU for processing")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Do not read or write cached embeddings and captions ({RESULT_CACHE_PATH})")
     
     args = parser.parse_args()
     
@@ -269,18 +781,31 @@ def main():
                 print(f"Error: Directory not found at {args.dir}")
                 sys.exit(1)
                 
-            image_search_by_text(args.text, args.dir, args.gpu)
+            image_search_by_text(args.text, args.dir, args.gpu, not args.no_cache)
             
         elif args.mode == "sentiment":
+            if args.dir:
+                if not os.path.exists(args.dir) or not os.path.isdir(args.dir):
+                    print(f"Error: Directory not found at {args.dir}")
+                    sys.exit(1)
+                
+                image_files = _list_images(args.dir)
+                if not image_files:
+                    print(f"No image files found in {args.dir}")
+                    sys.exit(1)
+                
+                analyze_image_sentiment_batch(image_files, args.gpu, not args.no_cache)
+                return
+            
             if not args.image:
-                print("Error: --image is required for sentiment mode")
+                print("Error: --image or --dir is required for sentiment mode")
                 sys.exit(1)
                 
             if not os.path.exists(args.image) or not os.path.isfile(args.image):
                 print(f"Error: Image file not found at {args.image}")
                 sys.exit(1)
                 
-            analyze_image_sentiment(args.image, args.gpu)
+            analyze_image_sentiment(args.image, args.gpu, not args.no_cache)
     
     except ImportError as e:
         print(f"Error: Missing dependencies. {str(e)}")
@@ -304,6 +829,7 @@ if __name__ == "__main__":
         print("    python multimodal_demo.py --mode search --dir path/to/images/ --text \"beach sunset\"")
         print("\n  Analyze image sentiment:")
         print("    python multimodal_demo.py --mode sentiment --image path/to/image.jpg")
+        print("    python multimodal_demo.py --mode sentiment --dir path/to/images/")
         print("\nUse --gpu flag to enable GPU acceleration.")
         sys.exit(0)
         
@@ -30,6 +30,18 @@ except ImportError:
     print("Note: Install 'rich' package for better output formatting: pip install rich")
 
 
+# Shared rich console, created on first use
+_console = None
+
+
+def _get_console() -> "Console":
+    """Return the console shared by all output of this demo."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
 def compare_prompt_strategies(image_path: str, use_gpu: bool = False):
     """
     Compare different prompt conditioning strategies for image captioning.
@@ -57,6 +69,22 @@ def compare_prompt_strategies(image_path: str, use_gpu: bool = False):
     
     results = {}
     
+    # One adapter serves every strategy, so the model is loaded once
+    config = BridgeConfig()
+    config.device = device
+    config.modality = "image"
+    if use_gpu:
+        # bf16 weights (fp16 on pre-Ampere GPUs) with PyTorch's fused attention
+        config.dtype = "bf16"
+        config.attn_implementation = "sdpa"
+    
+    captioning = ImageCaptioningBridge(
+        device=device,
+        config=config,
+        enable_prompt_conditioning=True,
+        prompt_template="{prompt}\nCaption: {caption}"  # Custom template for "template" strategy
+    )
+    
     # Process with each strategy and prompt
     for strategy in strategies:
         results[strategy] = {}
@@ -64,45 +92,32 @@ def compare_prompt_strategies(image_path: str, use_gpu: bool = False):
         print(f"\nTesting strategy: {strategy}")
         print("-" * 40)
         
-        # Create captioning adapter with this strategy
-        config = BridgeConfig()
-        config.device = device
-        config.modality = "image"
-        config.collect_metrics = True
-        
-        # Create adapter with prompt conditioning enabled
-        captioning = ImageCaptioningBridge(
-            device=device,
-            config=config,
-            enable_prompt_conditioning=True,
-            prompt_strategy=strategy,
-            prompt_template="{prompt}\nCaption: {caption}"  # Custom template for "template" strategy
-        )
+        captioning.set_prompt_strategy(strategy)
         
-        # Test each prompt with this strategy
-        for prompt_name, prompt_text in prompts.items():
+        # Caption the image under every prompt, encoding it once
+        prompt_results = captioning.from_image_prompts(image_path, list(prompts.values()))
+        for prompt_name, result in zip(prompts, prompt_results):
             print(f"\nPrompt: {prompt_name}")
-            result = captioning.from_image(image_path, prompt=prompt_text)
             caption = result.captions[0]
             results[strategy][prompt_name] = caption
             print(f"Caption: {caption}")
-        
-        # Clean up resources
-        captioning.cleanup()
     
     # Also run once without conditioning for comparison
     print("\nBaseline (No Prompt Conditioning)")
     print("-" * 40)
     
-    baseline_captioning = ImageCaptioningBridge(device=device, config=config)
-    baseline_result = baseline_captioning.from_image(image_path)
+    captioning.enable_prompt_conditioning = False
+    captioning.reset_prompt()
+    baseline_result = captioning.from_image(image_path)
     baseline_caption = baseline_result.captions[0]
     print(f"Caption: {baseline_caption}")
-    baseline_captioning.cleanup()
+    
+    # Clean up resources
+    captioning.cleanup()
     
     # Display comparison using rich if available
     if HAS_RICH:
-        console = Console()
+        console = _get_console()
         
         console.print("\n[bold cyan]Prompt Conditioning Comparison[/bold cyan]")
         
@@ -6,11 +6,14 @@ This example shows how to use the HuggingFaceSRLBridge adapter
 to perform semantic role labeling and integrate it with spaCy.
 """
 
+import os
+
 import spacy
 from spacy import displacy
 
 try:
     from bridgenlp.adapters.hf_srl import HuggingFaceSRLBridge
+    from bridgenlp.utils import configure_threads
 except ImportError:
     raise ImportError(
         "Hugging Face dependencies not found. Install with: "
@@ -20,27 +23,36 @@ except ImportError:
 
 def main():
     """Run the semantic role labeling demo."""
+    # BRIDGENLP_TORCH_THREADS caps PyTorch's CPU thread pool, which can
+    # oversubscribe machines with many cores
+    torch_threads = os.environ.get("BRIDGENLP_TORCH_THREADS")
+    configure_threads(int(torch_threads) if torch_threads else None)
+    
     # Create a spaCy pipeline
     nlp = spacy.load("en_core_web_sm")
     
     # Create a semantic role labeling bridge
     srl_bridge = HuggingFaceSRLBridge()
     
-    # Process a text with semantic role labeling
-    text = "Julie hugged David because she missed him."
-    doc = nlp(text)
+    # Sentences to label
+    texts = [
+        "Julie hugged David because she missed him.",
+        "The committee approved the budget on Tuesday.",
+        "Maria sent her brother a letter from Paris."
+    ]
     
-    # Apply semantic role labeling
-    doc = srl_bridge.from_spacy(doc)
+    # Parse the sentences in batches, then label them all with batched model calls
+    docs = srl_bridge.from_spacy_batch(list(nlp.pipe(texts, batch_size=32)))
     
     # Print the semantic roles
-    print("Semantic roles:")
-    for role in doc._.nlp_bridge_roles:
-        print(f"  - {role['role']}: {role['text']} (score: {role['score']:.2f})")
+    for doc in docs:
+        print(f"\nSemantic roles for: {doc.text}")
+        for role in doc._.nlp_bridge_roles:
+            print(f"  - {role['role']}: {role['text']} (score: {role['score']:.2f})")
     
-    # Visualize the document
+    # Visualize the documents
     print("\nDocument visualization:")
-    displacy.render(doc, style="dep")
+    displacy.render(docs, style="dep")
 
 
 if __name__ == "__main__":
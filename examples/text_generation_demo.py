@@ -6,7 +6,8 @@ This example shows how to use the new text generation adapters
 (summarization, paraphrasing, and translation) in BridgeNLP.
 """
 
-import spacy
+import os
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
@@ -14,6 +15,7 @@ from rich.markdown import Markdown
 try:
     from bridgenlp.pipeline import Pipeline
     from bridgenlp.config import BridgeConfig
+    from bridgenlp.result import BridgeResult
     from bridgenlp.adapters.hf_summarization import HuggingFaceSummarizationBridge
     from bridgenlp.adapters.hf_paraphrase import HuggingFaceParaphraseBridge
     from bridgenlp.adapters.hf_translation import HuggingFaceTranslationBridge
@@ -56,9 +58,23 @@ def main():
     removed from the definition of AI, a phenomenon known as the AI effect.
     """
     
-    # Initialize spaCy
-    console.print("\n[bold]Initializing spaCy...[/bold]")
-    nlp = spacy.load("en_core_web_sm")
+    # On GPU, load the models in bf16 (float32 on pre-Ampere GPUs, where the
+    # adapters do not fall back to fp16, which Pegasus overflows in); every adapter
+    # uses PyTorch's fused scaled_dot_product_attention where the model supports it
+    try:
+        import torch
+        use_gpu = torch.cuda.is_available()
+    except ImportError:
+        use_gpu = False
+    # BRIDGENLP_TORCH_THREADS caps PyTorch's CPU thread pool, which can
+    # oversubscribe machines with many cores
+    torch_threads = os.environ.get("BRIDGENLP_TORCH_THREADS")
+    model_config = BridgeConfig(
+        device=0 if use_gpu else -1,
+        dtype="bf16",
+        attn_implementation="sdpa",
+        torch_threads=int(torch_threads) if torch_threads else None
+    )
     
     # Step 1: Text Summarization
     console.print("\n[bold]Step 1: Text Summarization[/bold]")
@@ -69,7 +85,8 @@ def main():
         summarizer = HuggingFaceSummarizationBridge(
             model_name="facebook/bart-large-cnn",
             max_length=75,
-            min_length=30
+            min_length=30,
+            config=model_config
         )
     except ImportError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -105,35 +122,44 @@ def main():
         paraphraser = HuggingFaceParaphraseBridge(
             model_name="tuner007/pegasus_paraphrase",
             num_return_sequences=3,
-            temperature=0.7
+            temperature=0.7,
+            batch_size=8,
+            config=model_config
         )
     except ImportError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         console.print("[yellow]Tip: Install transformers with:[/yellow] pip install transformers torch")
         return
     
-    # Extract first sentence for paraphrasing
-    first_sentence = "Artificial intelligence is intelligence demonstrated by machines, as opposed to natural intelligence displayed by humans."
+    # Sentences to paraphrase
+    sentences = [
+        "Artificial intelligence is intelligence demonstrated by machines, as opposed to natural intelligence displayed by humans.",
+        "AI applications include web search engines, recommendation systems and self-driving cars."
+    ]
     
-    # Process text with paraphrasing
+    # Paraphrase all sentences with one batched generate call
     console.print("Generating paraphrases...")
     try:
-        paraphrase_result = paraphraser.from_text(first_sentence)
+        paraphrase_results = paraphraser.from_batch(sentences)
     except Exception as e:
         console.print(f"[bold red]Error generating paraphrases:[/bold red] {str(e)}")
-        paraphrase_result = BridgeResult(tokens=["No paraphrase available"], roles=[{"role": "PARAPHRASE", "text": "Paraphrase generation failed", "variant": 1}])
+        paraphrase_results = [
+            BridgeResult(tokens=["No paraphrase available"], roles=[{"role": "PARAPHRASE", "text": "Paraphrase generation failed", "variant": 1}])
+            for _ in sentences
+        ]
     
     # Extract and display the paraphrases
-    paraphrases = [role["text"] for role in paraphrase_result.roles] if paraphrase_result.roles else ["No paraphrases generated."]
-    
-    console.print(Panel(
-        f"[bold]Original Sentence:[/bold]\n" +
-        first_sentence + "\n\n" +
-        "[bold]Paraphrases:[/bold]\n" +
-        "\n".join([f"{i+1}. {p}" for i, p in enumerate(paraphrases)]),
-        title="Paraphrasing Result",
-        border_style="blue"
-    ))
+    for sentence, paraphrase_result in zip(sentences, paraphrase_results):
+        paraphrases = [role["text"] for role in paraphrase_result.roles] if paraphrase_result.roles else ["No paraphrases generated."]
+        
+        console.print(Panel(
+            f"[bold]Original Sentence:[/bold]\n" +
+            sentence + "\n\n" +
+            "[bold]Paraphrases:[/bold]\n" +
+            "\n".join([f"{i+1}. {p}" for i, p in enumerate(paraphrases)]),
+            title="Paraphrasing Result",
+            border_style="blue"
+        ))
     
     # Step 3: Translation
     console.print("\n[bold]Step 3: Translation[/bold]")
@@ -142,41 +168,48 @@ def main():
     try:
         # Create a translation adapter
         translator = HuggingFaceTranslationBridge(
-            model_name="Helsinki-NLP/opus-mt-en-fr"
+            model_name="Helsinki-NLP/opus-mt-en-fr",
+            batch_size=8,
+            config=model_config
         )
     except ImportError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         console.print("[yellow]Tip: Install transformers with:[/yellow] pip install transformers torch")
         return
     
-    # Short text for translation
+    # Short text and the summary from step 1 for translation
     simple_text = "Artificial intelligence is transforming the way we live and work."
+    english_texts = [simple_text, summary_text]
     
-    # Process text with translation
+    # Translate both texts with one batched call
     console.print("Generating translations...")
     try:
-        translation_result = translator.from_text(simple_text)
+        translation_results = translator.from_batch(english_texts)
     except Exception as e:
         console.print(f"[bold red]Error generating translation:[/bold red] {str(e)}")
-        translation_result = BridgeResult(tokens=["No translation available"], roles=[{
-            "role": "TRANSLATION", 
-            "text": "Translation failed",
-            "source_lang": "en",
-            "target_lang": "fr",
-            "original_text": simple_text
-        }])
+        translation_results = [
+            BridgeResult(tokens=["No translation available"], roles=[{
+                "role": "TRANSLATION", 
+                "text": "Translation failed",
+                "source_lang": "en",
+                "target_lang": "fr",
+                "original_text": text
+            }])
+            for text in english_texts
+        ]
     
-    # Extract and display the translation
-    translation_text = translation_result.roles[0]["text"] if translation_result.roles else "No translation generated."
-    
-    console.print(Panel(
-        f"[bold]English Text:[/bold]\n" +
-        simple_text + "\n\n" +
-        f"[bold]French Translation:[/bold]\n" +
-        translation_text,
-        title="Translation Result",
-        border_style="yellow"
-    ))
+    # Extract and display the translations
+    for text, translation_result in zip(english_texts, translation_results):
+        translation_text = translation_result.roles[0]["text"] if translation_result.roles else "No translation generated."
+        
+        console.print(Panel(
+            f"[bold]English Text:[/bold]\n" +
+            text + "\n\n" +
+            f"[bold]French Translation:[/bold]\n" +
+            translation_text,
+            title="Translation Result",
+            border_style="yellow"
+        ))
     
     # Step 4: Combining in a Pipeline
     console.print("\n[bold]Step 4: Pipeline Integration[/bold]")
@@ -189,7 +222,8 @@ def main():
     try:
         # Creating a new translator for English to Spanish
         es_translator = HuggingFaceTranslationBridge(
-            model_name="Helsinki-NLP/opus-mt-en-es"
+            model_name="Helsinki-NLP/opus-mt-en-es",
+            config=model_config
         )
     except ImportError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
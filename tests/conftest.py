@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the BridgeNLP tests.
+"""
+
+import pytest
+
+
+def _fake_batches(image_paths, batch_size, prepare=None):
+    """Yield path strings in place of decoded images."""
+    for start in range(0, len(image_paths), batch_size):
+        chunk = list(image_paths[start:start + batch_size])
+        yield start, chunk, prepare(chunk) if prepare is not None else None
+
+
+@pytest.fixture
+def fake_image_batches(request):
+    """
+    Stand-in for MultimodalBridgeBase._iter_image_batches that skips image decoding.
+    
+    unittest classes using this fixture get it as ``self.fake_image_batches``.
+    """
+    if request.cls is not None:
+        request.cls.fake_image_batches = staticmethod(_fake_batches)
+    return _fake_batches
@@ -1,5 +1,7 @@
 import asyncio
+import itertools
 import random
+import threading
 
 from bridgenlp.base import BridgeBase
 from bridgenlp.pipeline_async import AsyncPipeline
@@ -12,25 +14,24 @@ class AsyncDelayedAdapter(BridgeBase):
         super().__init__(config)
         self.name = name
         self.max_delay = max_delay
+        # Coroutines only switch at await, so a plain increment is safe
         self.calls = 0
-        self.lock = asyncio.Lock()
+        # Delays are drawn once and replayed
+        self._delays = itertools.cycle([random.uniform(0, max_delay) for _ in range(64)])
 
     async def from_text(self, text):
-        async with self.lock:
-            self.calls += 1
-        await asyncio.sleep(random.uniform(0, self.max_delay))
+        self.calls += 1
+        await asyncio.sleep(next(self._delays))
         return BridgeResult(tokens=text.split())
 
     async def from_tokens(self, tokens):
-        async with self.lock:
-            self.calls += 1
-        await asyncio.sleep(random.uniform(0, self.max_delay))
+        self.calls += 1
+        await asyncio.sleep(next(self._delays))
         return BridgeResult(tokens=list(tokens))
 
     async def from_spacy(self, doc):
-        async with self.lock:
-            self.calls += 1
-        await asyncio.sleep(random.uniform(0, self.max_delay))
+        self.calls += 1
+        await asyncio.sleep(next(self._delays))
         return BridgeResult(tokens=[t.text for t in doc]).attach_to_spacy(doc)
 
 
@@ -40,11 +41,10 @@ def test_async_pipeline_concurrent():
         config = BridgeConfig(cache_results=True, cache_size=20)
         async with AsyncPipeline(adapters, config) as pipeline:
             async def worker(idx):
-                results = []
-                for i in range(5):
-                    text = f"test {idx} {i}"
-                    results.append(await pipeline.from_text(text))
-                return results
+                # Each worker fans its texts out concurrently as well
+                return await asyncio.gather(
+                    *(pipeline.from_text(f"test {idx} {i}") for i in range(5))
+                )
 
             tasks = [asyncio.create_task(worker(i)) for i in range(5)]
             results = await asyncio.gather(*tasks)
@@ -57,3 +57,110 @@ def test_async_pipeline_concurrent():
     # ensure adapters were called
     for ad in adapters:
         assert ad.calls >= 5
+
+
+class BatchRecordingAdapter(BridgeBase):
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.batch_sizes = []
+
+    def from_text(self, text):
+        return BridgeResult(tokens=text.split())
+
+    def from_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [self.from_text(text) for text in texts]
+
+    def from_tokens(self, tokens):
+        return BridgeResult(tokens=list(tokens))
+
+    def from_spacy(self, doc):
+        return doc
+
+
+def test_async_pipeline_micro_batching():
+    async def run():
+        adapter = BatchRecordingAdapter()
+        config = BridgeConfig(max_batch_size=4, max_latency=0.05)
+        pipeline = AsyncPipeline([adapter], config)
+        texts = [f"text number {i}" for i in range(10)]
+        results = await asyncio.gather(*(pipeline.from_text(t) for t in texts))
+        return adapter, texts, results
+
+    adapter, texts, results = asyncio.run(run())
+    # Two full batches are flushed on size, the remainder on the latency timer
+    assert adapter.batch_sizes == [4, 4, 2]
+    assert [r.tokens for r in results] == [t.split() for t in texts]
+
+
+class OverlapTrackingAdapter(BridgeBase):
+    active = 0
+    max_active = 0
+
+    def __init__(self, name, delay=0.01, config=None):
+        super().__init__(config)
+        self.name = name
+        self.delay = delay
+
+    async def from_text(self, text):
+        cls = OverlapTrackingAdapter
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        await asyncio.sleep(self.delay)
+        cls.active -= 1
+        return BridgeResult(tokens=text.split(), labels=[self.name])
+
+    async def from_tokens(self, tokens):
+        return BridgeResult(tokens=list(tokens))
+
+    async def from_spacy(self, doc):
+        return doc
+
+
+def test_async_pipeline_stream_overlaps_stages():
+    async def run():
+        adapters = [OverlapTrackingAdapter(name=f"s{i}") for i in range(3)]
+        pipeline = AsyncPipeline(adapters, BridgeConfig(pipeline_depth=2))
+        texts = [f"stream text {i}" for i in range(8)] + [""]
+        return texts, [result async for result in pipeline.stream(texts)]
+
+    OverlapTrackingAdapter.max_active = 0
+    texts, results = asyncio.run(run())
+    assert [r.tokens for r in results] == [t.split() for t in texts]
+    assert results[0].labels == ["s0"]
+    # Different stages were working on different texts at the same time
+    assert OverlapTrackingAdapter.max_active > 1
+
+
+def test_async_pipeline_persistent_cache_off_loop(tmp_path):
+    config = BridgeConfig(cache_results=True,
+                          persistent_cache_path=str(tmp_path / "cache.sqlite"))
+    writer = AsyncPipeline([BatchRecordingAdapter()], config)
+    asyncio.run(writer.from_text("cached text"))
+    writer.cleanup()
+
+    reader = AsyncPipeline([BatchRecordingAdapter()], config)
+    get = reader._persistent_cache.get
+    lookup_threads = []
+
+    def recording_get(key):
+        lookup_threads.append(threading.get_ident())
+        return get(key)
+
+    set_ = reader._persistent_cache.set
+    store_threads = []
+
+    def recording_set(key, value):
+        store_threads.append(threading.get_ident())
+        set_(key, value)
+
+    reader._persistent_cache.get = recording_get
+    reader._persistent_cache.set = recording_set
+    result = asyncio.run(reader.from_text("cached text"))
+    assert result.tokens == ["cached", "text"]
+    assert reader.get_metrics()["cache_hits"] == 1
+    asyncio.run(reader.from_text("new text"))
+    reader.cleanup()
+    # The SQLite lookups and writes ran on executor threads, not the event loop thread
+    assert lookup_threads and threading.get_ident() not in lookup_threads
+    assert store_threads and threading.get_ident() not in store_threads
@@ -3,6 +3,10 @@ Tests for the BridgeResult class.
 """
 
 import gc
+import json
+import pickle
+from unittest.mock import patch
+
 import pytest
 import spacy
 from spacy.tokens import Doc
@@ -37,6 +41,59 @@ class TestBridgeResult:
         assert result.roles == [{"role": "ARG0", "text": "This"}]
         assert result.labels == ["PERSON", "O", "O", "O"]
     
+    def test_clone(self):
+        """Test that clones can be mutated without affecting the original."""
+        result = BridgeResult(
+            tokens=["This", "is", "a", "test"],
+            spans=[(0, 1)],
+            clusters=[[(0, 1), (3, 4)]],
+            roles=[{"role": "ARG0", "args": ["This"]}],
+            labels=["PERSON", "O", "O", "O"],
+            image_features={"size": [224, 224]}
+        )
+        clone = result.clone()
+        assert clone == result
+        
+        clone.spans.append((2, 3))
+        clone.clusters[0].append((2, 3))
+        clone.roles[0]["args"].append("test")
+        clone.image_features["size"][0] = 0
+        
+        assert result.spans == [(0, 1)]
+        assert result.clusters == [[(0, 1), (3, 4)]]
+        assert result.roles == [{"role": "ARG0", "args": ["This"]}]
+        assert result.image_features == {"size": [224, 224]}
+
+    def test_clone_copies_arrays(self):
+        """Test that numpy arrays in a clone are not shared with the original."""
+        np = pytest.importorskip("numpy")
+        result = BridgeResult(
+            tokens=[],
+            image_features={"scores": np.array([0.9, 0.5], dtype=np.float32)},
+            multimodal_embeddings=np.ones(3)
+        )
+        clone = result.clone()
+        
+        clone.image_features["scores"][0] = 0.0
+        clone.multimodal_embeddings *= 2
+        
+        assert result.image_features["scores"][0] == pytest.approx(0.9)
+        assert result.multimodal_embeddings.tolist() == [1.0, 1.0, 1.0]
+
+    def test_labels_interned(self):
+        """Test that equal labels from different results share one object."""
+        first = BridgeResult(tokens=["a"], labels=["".join(["O", "RG"])])
+        second = BridgeResult(tokens=["b"], labels=["".join(["OR", "G"])])
+        assert first.labels[0] is second.labels[0]
+
+    def test_slots(self):
+        """Test that results use slots and still pickle."""
+        result = BridgeResult(tokens=["test"], labels=["O"])
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_field = True
+        assert pickle.loads(pickle.dumps(result)) == result
+
     def test_to_json(self):
         """Test conversion to JSON."""
         result = BridgeResult(
@@ -59,6 +116,37 @@ class TestBridgeResult:
         assert json_data["roles"] == [{"role": "ARG0", "text": "This"}]
         assert json_data["labels"] == ["PERSON", "O", "O", "O"]
     
+    def test_to_bytes(self):
+        """Test serialization to JSON bytes."""
+        result = BridgeResult(
+            tokens=["Ça", "va"],
+            spans=[(0, 1)],
+            roles=[{"role": "ARG0", "text": "Ça"}]
+        )
+        data = result.to_bytes()
+        assert isinstance(data, bytes)
+        assert json.loads(data) == result.to_json()
+    
+    def test_to_bytes_backends_agree(self):
+        """Test that orjson and the standard library encode the same JSON."""
+        orjson = pytest.importorskip("orjson")
+        result = BridgeResult(
+            tokens=["a"],
+            roles=[{"label_ids": {1: 0.5, 2: float("nan")}, "score": float("inf")}],
+            image_features={"scores": [0.25, float("-inf")]}
+        )
+        with patch("bridgenlp.result.orjson", orjson):
+            fast = result.to_bytes()
+        with patch("bridgenlp.result.orjson", None):
+            fallback = result.to_bytes()
+        
+        assert fast == fallback
+        assert json.loads(fallback) == {
+            "tokens": ["a"],
+            "roles": [{"label_ids": {"1": 0.5, "2": None}, "score": None}],
+            "image_features": {"scores": [0.25, None]}
+        }
+    
     def test_attach_to_spacy(self):
         """Test attaching results to a spaCy Doc."""
         nlp = spacy.blank("en")
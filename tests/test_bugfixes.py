@@ -109,5 +109,33 @@ class TestAbstractMethodImplementation(unittest.TestCase):
                 self.assertIn("warning", result.labels[0])
 
 
+
+class TestParamFallbackBugfix(unittest.TestCase):
+    """Tests for bug fixes in get_param_with_fallback."""
+    
+    def test_params_lookup_ignores_params_dict(self):
+        """
+        Test that looking up a key in config.params never returns the dict itself.
+        
+        Adapters call get_param_with_fallback(value, config, "params", key), which
+        used to return the whole (empty) params dict whenever a config was passed.
+        """
+        from bridgenlp.config import BridgeConfig
+        from bridgenlp.utils import get_param_with_fallback
+        
+        config = BridgeConfig()
+        self.assertEqual(
+            get_param_with_fallback(None, config, "params", "source_lang", default_value="en"), "en"
+        )
+        
+        config = BridgeConfig(params={"source_lang": "de"})
+        self.assertEqual(
+            get_param_with_fallback(None, config, "params", "source_lang", default_value="en"), "de"
+        )
+        self.assertEqual(
+            get_param_with_fallback("fr", config, "params", "source_lang", default_value="en"), "fr"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Tests for the HuggingFaceEmbeddingsBridge class.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from bridgenlp.adapters.hf_embeddings import HuggingFaceEmbeddingsBridge
+from bridgenlp.config import BridgeConfig
+
+
+def fake_embeddings(texts):
+    """Return a deterministic embedding per text without loading a model."""
+    return np.array([[float(len(text)), 1.0] for text in texts])
+
+
+class TestHuggingFaceEmbeddingsBridge:
+    """Test suite for HuggingFaceEmbeddingsBridge class."""
+
+    @pytest.fixture
+    def bridge(self):
+        """Create a bridge with a small embedding cache."""
+        config = BridgeConfig(params={"embedding_cache_size": 2})
+        return HuggingFaceEmbeddingsBridge(config=config)
+
+    def test_from_batch(self, bridge):
+        """Test that a batch is embedded with a single model call."""
+        with patch.object(bridge, "_get_embeddings", side_effect=fake_embeddings) as mock:
+            results = bridge.from_batch(["one", "three", "one"])
+
+        assert [r.roles[0]["embedding"] for r in results] == [[3.0, 1.0], [5.0, 1.0], [3.0, 1.0]]
+        assert results[1].tokens == ["three"]
+        # Duplicate texts are only embedded once
+        mock.assert_called_once_with(["one", "three"])
+
+    def test_embedding_cache(self, bridge):
+        """Test that repeated texts skip the model and the cache evicts LRU entries."""
+        with patch.object(bridge, "_get_embeddings", side_effect=fake_embeddings) as mock:
+            bridge.from_text("one")
+            bridge.from_text("three")
+            bridge.from_text("one")
+            assert mock.call_count == 2
+
+            # "three" is now least recently used and gets evicted
+            bridge.from_text("seven")
+            bridge.from_text("one")
+            assert mock.call_count == 3
+            bridge.from_text("three")
+            assert mock.call_count == 4
+
+    def test_embedding_cache_disabled(self):
+        """Test that a cache size of 0 always runs the model."""
+        config = BridgeConfig(params={"embedding_cache_size": 0})
+        bridge = HuggingFaceEmbeddingsBridge(config=config)
+        with patch.object(bridge, "_get_embeddings", side_effect=fake_embeddings) as mock:
+            bridge.from_text("one")
+            bridge.from_text("one")
+        assert mock.call_count == 2
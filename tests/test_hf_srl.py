@@ -111,6 +111,30 @@ class TestHuggingFaceSRLBridge:
         assert result.tokens == ["Julie", "hugged", "David"]
         assert len(result.roles) == 3
     
+    @patch("transformers.pipeline")
+    def test_from_spacy_batch(self, mock_hf_pipeline, mock_pipeline, nlp):
+        """Test that a batch of Docs is labeled with one pipeline call."""
+        entities = mock_pipeline.return_value
+        mock_pipeline.return_value = [entities, entities[:1]]
+        mock_hf_pipeline.return_value = mock_pipeline
+        
+        from bridgenlp.adapters.hf_srl import HuggingFaceSRLBridge
+        bridge = HuggingFaceSRLBridge(batch_size=8)
+        
+        # Override the pipeline with our mock
+        bridge._pipeline = mock_pipeline
+        
+        docs = [nlp("Julie hugged David"), nlp(" "), nlp("Julie left")]
+        processed = bridge.from_spacy_batch(docs)
+        
+        # Empty texts are not sent to the model
+        mock_pipeline.assert_called_once_with(["Julie hugged David", "Julie left"], batch_size=8)
+        
+        assert len(processed) == 3
+        assert len(processed[0]._.nlp_bridge_roles) == 3
+        assert len(processed[1]._.nlp_bridge_roles) == 0
+        assert [role["text"] for role in processed[2]._.nlp_bridge_roles] == ["Julie"]
+    
     @patch("transformers.pipeline")
     def test_from_spacy(self, mock_hf_pipeline, mock_pipeline, nlp):
         """Test processing a spaCy Doc."""
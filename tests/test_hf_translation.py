@@ -49,6 +49,28 @@ class TestHuggingFaceTranslation(unittest.TestCase):
         # Verify model is not loaded by default
         mock_init.assert_not_called()
     
+    @patch('bridgenlp.adapters.hf_translation.HuggingFaceTranslationBridge._init_model')
+    def test_compile_only_on_gpu(self, mock_init):
+        """Test that the compile option is ignored on CPU."""
+        adapter = HuggingFaceTranslationBridge(config=BridgeConfig(device=-1, params={"compile": True}))
+        self.assertFalse(adapter.compile_model)
+        self.assertFalse(adapter.model_key.endswith("_compiled"))
+    
+    @patch('bridgenlp.adapters.hf_translation.HuggingFaceTranslationBridge._init_model')
+    def test_precision_and_attention(self, mock_init):
+        """Test that reduced precision is GPU-only and the attention kernels are keyed."""
+        config = BridgeConfig(device=-1, dtype="bf16", attn_implementation="sdpa")
+        adapter = HuggingFaceTranslationBridge(config=config)
+        self.assertIsNone(adapter.torch_dtype)
+        self.assertEqual(adapter.attn_implementation, "sdpa")
+        self.assertTrue(adapter.model_key.endswith("_sdpa"))
+        
+        # Text generation models default to float32 even with a config
+        self.assertEqual(HuggingFaceTranslationBridge(config=BridgeConfig(device=-1)).dtype, "fp32")
+        
+        with self.assertRaises(ValueError):
+            HuggingFaceTranslationBridge(config=BridgeConfig(device=-1, dtype="int3"))
+    
     @patch('bridgenlp.adapters.hf_translation.get_or_create_model')
     def test_language_detection_simple(self, mock_get_model):
         """Test basic language detection."""
@@ -70,6 +92,52 @@ class TestHuggingFaceTranslation(unittest.TestCase):
             detection2 = adapter.detect_language("Hello world")
             self.assertEqual(detection, detection2)
     
+    @patch('bridgenlp.adapters.hf_translation.get_or_create_model')
+    def test_language_detection_cache(self, mock_get_model):
+        """Test that the detection cache keys on the whole text and stays bounded."""
+        adapter = HuggingFaceTranslationBridge()
+        adapter.detection_cache_size = 2
+        prefix = "x" * 100
+        
+        with patch('bridgenlp.adapters.hf_translation.detect_language', side_effect=["en", "fr", "de"]) as detect:
+            # Texts sharing a long prefix are cached separately
+            self.assertEqual(adapter.detect_language(prefix + " hello").code, "en")
+            self.assertEqual(adapter.detect_language(prefix + " bonjour").code, "fr")
+            self.assertEqual(adapter.detect_language(prefix + " hello").code, "en")
+            self.assertEqual(detect.call_count, 2)
+            
+            # The least recently used entry is evicted
+            adapter.detect_language(prefix + " hallo")
+            self.assertEqual(len(adapter._detected_langs), 2)
+            self.assertIsNone(adapter._get_cached_detection(prefix + " bonjour"))
+            self.assertIsNotNone(adapter._get_cached_detection(prefix + " hello"))
+    
+    def test_detect_language_batch_parallel(self):
+        """Test that large batches are split across the detection workers."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        adapter = HuggingFaceTranslationBridge()
+        adapter.detection_workers = 2
+        adapter.parallel_detection_threshold = 3
+        # Threads stand in for the worker processes
+        adapter._detection_pool = ThreadPoolExecutor(max_workers=2)
+        chunks = []
+        
+        def detect_chunk(texts):
+            chunks.append(texts)
+            return [("fr" if "bonjour" in text else "en", 0.9) for text in texts]
+        
+        texts = ["hello", "bonjour", "", "hello there", "bonjour encore"]
+        with patch('bridgenlp.adapters.hf_translation._detect_languages_chunk', side_effect=detect_chunk):
+            detections = adapter.detect_language_batch(texts)
+        adapter.cleanup()
+        
+        self.assertEqual(sorted(chunks), [["hello", "bonjour"], ["hello there", "bonjour encore"]])
+        self.assertEqual([d.code for d in detections], ["en", "fr", adapter.source_lang, "en", "fr"])
+        self.assertEqual(detections[2].confidence, 0.0)
+        self.assertEqual(adapter._get_cached_detection("bonjour").code, "fr")
+        self.assertIsNone(adapter._detection_pool)
+    
     @patch('bridgenlp.adapters.hf_translation.fasttext')
     def test_language_detection_fasttext(self, mock_fasttext):
         """Test language detection with FastText."""
@@ -70,12 +70,12 @@ class TestImageCaptioning(unittest.TestCase):
         
         # Create mock tokenizer
         mock_tokenizer = MagicMock()
-        mock_tokenizer.decode.return_value = "a red image"
+        mock_tokenizer.batch_decode.return_value = ["a red image"]
         adapter._tokenizer = mock_tokenizer
         
         # Create mock model
         mock_model = MagicMock()
-        mock_model.generate.return_value = [MagicMock()]
+        mock_model.generate.return_value = MagicMock()
         adapter._model = mock_model
         
         # Create mock preprocessed input
@@ -93,6 +93,34 @@ class TestImageCaptioning(unittest.TestCase):
         self.assertIsNotNone(result.image_features)
         self.assertEqual(result.image_features["caption"], "a red image")
     
+    @patch('bridgenlp.adapters.image_captioning.ImageCaptioningBridge._load_model_and_processor')
+    @patch('bridgenlp.adapters.image_captioning.ImageCaptioningBridge._preprocess_image')
+    def test_from_image_prompts_shares_generation(self, mock_preprocess, mock_load):
+        """Test that prompts which do not change generation share one encode and generate call."""
+        adapter = ImageCaptioningBridge(enable_prompt_conditioning=True, prompt_strategy="prefix")
+        adapter._model_loaded = True
+        adapter._model_type = "vit-gpt"
+        adapter._tokenizer = MagicMock()
+        adapter._tokenizer.batch_decode.return_value = ["a red image"]
+        adapter._model = MagicMock()
+        mock_preprocess.return_value = MagicMock()
+        
+        results = adapter.from_image_prompts(self.image_path, ["Look:", "See:"])
+        
+        mock_preprocess.assert_called_once()
+        adapter._model.encoder.assert_called_once()
+        adapter._model.generate.assert_called_once()
+        self.assertEqual([r.captions[0] for r in results], ["Look: a red image", "See: a red image"])
+        self.assertEqual([r.image_features["prompt"] for r in results], ["Look:", "See:"])
+        self.assertEqual(adapter.current_prompt, adapter.default_prompt)
+        
+        # Instruction prompts change the generate arguments, but still reuse the encoder output
+        adapter.set_prompt_strategy("instruction")
+        adapter._model.reset_mock()
+        adapter.from_image_prompts(self.image_path, ["Look:", "See:"])
+        adapter._model.encoder.assert_called_once()
+        self.assertEqual(adapter._model.generate.call_count, 2)
+    
     def test_validate_image_path(self):
         """Test image path validation."""
         adapter = ImageCaptioningBridge()
@@ -236,12 +264,12 @@ class TestImageCaptioning(unittest.TestCase):
         
         # Create mock tokenizer
         mock_tokenizer = MagicMock()
-        mock_tokenizer.decode.return_value = "a red image"
+        mock_tokenizer.batch_decode.return_value = ["a red image"]
         adapter._tokenizer = mock_tokenizer
         
         # Create mock model
         mock_model = MagicMock()
-        mock_model.generate.return_value = [MagicMock()]
+        mock_model.generate.return_value = MagicMock()
         adapter._model = mock_model
         
         # Create mock preprocessed input
@@ -294,6 +322,58 @@ class TestImageCaptioning(unittest.TestCase):
             self.assertIsNone(adapter._tokenizer)
             self.assertFalse(adapter._model_loaded)
     
+    def test_cuda_graphs_eager_fallback(self):
+        """Test that the encoder runs eagerly when no CUDA graph can be used."""
+        adapter = ImageCaptioningBridge(config=BridgeConfig(params={"cuda_graphs": False}))
+        self.assertFalse(adapter.use_cuda_graphs)
+        
+        adapter._model_type = "vit-gpt"
+        self.assertIsNone(adapter._replay_encoder(MagicMock(is_cuda=True)))
+        self.assertEqual(adapter._graphs, {})
+    
+    def test_set_prompt_strategy(self):
+        """Test switching the prompt strategy on an existing adapter."""
+        adapter = ImageCaptioningBridge(enable_prompt_conditioning=True)
+        
+        adapter.set_prompt_strategy("template", template="{prompt} | {caption}")
+        self.assertEqual(adapter._apply_prompt_conditioning("a cat", "Look:"), "Look: | a cat")
+        
+        adapter.set_prompt_strategy("instruction")
+        self.assertEqual(adapter._apply_prompt_conditioning("a cat", "Look:"), "a cat")
+        self.assertEqual(adapter.prompt_template, "{prompt} | {caption}")
+        
+        with self.assertRaises(ValueError):
+            adapter.set_prompt_strategy("suffix")
+        self.assertEqual(adapter.prompt_strategy, "instruction")
+    
+    def test_jpeg_decoded_with_pil_on_cpu(self):
+        """Test that JPEG files only go through nvJPEG on GPU."""
+        adapter = ImageCaptioningBridge()
+        self.assertFalse(adapter.gpu_jpeg_decode)
+        
+        image = adapter._load_image(self.image_path)
+        self.assertEqual(image.mode, "RGB")
+        self.assertEqual(image.size, (100, 100))
+    
+    def test_jpeg_decoded_with_pil_for_slow_processors(self):
+        """Test that nvJPEG is only used with a fast VisionEncoderDecoder processor."""
+        for model_type, is_fast in (("processor-based", True), ("vit-gpt", False)):
+            adapter = ImageCaptioningBridge()
+            adapter.gpu_jpeg_decode = True
+            components = {
+                "model": MagicMock(),
+                "processor": MagicMock(is_fast=is_fast),
+                "model_type": model_type
+            }
+            
+            with patch('bridgenlp.adapters.image_captioning.get_or_create_model',
+                       return_value=components):
+                image = adapter._load_image(self.image_path)
+            
+            self.assertFalse(adapter.gpu_jpeg_decode)
+            self.assertEqual(image.mode, "RGB")
+            self.assertEqual(image.size, (100, 100))
+    
     @pytest.mark.skipif(not os.environ.get("RUN_SLOW_TESTS"), reason="Slow test, set RUN_SLOW_TESTS=1 to run")
     def test_real_model_loading(self):
         """Test loading a real model (slow, only runs if RUN_SLOW_TESTS is set)."""
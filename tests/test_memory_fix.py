@@ -3,224 +3,101 @@ Simple test script to validate the memory leak fix in TokenAligner.
 """
 
 import gc
-import time
+import tracemalloc
+
+import numpy as np
+import pytest
 import spacy
 from bridgenlp.aligner import TokenAligner
 
+try:
+    import pytest_benchmark  # noqa: F401
+    benchmark_installed = True
+except ImportError:
+    benchmark_installed = False
+
+# Largest net growth in Python allocations allowed over the repeated alignments
+MAX_GROWTH_BYTES = 1024 * 1024
+
 def generate_large_text(size=5000):  # Reduced default size for better memory usage
     """Generate a large text document with the specified number of tokens."""
     words = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", 
              "a", "an", "and", "but", "or", "nor", "for", "yet", "so", 
              "in", "on", "at", "by", "with", "about", "against", "between"]
     
-    # Import numpy in function to make test more portable
-    import numpy as np
-    np.random.seed(42)  # For reproducibility
-    tokens = np.random.choice(words, size=size)
+    # A local generator is reproducible without touching the global NumPy state
+    rng = np.random.default_rng(42)
+    tokens = np.array(words)[rng.integers(0, len(words), size=size)]
     
     # Add some structure for testing - create consecutive "John he him" sequences
     # that will be easier to find
-    for i in range(0, size, 100):
-        if i + 2 < size:
-            tokens[i] = "John"
-            tokens[i+1] = "he"
-            tokens[i+2] = "him"
+    starts = np.arange(0, size - 2, 100)
+    tokens[starts] = "John"
+    tokens[starts + 1] = "he"
+    tokens[starts + 2] = "him"
     
-    return " ".join(tokens)
+    # tolist() converts every token to a Python str in one call
+    return " ".join(tokens.tolist())
+
+def find_search_span(aligner, doc, search_text):
+    """Find the first "John he him" sequence, falling back to fuzzy alignment."""
+    john_positions = [i for i in range(len(doc)) if doc[i].text == "John"]
+    if john_positions:
+        pos = john_positions[0]
+        if pos + 2 < len(doc) and doc[pos+1].text == "he" and doc[pos+2].text == "him":
+            return doc[pos:pos+3]
+    return aligner.fuzzy_align(doc, search_text)
 
 def test_aligner_memory_usage():
     """Test that memory usage doesn't grow significantly after multiple uses."""
-    # Force garbage collection before we start to get a clean slate
-    gc.collect()
-    gc.collect()
-    
     print("Creating spaCy pipeline...")
     nlp = spacy.blank("en")
     
-    # Try to reduce memory fragmentation
-    try:
-        import sys
-        if hasattr(sys, 'set_int_max_str_digits'):
-            # Limit memory used for large integer string conversions (Python 3.11+)
-            sys.set_int_max_str_digits(4000)
-    except Exception:
-        pass
-    
     print("Generating large text document...")
     # Generate text in a separate function call to avoid keeping references
-    large_text = generate_large_text(3000)  # Further reduced size to lower memory pressure
-    
-    # Process text with spaCy
-    print("Processing with spaCy...")
-    doc = nlp(large_text)
-    
-    # Clear the large_text reference as we don't need it anymore
-    del large_text
-    gc.collect()
+    doc = nlp(generate_large_text(3000))  # Further reduced size to lower memory pressure
     
     print("Creating TokenAligner...")
     aligner = TokenAligner()
+    search_text = "John he him"
     
-    # Force garbage collection again to get clean baseline
-    gc.collect()
-    gc.collect()
+    # Warm-up run, so one-time allocations are part of the baseline below
+    find_search_span(aligner, doc, search_text)
     
+    # tracemalloc counts live Python allocations directly, unlike RSS, which
+    # lags behind free() and needs sleeps to settle
+    tracemalloc.start()
     try:
-        # Try to import psutil for memory tracking
-        import psutil
-        process = psutil.Process()
-        
-        # Get initial memory baseline after all setup is complete
-        gc.collect()
         gc.collect()
-        time.sleep(0.2)  # Give system time to reclaim memory
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        print(f"Initial memory usage: {initial_memory:.1f} MB")
+        baseline = tracemalloc.take_snapshot()
         
         print("Running multiple alignment operations...")
-        for i in range(3):  # Reduced number of iterations
-            # Create a search text that will definitely be found in the document
-            # Use a specific pattern that appears in the generated text
-            search_text = "John he him"
+        for i in range(3):
+            result = find_search_span(aligner, doc, search_text)
+            assert result is not None, f"No match found for '{search_text}'"
+            assert result.text == search_text
+            del result
             
-            # Print a sample of the document text to help debug
-            start_idx = 0
-            for i in range(0, len(doc), 100):
-                if "John" in doc[i:i+100].text:
-                    start_idx = i
-                    break
-            
-            print(f"Document sample at position {start_idx}: '{doc[start_idx:start_idx+20].text}'")
-            start_time = time.time()
-            
-            # Do the alignment operation with explicit memory management
-            try:
-                # Create a local scope for the operation
-                result = None
-                try:
-                    # First try to find "John" directly in the document
-                    john_positions = []
-                    for i in range(len(doc)):
-                        if doc[i].text == "John":
-                            john_positions.append(i)
-                    
-                    if john_positions:
-                        print(f"Found 'John' at positions: {john_positions[:5]}...")
-                        # Use the first occurrence of "John" to create a span
-                        pos = john_positions[0]
-                        if pos + 2 < len(doc) and doc[pos+1].text == "he" and doc[pos+2].text == "him":
-                            print(f"Found exact match at position {pos}: '{doc[pos:pos+3].text}'")
-                            result = doc[pos:pos+3]
-                            success = True
-                        else:
-                            # Try fuzzy alignment as fallback
-                            print(f"No exact match at position {pos}, trying fuzzy alignment")
-                            result = aligner.fuzzy_align(doc, search_text)
-                            success = result is not None
-                    else:
-                        # Try fuzzy alignment as fallback
-                        print("No 'John' found in document, trying fuzzy alignment")
-                        result = aligner.fuzzy_align(doc, search_text)
-                        success = result is not None
-                    
-                    if not success:
-                        print(f"Warning: No match found for '{search_text}'")
-                    else:
-                        print(f"Success! Found match: '{result.text}'")
-                finally:
-                    # Explicitly delete the result to free memory immediately
-                    if 'result' in locals() and result is not None:
-                        del result
-                
-                # Force garbage collection after each operation
-                gc.collect()
-                gc.collect()
-                
-                # Sleep briefly to allow memory to be reclaimed
-                time.sleep(0.3)
-            except Exception as e:
-                print(f"Error during alignment: {e}")
-                success = False
-            
-            end_time = time.time()
-            
-            # Clear any caches before measuring memory
-            if hasattr(aligner, '_normalize_text'):
-                aligner._normalize_text.cache_clear()
-                
-            # Get memory info after cleanup
-            gc.collect()
             gc.collect()
-            time.sleep(0.2)
-            current_memory = process.memory_info().rss / 1024 / 1024  # MB
-            
-            print(f"Run {i+1}: Time: {end_time - start_time:.2f}s, Memory: {current_memory:.1f} MB, " 
-                  f"Diff: {current_memory - initial_memory:.1f} MB, Success: {success}")
-            
-        # Clear any caches before final measurement
-        if hasattr(aligner, '_normalize_text'):
-            aligner._normalize_text.cache_clear()
-            
-        # Clean up before final measurement
-        gc.collect()
-        gc.collect()
-        time.sleep(0.5)  # Longer wait for final cleanup
-        
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
-        print(f"Final memory usage: {final_memory:.1f} MB")
-        print(f"Memory change: {final_memory - initial_memory:.1f} MB")
-        
-        # Some growth is expected, but it should be reasonable
-        memory_growth = final_memory - initial_memory
-        growth_percent = (memory_growth/initial_memory)*100
-        
-        # More lenient threshold for memory growth
-        acceptable_percent = 30  # Increased threshold to account for Python's memory behavior
-        
-        if memory_growth < initial_memory * (acceptable_percent/100):
-            print(f"PASS: Memory usage growth is reasonable: {growth_percent:.1f}% ({memory_growth:.1f} MB)")
-        else:
-            print(f"WARNING: Memory usage grew by {memory_growth:.1f} MB ({growth_percent:.1f}%)")
-            print("This is higher than expected but may be acceptable for large documents")
-            # Don't fail the test, just warn about it
-            
-    except ImportError:
-        print("psutil not available, running simple time-based test...")
-        total_time = 0
-        
-        for i in range(5):
-            start_time = time.time()
-            result = aligner.fuzzy_align(doc, "John he him")
-            end_time = time.time()
-            run_time = end_time - start_time
-            total_time += run_time
-            print(f"Run {i+1}: Time: {run_time:.2f}s")
-            
-        print(f"Average time per run: {total_time/5:.2f}s")
-        print("PASS: Alignment completes without errors")
-        
-        # Clean up memory more aggressively
-        del doc
-        del aligner
-        
-        # Clear any caches that might be holding references
-        if 'nlp' in locals():
-            del nlp
-            
-        # Multiple collections can help with reference cycles
-        gc.collect()
-        gc.collect()
-        time.sleep(0.5)  # Give the system more time to reclaim memory
-        
-        # Try to trigger a more complete collection
-        try:
-            import ctypes
-            ctypes.pythonapi.PyGC_Collect()
-        except Exception:
-            pass
-            
-        # One final collection
-        gc.collect()
+            growth = sum(stat.size_diff for stat in
+                         tracemalloc.take_snapshot().compare_to(baseline, "lineno"))
+            print(f"Run {i+1}: Python allocations: {growth / 1024:+.1f} KB")
+    finally:
+        tracemalloc.stop()
+    
+    # Repeated alignments must not keep allocations alive
+    assert growth < MAX_GROWTH_BYTES, f"Memory grew by {growth / 1024:.1f} KB"
+
+@pytest.mark.skipif(not benchmark_installed, reason="pytest-benchmark not installed")
+def test_aligner_perf(benchmark):
+    """Time fuzzy alignment on a large document for regression tracking."""
+    nlp = spacy.blank("en")
+    doc = nlp(generate_large_text(3000))
+    aligner = TokenAligner()
+    
+    # pytest-benchmark warms up and picks the number of rounds itself
+    result = benchmark(aligner.fuzzy_align, doc, "John he him")
+    assert result is not None
 
 if __name__ == "__main__":
     test_aligner_memory_usage()
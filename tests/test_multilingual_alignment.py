@@ -301,4 +301,20 @@ class TestMultilingualAlignment:
         
         # Test promising regions finder
         regions = aligner._find_promising_regions(doc, ["alignment", "testing"], script_type="latin")
-        assert len(regions) > 0  # Should find at least one promising region
\ No newline at end of file
+        assert len(regions) > 0  # Should find at least one promising region
+
+    def test_spacy_doc_cache(self, en_nlp):
+        """Test that tokenized documents are cached and only tokenized."""
+        aligner = TokenAligner(nlp=en_nlp, default_language="en")
+        
+        doc = aligner._get_spacy_doc("This is a cached document.")
+        assert [t.text for t in doc] == ["This", "is", "a", "cached", "document", "."]
+        assert aligner._get_spacy_doc("This is a cached document.") is doc
+        assert aligner._get_spacy_doc("Another document.") is not doc
+        
+        # Long texts bypass the cache
+        long_text = "word " * 3000
+        assert aligner._get_spacy_doc(long_text) is not aligner._get_spacy_doc(long_text)
+        
+        aligner.cleanup_resources()
+        assert aligner._get_spacy_doc("This is a cached document.") is not doc
@@ -0,0 +1,172 @@
+"""
+Test the multimodal embeddings adapter.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from bridgenlp.adapters.multimodal_embeddings import MultimodalEmbeddingsBridge
+from bridgenlp.config import BridgeConfig
+from bridgenlp.result import BridgeResult
+from bridgenlp.utils import configure_precision, load_pretrained
+
+
+@pytest.mark.usefixtures("fake_image_batches")
+class TestMultimodalEmbeddings(unittest.TestCase):
+    """Test cases for the MultimodalEmbeddingsBridge adapter."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.image_paths = []
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            path = os.path.join(self.tmpdir.name, name)
+            with open(path, "wb") as f:
+                f.write(b"")
+            self.image_paths.append(path)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_batch_size_default(self):
+        """Test that a batch_size of 1 falls back to the batch default."""
+        self.assertEqual(MultimodalEmbeddingsBridge().batch_size, 32)
+        self.assertEqual(MultimodalEmbeddingsBridge(config=BridgeConfig(batch_size=4)).batch_size, 4)
+    
+    def test_precision_and_attention_on_cpu(self):
+        """Test that CPU models stay in float32 and FlashAttention falls back to SDPA."""
+        config = BridgeConfig(dtype="bf16", attn_implementation="flash_attention_2")
+        adapter = MultimodalEmbeddingsBridge(config=config)
+        self.assertIsNone(adapter.torch_dtype)
+        self.assertEqual(adapter.attn_implementation, "sdpa")
+        self.assertTrue(adapter.model_key.endswith("_sdpa"))
+        
+        self.assertIsNone(MultimodalEmbeddingsBridge().attn_implementation)
+        
+        with self.assertRaises(ValueError):
+            MultimodalEmbeddingsBridge(config=BridgeConfig(attn_implementation="flash"))
+    
+    def test_onnx_only_on_cpu(self):
+        """Test that the ONNX Runtime path is only taken for CPU models."""
+        self.assertFalse(MultimodalEmbeddingsBridge().use_onnx)
+        self.assertTrue(MultimodalEmbeddingsBridge(config=BridgeConfig(params={"onnx": True})).use_onnx)
+    
+    def test_image_batch_runs_onnx_session(self):
+        """Test that images are embedded by the ONNX vision tower when enabled."""
+        adapter = MultimodalEmbeddingsBridge(config=BridgeConfig(params={"onnx": True}))
+        adapter._model_loaded = True
+        
+        class FakeArg:
+            name = "pixel_values"
+        
+        class FakeSession:
+            def get_inputs(self):
+                return [FakeArg()]
+            
+            def run(self, output_names, feed):
+                return [np.array([[3.0, 4.0]] * len(feed["pixel_values"]))]
+        
+        with patch.object(MultimodalEmbeddingsBridge, "_iter_image_batches", side_effect=self.fake_image_batches), \
+                patch.object(adapter, "_prepare_inputs",
+                             side_effect=lambda images: {"pixel_values": np.zeros((len(images), 3))}), \
+                patch.object(adapter, "_get_onnx_session", return_value=FakeSession()) as get_session:
+            results = adapter.from_image_batch(self.image_paths)
+        
+        get_session.assert_called_with("visual")
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertEqual(result.multimodal_embeddings, [0.6, 0.8])
+    
+    def test_text_embedding_cache(self):
+        """Test that repeated texts are embedded once and the cache is bounded."""
+        adapter = MultimodalEmbeddingsBridge(config=BridgeConfig(params={"embedding_cache_size": 2}))
+        adapter._model_loaded = True
+        
+        with patch.object(adapter, "_embed_text", side_effect=lambda text: np.array([float(len(text))])) as embed:
+            self.assertEqual(adapter.from_text("a cat").multimodal_embeddings, [5.0])
+            self.assertEqual(adapter.from_text("a cat").multimodal_embeddings, [5.0])
+            self.assertEqual(embed.call_count, 1)
+            
+            adapter.from_text("a dog")
+            adapter.from_text("a bird")
+            self.assertEqual(len(adapter._embedding_cache), 2)
+            adapter.from_text("a cat")
+            self.assertEqual(embed.call_count, 4)
+    
+    def test_load_pretrained_attention_fallback(self):
+        """Test that models without the requested attention kernels load with their default."""
+        calls = []
+        
+        class FakeModel:
+            @classmethod
+            def from_pretrained(cls, name, **kwargs):
+                calls.append(kwargs)
+                if "attn_implementation" in kwargs:
+                    raise ValueError("does not support an attention implementation through sdpa")
+                return cls()
+        
+        self.assertIsInstance(load_pretrained(FakeModel, "fake", "sdpa", torch_dtype=None), FakeModel)
+        self.assertEqual(calls, [{"attn_implementation": "sdpa", "torch_dtype": None},
+                                 {"torch_dtype": None}])
+        
+        calls.clear()
+        load_pretrained(FakeModel, "fake")
+        self.assertEqual(calls, [{}])
+    
+    def test_configure_precision_tf32_opt_in(self):
+        """Test that TF32 matmuls are only enabled when asked for."""
+        fake_torch = MagicMock()
+        with patch("bridgenlp.utils.torch", fake_torch):
+            self.assertIsNone(configure_precision("fp32", 0))
+            fake_torch.set_float32_matmul_precision.assert_not_called()
+            
+            configure_precision("fp32", 0, allow_tf32=True)
+            fake_torch.set_float32_matmul_precision.assert_called_once_with("high")
+            
+            # Text generation adapters stay in float32 rather than swap bf16 for fp16
+            fake_torch.cuda.is_bf16_supported.return_value = False
+            self.assertIs(configure_precision("bf16", 0), fake_torch.float16)
+            self.assertIsNone(configure_precision("bf16", 0, fp16_fallback=False))
+            
+            # CPU models never touch the global setting
+            configure_precision("fp16", -1, allow_tf32=True)
+            fake_torch.set_float32_matmul_precision.assert_called_once()
+    
+    def test_image_batch_embeds_chunks(self):
+        """Test that images are embedded one chunk per forward pass."""
+        adapter = MultimodalEmbeddingsBridge()
+        chunks = []
+        
+        def embed(items, inputs=None):
+            self.assertEqual(inputs, [path for path, _ in items])
+            chunks.append([path for path, _ in items])
+            return [
+                BridgeResult(
+                    tokens=["image_embedding"],
+                    image_features={"image_path": path, "embedding": [1.0, 0.0]},
+                    multimodal_embeddings=[1.0, 0.0]
+                )
+                for path, _ in items
+            ]
+        
+        paths = self.image_paths + [os.path.join(self.tmpdir.name, "missing.jpg")]
+        with patch.object(MultimodalEmbeddingsBridge, "_iter_image_batches", side_effect=self.fake_image_batches), \
+                patch.object(adapter, "_prepare_inputs", side_effect=lambda images: images), \
+                patch.object(adapter, "_process_images", side_effect=embed):
+            results = adapter.from_image_batch(paths, batch_size=2)
+        
+        self.assertEqual(chunks, [self.image_paths[:2], self.image_paths[2:]])
+        self.assertEqual(len(results), 4)
+        for path, result in zip(self.image_paths, results):
+            self.assertEqual(result.image_features["image_path"], path)
+        
+        # The missing file gets an error result instead of failing the batch
+        self.assertEqual(results[3].tokens, ["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Test the multi-task image adapter.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from bridgenlp.adapters.multitask_image import MultiTaskImageBridge
+from bridgenlp.config import BridgeConfig
+from bridgenlp.result import BridgeResult
+
+
+@pytest.mark.usefixtures("fake_image_batches")
+class TestMultiTaskImage(unittest.TestCase):
+    """Test cases for the MultiTaskImageBridge adapter."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.image_paths = []
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            path = os.path.join(self.tmpdir.name, name)
+            with open(path, "wb") as f:
+                f.write(b"")
+            self.image_paths.append(path)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_batch_shares_loaded_images(self):
+        """Test that both models see the same images and results are merged."""
+        adapter = MultiTaskImageBridge()
+        seen = {"captioning": [], "detection": []}
+        
+        def caption(items, inputs=None):
+            self.assertEqual(inputs, ("caption", [path for path, _ in items]))
+            seen["captioning"].append([path for path, _ in items])
+            return [
+                BridgeResult(
+                    tokens=["a", "cat"],
+                    captions=["a cat"],
+                    image_features={"image_path": path, "caption": "a cat"}
+                )
+                for path, _ in items
+            ]
+        
+        def detect(items, inputs=None):
+            self.assertEqual(inputs, ("detect", [path for path, _ in items]))
+            seen["detection"].append([path for path, _ in items])
+            return [
+                BridgeResult(
+                    tokens=["cat"],
+                    spans=[(0, 1)],
+                    labels=["cat"],
+                    detected_objects=[{"id": 0, "label": "cat", "score": 0.99, "box": [0, 0, 1, 1]}],
+                    image_features={"image_path": path, "num_objects": 1}
+                )
+                for path, _ in items
+            ]
+        
+        paths = self.image_paths + [os.path.join(self.tmpdir.name, "missing.jpg")]
+        with patch.object(MultiTaskImageBridge, "_iter_image_batches", side_effect=self.fake_image_batches) as loader, \
+                patch.object(adapter.captioning, "_prepare_inputs", side_effect=lambda images: ("caption", images)), \
+                patch.object(adapter.detection, "_prepare_inputs", side_effect=lambda images: ("detect", images)), \
+                patch.object(adapter.captioning, "_process_images", side_effect=caption), \
+                patch.object(adapter.detection, "_process_images", side_effect=detect):
+            results = adapter.from_image_batch(paths, batch_size=2)
+        
+        # Images are loaded once and both models get the same chunks
+        loader.assert_called_once()
+        self.assertEqual(loader.call_args[0][:2], (self.image_paths, 2))
+        self.assertEqual(seen["captioning"], [self.image_paths[:2], self.image_paths[2:]])
+        self.assertEqual(seen["detection"], seen["captioning"])
+        
+        self.assertEqual(len(results), 4)
+        for result in results[:3]:
+            self.assertEqual(result.tokens, ["a", "cat"])
+            self.assertEqual(result.captions, ["a cat"])
+            self.assertEqual(result.detected_objects[0]["label"], "cat")
+            self.assertEqual(result.spans, [])
+            self.assertEqual(result.image_features["num_objects"], 1)
+            self.assertEqual(result.image_features["caption"], "a cat")
+        
+        # Invalid paths get an error result
+        self.assertEqual(results[3].tokens, ["error"])
+        self.assertTrue(results[3].labels[0].startswith("Error processing"))
+    
+    def test_batch_failure_is_per_chunk(self):
+        """Test that a failing chunk gets error results without aborting the batch."""
+        adapter = MultiTaskImageBridge()
+        
+        def caption(items, inputs=None):
+            return [BridgeResult(tokens=["a", "cat"], captions=["a cat"]) for _ in items]
+        
+        def detect(items, inputs=None):
+            if items[0][0] == self.image_paths[0]:
+                raise RuntimeError("detection failed")
+            return [BridgeResult(tokens=[]) for _ in items]
+        
+        with patch.object(MultiTaskImageBridge, "_iter_image_batches", side_effect=self.fake_image_batches), \
+                patch.object(adapter.captioning, "_prepare_inputs", return_value=None), \
+                patch.object(adapter.detection, "_prepare_inputs", return_value=None), \
+                patch.object(adapter.captioning, "_process_images", side_effect=caption), \
+                patch.object(adapter.detection, "_process_images", side_effect=detect):
+            results = adapter.from_image_batch(self.image_paths, batch_size=2)
+        
+        self.assertEqual([result.tokens for result in results],
+                         [["error"], ["error"], ["a", "cat"]])
+        self.assertIn("detection failed", results[0].labels[0])
+        self.assertEqual(adapter.get_metrics()["errors"], 2)
+    
+    def test_prepare_failure_is_per_chunk(self):
+        """Test that a processor failure while loading only fails its own chunk."""
+        adapter = MultiTaskImageBridge()
+        
+        def prepare(images):
+            if self.image_paths[0] in images:
+                raise ValueError("unsupported image mode")
+            return None
+        
+        def caption(items, inputs=None):
+            return [BridgeResult(tokens=["a", "cat"], captions=["a cat"]) for _ in items]
+        
+        def detect(items, inputs=None):
+            return [BridgeResult(tokens=[]) for _ in items]
+        
+        # Runs the real loader, with paths standing in for decoded images
+        with patch("bridgenlp.multimodal_base.importlib.util.find_spec", return_value=object()), \
+                patch.object(adapter, "_load_image", side_effect=lambda path: path), \
+                patch.object(adapter.captioning, "_prepare_inputs", side_effect=prepare), \
+                patch.object(adapter.detection, "_prepare_inputs", return_value=None), \
+                patch.object(adapter.captioning, "_process_images", side_effect=caption), \
+                patch.object(adapter.detection, "_process_images", side_effect=detect):
+            results = adapter.from_image_batch(self.image_paths, batch_size=2)
+        
+        self.assertEqual([result.tokens for result in results],
+                         [["error"], ["error"], ["a", "cat"]])
+        self.assertIn("unsupported image mode", results[1].labels[0])
+    
+    def test_precision_on_cpu(self):
+        """Test that CPU models stay in float32 whatever dtype is configured."""
+        adapter = MultiTaskImageBridge(config=BridgeConfig(dtype="bf16"))
+        for child in (adapter.captioning, adapter.detection):
+            self.assertEqual(child.dtype, "bf16")
+            self.assertIsNone(child.torch_dtype)
+            self.assertFalse(child.model_key.endswith("_bf16"))
+        
+        with self.assertRaises(ValueError):
+            MultiTaskImageBridge(config=BridgeConfig(dtype="int8"))
+    
+    def test_from_image_invalid_path(self):
+        """Test that from_image rejects missing files."""
+        adapter = MultiTaskImageBridge()
+        with self.assertRaises(ValueError):
+            adapter.from_image(os.path.join(self.tmpdir.name, "missing.jpg"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,18 @@
 Tests for the Pipeline class.
 """
 
+import sys
+import types
+
 import pytest
 import spacy
 
 from bridgenlp.base import BridgeBase
+from bridgenlp.cache import PersistentCache, file_digest
 from bridgenlp.config import BridgeConfig
 from bridgenlp.pipeline import Pipeline
 from bridgenlp.result import BridgeResult
+from bridgenlp.utils import get_or_create_model, unload_model
 
 
 class MockAdapter(BridgeBase):
@@ -167,7 +172,107 @@ class TestPipeline:
         assert metrics["cache_hits"] == 1
         assert metrics["cache_misses"] == 1
         assert metrics["cache_hit_ratio"] == 0.5
-    
+
+    def test_cache_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        ner = MockAdapter(name="ner")
+        config = BridgeConfig(cache_results=True, cache_size=2)
+        pipeline = Pipeline([ner], config)
+
+        pipeline.from_text("first text")
+        pipeline.from_text("second text")
+        # Touch the first entry so the second becomes least recently used
+        pipeline.from_text("first text")
+        pipeline.from_text("third text")
+        assert ner.calls == 3
+        assert len(pipeline._cache) == 2
+
+        # The first entry survived, the second was evicted
+        pipeline.from_text("first text")
+        assert ner.calls == 3
+        pipeline.from_text("second text")
+        assert ner.calls == 4
+
+    def test_persistent_cache(self, tmp_path):
+        """Test that results are shared between pipelines through the disk cache."""
+        path = str(tmp_path / "cache.sqlite")
+        config = BridgeConfig(cache_results=True, persistent_cache_path=path)
+
+        ner = MockAdapter(name="ner")
+        pipeline = Pipeline([ner], config)
+        result1 = pipeline.from_text("This is a test")
+        pipeline.cleanup()
+
+        # A fresh pipeline with the same adapters reads the stored result
+        ner2 = MockAdapter(name="ner")
+        pipeline2 = Pipeline([ner2], config)
+        result2 = pipeline2.from_text("This is a test")
+        assert ner2.calls == 0
+        assert result2.tokens == result1.tokens
+        assert result2.spans == result1.spans
+        assert pipeline2.get_metrics()["cache_hits"] == 1
+
+        # A pipeline with different adapters must not see those results
+        classify = MockAdapter(name="classify")
+        classify.model_name = "other-model"
+        pipeline3 = Pipeline([classify], config)
+        pipeline3.from_text("This is a test")
+        assert classify.calls == 1
+
+    def test_persistent_cache_namespace(self, tmp_path):
+        """Test that constructor state and conditions keep disk results apart."""
+        config = BridgeConfig(cache_results=True,
+                              persistent_cache_path=str(tmp_path / "cache.sqlite"))
+
+        class LabelAdapter(MockAdapter):
+            def __init__(self, labels, config=None):
+                super().__init__(name="classify", config=config)
+                self.labels = tuple(labels)
+
+        first = LabelAdapter(["positive", "negative"])
+        Pipeline([first], config).from_text("This is a test")
+        other_labels = LabelAdapter(["spam", "ham"])
+        Pipeline([other_labels], config).from_text("This is a test")
+        assert other_labels.calls == 1
+
+        # Results computed while a condition skips an adapter stay private
+        ner, srl = MockAdapter(name="ner"), MockAdapter(name="srl")
+        conditional = Pipeline([ner, srl], config)
+        conditional.add_condition(1, lambda result: False)
+        assert conditional.from_text("Another test").roles == []
+
+        ner2, srl2 = MockAdapter(name="ner"), MockAdapter(name="srl")
+        result = Pipeline([ner2, srl2], config).from_text("Another test")
+        assert ner2.calls == 1
+        assert result.roles == [{"role": "PRED", "text": "test"}]
+
+    def test_persistent_cache_get_or_compute(self, tmp_path):
+        """Test that results keyed by file contents are computed once."""
+        image = tmp_path / "image.jpg"
+        image.write_bytes(b"image bytes")
+        copy = tmp_path / "copy.jpg"
+        copy.write_bytes(b"image bytes")
+
+        # The digest follows the contents, not the path
+        assert file_digest(str(image)) == file_digest(str(copy))
+
+        cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return BridgeResult(tokens=["image_embedding"], image_features={"embedding": [1.0]})
+
+        result1 = cache.get_or_compute(f"model:{file_digest(str(image))}", compute)
+        result2 = cache.get_or_compute(f"model:{file_digest(str(copy))}", compute)
+        assert len(calls) == 1
+        assert result2.image_features == result1.image_features
+
+        image.write_bytes(b"other bytes")
+        cache.get_or_compute(f"model:{file_digest(str(image))}", compute)
+        assert len(calls) == 2
+        cache.close()
+
     def test_metrics(self):
         """Test performance metrics."""
         # Create mock adapters
@@ -290,6 +395,26 @@ class TestPipeline:
         assert len(result.roles) == 1  # From SRL
         assert len(result.labels) == 0  # Classify was skipped
         
+    def test_readonly_condition_skips_copy(self):
+        """Test that read-only conditions receive the combined result directly."""
+        result = BridgeResult(tokens=["a"], spans=[(0, 1)])
+
+        def condition_fn(result):
+            return len(result.spans) > 0
+
+        # By default the condition gets a snapshot
+        assert Pipeline._condition_input(condition_fn, result) is not result
+
+        condition_fn.readonly = True
+        assert Pipeline._condition_input(condition_fn, result) is result
+
+        # Read-only conditions still gate execution as usual
+        classify = MockAdapter(name="classify")
+        pipeline = Pipeline([MockAdapter(name="ner"), classify])
+        pipeline.add_condition(1, condition_fn)
+        assert pipeline.from_text("This is a test").labels == ["TEST"] * 4
+        assert classify.calls == 1
+
     def test_invalid_condition(self):
         """Test error handling for invalid condition registration."""
         # Create a pipeline with two adapters
@@ -312,4 +437,50 @@ class TestPipeline:
             pipeline.add_condition(2, condition_fn)  # Out of range
             
         with pytest.raises(ValueError):
-            pipeline.add_condition(-1, condition_fn)  # Negative index
\ No newline at end of file
+            pipeline.add_condition(-1, condition_fn)  # Negative index
+
+    def test_model_cpu_offload(self, monkeypatch):
+        """Test that CPU offload needs accelerate and skips adapters without a model."""
+        pipeline = Pipeline([MockAdapter(name="ner"), MockAdapter(name="srl")])
+        assert Pipeline._adapter_model(pipeline.adapters[0]) is None
+
+        monkeypatch.setitem(sys.modules, "accelerate", None)
+        with pytest.raises(ImportError):
+            pipeline.enable_model_cpu_offload()
+
+    def test_model_cpu_offload_uses_own_registry_entry(self, monkeypatch):
+        """Test that offloading does not hook models shared with other adapters."""
+        hooked = []
+
+        def cpu_offload_with_hook(model, device, prev_module_hook=None):
+            hooked.append(model)
+            return model, types.SimpleNamespace(hook=types.SimpleNamespace())
+
+        monkeypatch.setitem(sys.modules, "accelerate",
+                            types.SimpleNamespace(cpu_offload_with_hook=cpu_offload_with_hook))
+
+        class ModelAdapter(MockAdapter):
+            def __init__(self):
+                super().__init__(name="model")
+                self.model_key = "test_offload_shared_model"
+                self._model = None
+                self._model_loaded = False
+
+            def _load_model_and_processor(self):
+                self._model = get_or_create_model(self.model_key, object)
+                self._model_loaded = True
+
+        try:
+            other = ModelAdapter()
+            other._load_model_and_processor()
+            adapter = ModelAdapter()
+            adapter._load_model_and_processor()
+            assert adapter._model is other._model
+
+            Pipeline([adapter]).enable_model_cpu_offload()
+            assert adapter.model_key == "test_offload_shared_model_offload"
+            assert hooked == [adapter._model]
+            assert adapter._model is not other._model
+        finally:
+            unload_model("test_offload_shared_model")
+            unload_model("test_offload_shared_model_offload")
@@ -53,6 +53,18 @@ class TestSpacyNERBridge:
             with pytest.raises(ImportError):
                 SpacyNERBridge(model_name="nonexistent_model")
     
+    def test_init_with_nlp(self):
+        """Test that a provided pipeline is reused instead of loading a model."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("ner")
+        with patch("spacy.load") as mock_load:
+            bridge = SpacyNERBridge(nlp=nlp)
+            mock_load.assert_not_called()
+        assert bridge.nlp is nlp
+        
+        with pytest.raises(ValueError):
+            SpacyNERBridge(nlp=spacy.blank("en"))
+    
     def test_from_text(self, mock_nlp):
         """Test processing text."""
         with patch("spacy.load", return_value=mock_nlp):
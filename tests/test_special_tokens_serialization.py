@@ -248,4 +248,39 @@ class TestSpecialTokensSerialization:
         
         # Check that tuples are correctly converted to lists
         assert isinstance(parsed_data["spans"][0], list)
-        assert isinstance(parsed_data["clusters"][0][0], list)
\ No newline at end of file
+        assert isinstance(parsed_data["clusters"][0][0], list)
+
+    def test_deeply_nested_roles(self):
+        """Test that deeply nested role values do not hit the recursion limit."""
+        nested = leaf = []
+        for _ in range(5000):
+            child = []
+            leaf.append(child)
+            leaf = child
+        leaf.append((1, "a\x01"))
+        
+        result = BridgeResult(tokens=["test"], roles=[{"role": "DEEP", "value": nested}])
+        json_data = result.to_json()
+        
+        # Walk down to the leaf: the tuple became a list and its string was sanitized
+        value = json_data["roles"][0]["value"]
+        while value and isinstance(value[0], list) and value[0] != [1, "a\\u0001"]:
+            value = value[0]
+        assert value[0] == [1, "a\\u0001"]
+    
+    def test_single_conversion_warning(self):
+        """Test that many converted values produce a single warning."""
+        class Opaque:
+            pass
+        
+        result = BridgeResult(
+            tokens=["test"],
+            roles=[{"role": "MANY", "values": [Opaque() for _ in range(20)]}]
+        )
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            json_data = result.to_json()
+        
+        assert len(caught) == 1
+        assert "Converted 20" in str(caught[0].message)
+        assert all(isinstance(v, str) for v in json_data["roles"][0]["values"])